@@ -0,0 +1,106 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Micro-benchmark of the JSON codec used by the Contrail clients
+
+Compares the per-call cost of the codec in ``base`` against the
+jsonutils path the clients used before, on list payloads shaped like
+a ``GET /virtual-networks?detail=true`` response::
+
+    python -m tungsten_tempest_plugin.benchmarks.codec --items 10000
+"""
+
+import argparse
+import timeit
+
+from oslo_serialization import jsonutils
+
+from tungsten_tempest_plugin.services.contrail.json import base
+
+
+def make_list_payload(items, resource='virtual-network'):
+    """Return a collection body with ``items`` detailed objects."""
+    objects = []
+    for index in range(items):
+        uuid = '%08x-0000-4000-8000-%012x' % (index, index)
+        objects.append({
+            resource: {
+                'uuid': uuid,
+                'href': 'http://127.0.0.1:8082/%s/%s' % (resource, uuid),
+                'fq_name': ['default-domain', 'admin', 'net-%d' % index],
+                'parent_type': 'project',
+                'id_perms': {'enable': True,
+                             'created': '2018-01-01T00:00:00.000000',
+                             'last_modified': '2018-01-01T00:00:00.000000',
+                             'permissions': {'owner': 'admin',
+                                             'owner_access': 7,
+                                             'other_access': 7}},
+                'network_ipam_refs': [{
+                    'to': ['default-domain', 'admin', 'ipam'],
+                    'attr': {'ipam_subnets': [{
+                        'subnet': {'ip_prefix': '10.0.0.0',
+                                   'ip_prefix_len': 24}}]}}],
+            }
+        })
+    return {resource + 's': objects}
+
+
+def _time(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def run(items=1000, number=20, repeat=5):
+    """Time encode and decode of an ``items`` long list payload.
+
+    :return: dict mapping case name to seconds per call
+    """
+    payload = make_list_payload(items)
+    text = jsonutils.dumps(payload)
+    raw = text.encode('utf-8')
+    return {
+        'jsonutils.loads': _time(lambda: jsonutils.loads(raw),
+                                 number, repeat),
+        'base.json_loads': _time(lambda: base.json_loads(raw),
+                                 number, repeat),
+        'jsonutils.dumps': _time(lambda: jsonutils.dumps(payload),
+                                 number, repeat),
+        'base.json_dumps': _time(lambda: base.json_dumps(payload),
+                                 number, repeat),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--items', type=int, default=1000,
+                        help='number of objects in the list payload')
+    parser.add_argument('--number', type=int, default=20,
+                        help='calls per timing run')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='timing runs, the fastest one is reported')
+    args = parser.parse_args(argv)
+
+    results = run(args.items, args.number, args.repeat)
+    print('backend: %s, %d items' % (base.JSON_BACKEND, args.items))
+    for op in ('loads', 'dumps'):
+        old = results['jsonutils.' + op]
+        new = results['base.json_' + op]
+        print('%-6s jsonutils %9.3f ms  base %9.3f ms  saved %9.3f ms '
+              '(%.1fx)' % (op, old * 1000, new * 1000, (old - new) * 1000,
+                           old / new if new else 0))
+
+
+if __name__ == '__main__':
+    main()
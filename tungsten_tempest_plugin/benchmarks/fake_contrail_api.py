@@ -0,0 +1,528 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+In-process stand-in for the Contrail config API
+
+Serves enough of the config API for the service clients to run without a
+controller: CRUD of any resource type, parent/child and reference
+tracking with the matching 404/409 answers, list filters, pagination and
+counts, fqname-to-id and id-to-fqname. Latency and errors can be injected
+to see how the clients and the harness behave under load::
+
+    with fake_contrail_api.FakeContrailAPI(latency=0.002) as api:
+        client = ContrailClient(api.auth_provider(), 'sdn', 'region',
+                                'publicURL')
+        client.create_virtual_network(
+            parent_type='project',
+            fq_name=['default-domain', 'admin', 'net'])
+
+It also runs standalone, e.g. for a tempest run whose catalog points the
+SDN endpoint at it::
+
+    python -m tungsten_tempest_plugin.benchmarks.fake_contrail_api \\
+        --port 8082 --latency 0.005
+"""
+
+import argparse
+import copy
+import datetime
+import itertools
+import json
+import random
+import re
+import socket
+import threading
+import time
+import uuid as uuid_lib
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib import parse as urlparse
+
+from tungsten_tempest_plugin.services.contrail.json import token_auth
+
+_REF_RE = re.compile(r'^(?P<type>[a-z_]+)_refs$')
+
+# Parents created on demand, like projects synced from keystone.
+IMPLICIT_PARENTS = ('domain', 'project')
+
+DEFAULT_OBJECTS = (
+    ('config-root', None, ['default-config-root']),
+    ('domain', None, ['default-domain']),
+    ('global-system-config', None, ['default-global-system-config']),
+)
+
+
+def _timestamp():
+    return datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%f')
+
+
+class ApiError(Exception):
+
+    def __init__(self, status, message):
+        super(ApiError, self).__init__(message)
+        self.status = status
+
+
+class ContrailStore(object):
+    """Object graph of the fake API server. All methods are thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._objects = {}
+        self._fq_index = {}
+        self._counter = itertools.count()
+        for obj_type, parent_type, fq_name in DEFAULT_OBJECTS:
+            self.create(obj_type, {'fq_name': fq_name,
+                                   'parent_type': parent_type})
+
+    def __len__(self):
+        return len(self._objects)
+
+    def _get(self, uuid, obj_type=None):
+        obj = self._objects.get(uuid)
+        if obj is None or (obj_type and obj['_type'] != obj_type):
+            raise ApiError(404, '%s %s not found' % (obj_type or 'object',
+                                                     uuid))
+        return obj
+
+    def lookup(self, obj_type, fq_name):
+        return self._fq_index.get((obj_type, tuple(fq_name)))
+
+    def _resolve_ref(self, ref_type, ref):
+        if ref.get('uuid'):
+            return self._get(ref['uuid'], ref_type)['uuid']
+        uuid = self.lookup(ref_type, ref.get('to') or [])
+        if uuid is None:
+            raise ApiError(404, '%s %s not found' % (ref_type,
+                                                     ref.get('to')))
+        return uuid
+
+    def _set_refs(self, obj, body):
+        for key, refs in body.items():
+            match = _REF_RE.match(key)
+            if not match or not isinstance(refs, list):
+                continue
+            ref_type = match.group('type').replace('_', '-')
+            resolved = []
+            for ref in refs:
+                ref_uuid = self._resolve_ref(ref_type, ref)
+                resolved.append({'uuid': ref_uuid,
+                                 'to': list(self._objects[ref_uuid]
+                                            ['fq_name']),
+                                 'attr': ref.get('attr')})
+            for old in obj.get(key, []):
+                target = self._objects.get(old['uuid'])
+                if target is not None:
+                    target['_back_refs'].discard(obj['uuid'])
+            obj[key] = resolved
+            for ref in resolved:
+                self._objects[ref['uuid']]['_back_refs'].add(obj['uuid'])
+
+    def create(self, obj_type, body):
+        with self._lock:
+            fq_name = list(body.get('fq_name') or [])
+            parent_type = body.get('parent_type')
+            if not fq_name:
+                raise ApiError(400, 'fq_name is required')
+            if self.lookup(obj_type, fq_name):
+                raise ApiError(409, '%s %s already exists' % (obj_type,
+                                                              fq_name))
+            parent_uuid = None
+            if len(fq_name) > 1:
+                if not parent_type:
+                    raise ApiError(400, 'parent_type is required')
+                parent_uuid = self.lookup(parent_type, fq_name[:-1])
+                if parent_uuid is None:
+                    if parent_type not in IMPLICIT_PARENTS:
+                        raise ApiError(404, 'parent %s %s not found' % (
+                            parent_type, fq_name[:-1]))
+                    grandparent = 'domain' if parent_type == 'project' \
+                        else None
+                    parent_uuid = self.create(parent_type, {
+                        'fq_name': fq_name[:-1],
+                        'parent_type': grandparent})['uuid']
+            uuid = body.get('uuid') or str(uuid_lib.uuid4())
+            obj = dict((k, copy.deepcopy(v)) for k, v in body.items()
+                       if not _REF_RE.match(k))
+            now = _timestamp()
+            obj.update({
+                'uuid': uuid,
+                'fq_name': fq_name,
+                'name': fq_name[-1],
+                'display_name': body.get('display_name', fq_name[-1]),
+                'id_perms': {'created': now, 'last_modified': now,
+                             'enable': True},
+                '_type': obj_type,
+                '_order': next(self._counter),
+                '_children': set(),
+                '_back_refs': set(),
+            })
+            if parent_uuid:
+                obj['parent_uuid'] = parent_uuid
+                obj['parent_type'] = parent_type
+                self._objects[parent_uuid]['_children'].add(uuid)
+            self._objects[uuid] = obj
+            self._fq_index[(obj_type, tuple(fq_name))] = uuid
+            try:
+                self._set_refs(obj, body)
+            except ApiError:
+                self._remove(obj)
+                raise
+            return obj
+
+    def update(self, obj_type, uuid, body):
+        with self._lock:
+            obj = self._get(uuid, obj_type)
+            for key in ('uuid', 'fq_name', 'parent_type', 'parent_uuid'):
+                body.pop(key, None)
+            self._set_refs(obj, body)
+            obj.update((k, copy.deepcopy(v)) for k, v in body.items()
+                       if not _REF_RE.match(k))
+            obj['id_perms']['last_modified'] = _timestamp()
+            return obj
+
+    def _remove(self, obj):
+        for key in [k for k in obj if _REF_RE.match(k)]:
+            for ref in obj[key]:
+                target = self._objects.get(ref['uuid'])
+                if target is not None:
+                    target['_back_refs'].discard(obj['uuid'])
+        parent = self._objects.get(obj.get('parent_uuid'))
+        if parent is not None:
+            parent['_children'].discard(obj['uuid'])
+        self._fq_index.pop((obj['_type'], tuple(obj['fq_name'])), None)
+        self._objects.pop(obj['uuid'], None)
+
+    def delete(self, obj_type, uuid):
+        with self._lock:
+            obj = self._get(uuid, obj_type)
+            if obj['_children']:
+                raise ApiError(409, 'Children %s still exist' % sorted(
+                    obj['_children']))
+            if obj['_back_refs']:
+                raise ApiError(409, 'Back-References from %s still exist'
+                               % sorted(obj['_back_refs']))
+            self._remove(obj)
+
+    def render(self, obj, href, fields=None, exclude_children=False,
+               exclude_back_refs=False):
+        with self._lock:
+            body = dict((k, copy.deepcopy(v)) for k, v in obj.items()
+                        if not k.startswith('_'))
+            body['href'] = '%s/%s/%s' % (href, obj['_type'], obj['uuid'])
+            if not exclude_children:
+                for child_uuid in obj['_children']:
+                    child = self._objects[child_uuid]
+                    body.setdefault(child['_type'].replace('-', '_') + 's',
+                                    []).append(self._link(child, href))
+            if not exclude_back_refs:
+                for ref_uuid in obj['_back_refs']:
+                    ref = self._objects[ref_uuid]
+                    body.setdefault(ref['_type'].replace('-', '_') +
+                                    '_back_refs', []).append(
+                        self._link(ref, href))
+        if fields:
+            keep = set(fields) | set(('uuid', 'fq_name', 'href', 'name',
+                                      'parent_type', 'parent_uuid'))
+            body = dict((k, v) for k, v in body.items() if k in keep)
+        return body
+
+    @staticmethod
+    def _link(obj, href):
+        return {'uuid': obj['uuid'], 'to': list(obj['fq_name']),
+                'href': '%s/%s/%s' % (href, obj['_type'], obj['uuid'])}
+
+    def get(self, obj_type, uuid):
+        with self._lock:
+            return self._get(uuid, obj_type)
+
+    def list(self, obj_type, parent_ids=None, obj_uuids=None,
+             back_ref_ids=None):
+        with self._lock:
+            objects = sorted((o for o in self._objects.values()
+                              if o['_type'] == obj_type),
+                             key=lambda o: o['_order'])
+        if parent_ids:
+            objects = [o for o in objects if o.get('parent_uuid')
+                       in parent_ids]
+        if obj_uuids:
+            objects = [o for o in objects if o['uuid'] in obj_uuids]
+        if back_ref_ids:
+            objects = [o for o in objects
+                       if o['_back_refs'] & set(back_ref_ids)]
+        return objects
+
+    def uuid_by_fqname(self, obj_type, fq_name):
+        uuid = self.lookup(obj_type, fq_name or [])
+        if uuid is None:
+            raise ApiError(404, 'Name %s not found' % fq_name)
+        return uuid
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        # Answers are written in one piece; without TCP_NODELAY small
+        # responses can still wait on the client's delayed ACK (~40ms).
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+        head = ['HTTP/1.1 %d %s' % (status, self.responses.get(
+                    status, ('',))[0]),
+                'Content-Type: application/json',
+                'Content-Length: %d' % len(data), '', '']
+        self.wfile.write('\r\n'.join(head).encode('latin-1') + data)
+        self.wfile.flush()
+
+    def _read_body(self):
+        length = int(self.headers.get('content-length') or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode('utf-8'))
+
+    def _dispatch(self, method):
+        api = self.server.api
+        try:
+            # Read the body first: left unread, it would be taken for the
+            # next request on the connection.
+            body = self._read_body()
+            api.before_request(method, self.path)
+            self._reply(200, api.handle(method, self.path, body))
+        except ApiError as exc:
+            self._reply(exc.status, {'message': str(exc)})
+        except ValueError as exc:
+            self._reply(400, {'message': str(exc)})
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeContrailAPI(object):
+    """Threaded fake config API server.
+
+    :param host: address to listen on
+    :param port: port to listen on, 0 picks a free one
+    :param latency: seconds added to every request
+    :param jitter: maximum random seconds added on top of ``latency``
+    :param error_rate: fraction of requests answered with ``error_status``
+    :param error_status: HTTP status of randomly injected errors
+    :param seed: seed of the error injection, for reproducible runs
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, error_status=503, seed=None):
+        self.store = ContrailStore()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._faults = []
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), _Handler)
+        self._server.api = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return 'http://%s:%d' % (host, port)
+
+    def auth_provider(self, tenant_name='admin'):
+        return token_auth.StaticTokenAuthProvider(self.url, tenant_name,
+                                                  token='fake-token')
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def inject_error(self, method, path_pattern, status, count=1):
+        """Answer the next ``count`` matching requests with ``status``.
+
+        :param method: HTTP method, or None for any
+        :param path_pattern: regular expression searched in the path
+        :param status: HTTP status to return
+        :param count: number of requests to fail, None for all of them
+        """
+        with self._lock:
+            self._faults.append([method, re.compile(path_pattern), status,
+                                 count])
+
+    def before_request(self, method, path):
+        with self._lock:
+            self.requests += 1
+            status = None
+            for fault in self._faults:
+                if (fault[0] in (None, method) and fault[1].search(path) and
+                        fault[3] != 0):
+                    status = fault[2]
+                    if fault[3] is not None:
+                        fault[3] -= 1
+                    break
+            if status is None and self.error_rate and \
+                    self._random.random() < self.error_rate:
+                status = self.error_status
+            delay = self.latency + (self._random.uniform(0, self.jitter)
+                                    if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        if status is not None:
+            raise ApiError(status, 'Injected error')
+
+    def handle(self, method, path, body):
+        parsed = urlparse.urlparse(path)
+        query = dict(urlparse.parse_qsl(parsed.query))
+        parts = [p for p in parsed.path.split('/') if p]
+        if parts == ['fqname-to-id'] and method == 'POST':
+            return {'uuid': self.store.uuid_by_fqname(body.get('type'),
+                                                      body.get('fq_name'))}
+        if parts == ['id-to-fqname'] and method == 'POST':
+            obj = self.store.get(None, body.get('uuid'))
+            return {'type': obj['_type'], 'fq_name': obj['fq_name']}
+        if len(parts) == 1 and parts[0].endswith('s'):
+            obj_type = parts[0][:-1]
+            if method == 'GET':
+                return self._list(obj_type, parts[0], query)
+            if method == 'POST':
+                key = obj_type if obj_type in body else obj_type.replace(
+                    '-', '_')
+                obj = self.store.create(obj_type, body.get(key) or {})
+                return {obj_type: self.store.render(obj, self.url)}
+        if len(parts) == 2:
+            obj_type, uuid = parts
+            if method == 'GET':
+                obj = self.store.get(obj_type, uuid)
+                fields = [f for f in query.get('fields', '').split(',') if f]
+                return {obj_type: self.store.render(
+                    obj, self.url, fields=fields,
+                    exclude_children=_true(query.get('exclude_children')),
+                    exclude_back_refs=_true(
+                        query.get('exclude_back_refs')))}
+            if method == 'PUT':
+                key = obj_type if obj_type in body else obj_type.replace(
+                    '-', '_')
+                obj = self.store.update(obj_type, uuid,
+                                        body.get(key) or {})
+                return {obj_type: {'uuid': obj['uuid'],
+                                   'href': '%s/%s/%s' % (self.url, obj_type,
+                                                         uuid)}}
+            if method == 'DELETE':
+                self.store.delete(obj_type, uuid)
+                return None
+        raise ApiError(404, 'No route for %s %s' % (method, parsed.path))
+
+    def _list(self, obj_type, plural, query):
+        objects = self.store.list(
+            obj_type,
+            parent_ids=_split(query.get('parent_id')),
+            obj_uuids=_split(query.get('obj_uuids')),
+            back_ref_ids=_split(query.get('back_ref_id')))
+        if _true(query.get('count')):
+            return {plural: {'count': len(objects)}}
+        body = {}
+        if 'page_limit' in query:
+            marker = query.get('page_marker')
+            if marker:
+                uuids = [o['uuid'] for o in objects]
+                start = uuids.index(marker) + 1 if marker in uuids else 0
+                objects = objects[start:]
+            limit = int(query['page_limit'])
+            if len(objects) > limit:
+                body['marker'] = objects[limit - 1]['uuid']
+            objects = objects[:limit]
+        fields = [f for f in query.get('fields', '').split(',') if f]
+        if _true(query.get('detail')):
+            body[plural] = [{obj_type: self.store.render(
+                o, self.url, fields=fields,
+                exclude_children=_true(query.get('exclude_children')),
+                exclude_back_refs=_true(query.get('exclude_back_refs')))}
+                for o in objects]
+        else:
+            body[plural] = [self.store._link(o, self.url) for o in objects]
+        return body
+
+
+def _true(value):
+    return str(value).lower() == 'true'
+
+
+def _split(value):
+    return [v for v in value.split(',') if v] if value else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Fake Contrail config API server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8082)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds added to every request')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='maximum random seconds added to --latency')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='fraction of requests failed on purpose')
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+
+    api = FakeContrailAPI(args.host, args.port, latency=args.latency,
+                          jitter=args.jitter, error_rate=args.error_rate,
+                          error_status=args.error_status, seed=args.seed)
+    print('Fake Contrail API listening on %s' % api.url)
+    try:
+        api._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api._server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Import time report of a module
+
+Imports the module in a fresh interpreter started with ``-X importtime``
+(Python 3.7 or later) and lists the modules that cost the most::
+
+    python -m tungsten_tempest_plugin.benchmarks.import_time \\
+        --module tungsten_tempest_plugin.tests.api.contrail.rbac_base
+
+Every run starts a new interpreter so nothing is already imported; the
+fastest run is reported.
+"""
+
+import argparse
+import collections
+import subprocess
+import sys
+
+DEFAULT_MODULE = 'tungsten_tempest_plugin.tests.api.contrail.rbac_base'
+
+ImportEntry = collections.namedtuple(
+    'ImportEntry', ['name', 'self_us', 'cumulative_us', 'depth'])
+
+
+def parse(output):
+    """Parse the ``import time:`` lines written by ``-X importtime``.
+
+    :return: list of ImportEntry, in the order the imports completed
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # The header line.
+            continue
+        name = fields[2].rstrip()
+        entries.append(ImportEntry(
+            name.strip(), int(fields[0]), int(fields[1]),
+            (len(name) - len(name.lstrip())) // 2))
+    return entries
+
+
+def measure(module, python=None):
+    """Import ``module`` in a new interpreter, return its ImportEntry list.
+
+    :raises RuntimeError: when the import fails or the interpreter does not
+                          support ``-X importtime``
+    """
+    process = subprocess.Popen(
+        [python or sys.executable, '-X', 'importtime', '-c',
+         'import %s' % module],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    _, stderr = process.communicate()
+    if process.returncode:
+        raise RuntimeError('importing %s failed:\n%s' % (module, stderr))
+    entries = parse(stderr)
+    if not entries:
+        raise RuntimeError('%s does not support -X importtime'
+                           % (python or sys.executable))
+    return entries
+
+
+def total(entries):
+    """Seconds spent importing, summed over the top level imports."""
+    return sum(entry.cumulative_us for entry in entries
+               if entry.depth == 0) / 1e6
+
+
+def cumulative(entries, name):
+    """Seconds spent importing ``name`` and the modules it imported."""
+    for entry in entries:
+        if entry.name == name:
+            return entry.cumulative_us / 1e6
+    raise KeyError(name)
+
+
+def by_package(entries):
+    """Self time in seconds of ``entries`` grouped by top level package."""
+    packages = collections.Counter()
+    for entry in entries:
+        packages[entry.name.split('.')[0]] += entry.self_us / 1e6
+    return packages
+
+
+def best_of(module, repeat=5, python=None):
+    """Run :func:`measure` ``repeat`` times, return the fastest run."""
+    return min((measure(module, python) for _ in range(max(repeat, 1))),
+               key=total)
+
+
+def run(module=DEFAULT_MODULE, repeat=5):
+    """Suite cases: the import time of ``module`` in seconds."""
+    return {'import.%s' % module.rpartition('.')[2]: {
+        'mean': cumulative(best_of(module, repeat), module)}}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--module', default=DEFAULT_MODULE,
+                        help='module whose import is measured')
+    parser.add_argument('--top', type=int, default=20,
+                        help='modules listed in each table')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='interpreters started, the fastest is reported')
+    args = parser.parse_args(argv)
+
+    try:
+        entries = best_of(args.module, args.repeat)
+    except RuntimeError as exc:
+        print(exc)
+        return 1
+
+    print('%s: %.1f ms (interpreter total %.1f ms)' % (
+        args.module, cumulative(entries, args.module) * 1e3,
+        total(entries) * 1e3))
+    print('\n%-60s %10s' % ('cumulative', 'ms'))
+    for entry in sorted(entries, key=lambda e: -e.cumulative_us)[:args.top]:
+        print('%-60s %10.1f' % (entry.name, entry.cumulative_us / 1e3))
+    print('\n%-60s %10s' % ('self', 'ms'))
+    for entry in sorted(entries, key=lambda e: -e.self_us)[:args.top]:
+        print('%-60s %10.1f' % (entry.name, entry.self_us / 1e3))
+    print('\n%-60s %10s' % ('package (self)', 'ms'))
+    for name, seconds in by_package(entries).most_common(args.top):
+        print('%-60s %10.1f' % (name, seconds * 1e3))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
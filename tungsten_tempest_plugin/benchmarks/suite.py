@@ -0,0 +1,238 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark suite of the service client layer
+
+Times the per-call overhead of the client code itself (method dispatch,
+URI building, JSON codec, response bodies) and CRUD loops against the
+in-process fake API server, plus the import time of the RBAC test base
+module (Python 3.7 or later). Results are written as JSON and can be
+checked against a baseline saved by an earlier run::
+
+    python -m tungsten_tempest_plugin.benchmarks.suite \\
+        --output bench.json --baseline baseline.json
+
+The command exits with status 1 when a case got slower than the baseline
+by more than --threshold. Baselines are machine specific: compare runs
+made on the same host only.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+import timeit
+
+from tungsten_tempest_plugin.benchmarks import codec
+from tungsten_tempest_plugin.benchmarks import fake_contrail_api
+from tungsten_tempest_plugin.benchmarks import import_time
+from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import contrail_client
+from tungsten_tempest_plugin.services.contrail.json import metrics
+from tungsten_tempest_plugin.services.contrail.json import token_auth
+
+# Types exercised by the CRUD loops, with a body attribute to update.
+CRUD_TYPES = (
+    ('virtual_network', {'display_name': 'bench'}),
+    ('security_group', {'display_name': 'bench'}),
+    ('loadbalancer_pool', {'display_name': 'bench'}),
+)
+
+LOG = logging.getLogger(__name__)
+
+_UUID = '0e0b6f5c-7b6a-4d8e-9c5e-6f1a2b3c4d5e'
+
+
+class _Response(dict):
+    status = 200
+
+
+def _time(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def make_client(auth_provider):
+    return contrail_client.ContrailClient(auth_provider, 'sdn', 'region')
+
+
+def run_micro(number=10000, repeat=5):
+    """Time the client code that runs on every call, without any I/O.
+
+    :return: dict mapping case name to {'mean': seconds per call}
+    """
+    client = make_client(
+        token_auth.StaticTokenAuthProvider('http://127.0.0.1:8082'))
+    # Not a RESOURCE_TYPES entry: built by __getattr__, then cached.
+    getattr(client, 'show_bench_object')
+    query = {'parent_id': _UUID, 'detail': True}
+    small = {'virtual-network': codec.make_list_payload(1)[
+        'virtual-networks'][0]['virtual-network']}
+    small_raw = base.json_dumps(small)
+    page = codec.make_list_payload(100)
+    page_raw = base.json_dumps(page)
+    response = _Response()
+    getattr_miss = contrail_client.ContrailClient.__getattr__
+
+    cases = {
+        'dispatch.generated': lambda: client.show_virtual_network,
+        'dispatch.getattr_build': lambda: getattr_miss(client,
+                                                       'show_bench_object'),
+        'dispatch.getattr_cached': lambda: client.show_bench_object,
+        'uri.build_uri': lambda: client._build_uri('virtual_networks',
+                                                   **query),
+        'uri.query_url': lambda: client._query_url(
+            '/virtual-networks', query, fields=['name', 'fq_name']),
+        'json.loads_object': lambda: base.json_loads(small_raw),
+        'json.dumps_object': lambda: base.json_dumps(small),
+        'json.loads_page_100': lambda: base.json_loads(page_raw),
+        'json.dumps_page_100': lambda: base.json_dumps(page),
+        'body.response_body': lambda: base.ResponseBody(response, small),
+        'body.decoded': lambda: base.ResponseBody(
+            response, base.json_loads(small_raw)),
+    }
+    results = {}
+    for name, func in cases.items():
+        # Heavier cases get fewer calls per run.
+        calls = number // 100 if 'page' in name else number
+        results[name] = {'mean': _time(func, max(calls, 1), repeat)}
+    return results
+
+
+def _timed(histogram, func):
+    start = timeit.default_timer()
+    result = func()
+    histogram.add(timeit.default_timer() - start)
+    return result
+
+
+def run_crud(iterations=200, latency=0.0):
+    """Run create/show/update/delete loops against the fake API server.
+
+    :param iterations: objects created and deleted per resource type
+    :param latency: seconds the server adds to each request
+    :return: dict mapping case name to mean, p50 and p95 seconds per call
+    """
+    results = {}
+    with fake_contrail_api.FakeContrailAPI(latency=latency) as api:
+        client = make_client(api.auth_provider())
+        for resource, update in CRUD_TYPES:
+            ops = dict((op, metrics.Histogram())
+                       for op in ('create', 'show', 'update', 'delete'))
+            create = getattr(client, 'create_' + resource)
+            show = getattr(client, 'show_' + resource)
+            update_ = getattr(client, 'update_' + resource)
+            delete = getattr(client, 'delete_' + resource)
+            key = resource.replace('_', '-')
+            for index in range(iterations):
+                fq_name = ['default-domain', 'bench', 'bench-%d' % index]
+                # Reading the body is part of the cost of a call.
+                uuid = _timed(ops['create'], lambda: create(
+                    parent_type='project', fq_name=fq_name)[key]['uuid'])
+                _timed(ops['show'], lambda: show(uuid)[key])
+                _timed(ops['update'], lambda: update_(uuid, **update)[key])
+                _timed(ops['delete'], lambda: delete(uuid))
+            for op, histogram in ops.items():
+                results['crud.%s.%s' % (resource, op)] = {
+                    'mean': histogram.total / histogram.count,
+                    'p50': histogram.percentile(50),
+                    'p95': histogram.percentile(95),
+                }
+    return results
+
+
+def compare(results, baseline, threshold=0.2):
+    """Compare mean timings of ``results`` against ``baseline``.
+
+    :param threshold: relative slowdown above which a case regressed
+    :return: list of (name, baseline seconds, seconds, ratio, regressed)
+             tuples, for the cases found in both
+    """
+    rows = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        old = baseline[name]['mean']
+        new = results[name]['mean']
+        ratio = new / old if old else 0.0
+        rows.append((name, old, new, ratio, ratio > 1 + threshold))
+    return rows
+
+
+def run(number=10000, repeat=5, iterations=200, latency=0.0):
+    results = dict(run_micro(number, repeat),
+                   **run_crud(iterations, latency))
+    try:
+        results.update(import_time.run(repeat=repeat))
+    except RuntimeError as exc:
+        LOG.warning('Import time not measured: %s', exc)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'json_backend': base.JSON_BACKEND,
+            'timestamp': time.time(),
+        },
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--output', help='write the results to this file')
+    parser.add_argument('--baseline',
+                        help='results of an earlier run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative slowdown flagged as a regression')
+    parser.add_argument('--number', type=int, default=10000,
+                        help='calls per timing run of the micro cases')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='timing runs, the fastest one is reported')
+    parser.add_argument('--iterations', type=int, default=200,
+                        help='CRUD loop iterations per resource type')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds the fake server adds to each request')
+    args = parser.parse_args(argv)
+
+    # Keep the per-request log lines of RestClient out of the output.
+    logging.getLogger('tempest').setLevel(logging.WARNING)
+    report = run(args.number, args.repeat, args.iterations, args.latency)
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+
+    if not args.baseline:
+        for name, values in sorted(report['results'].items()):
+            print('%-36s %12.3f us' % (name, values['mean'] * 1e6))
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)['results']
+    regressions = 0
+    print('%-36s %12s %12s %8s' % ('case', 'baseline us', 'now us', 'ratio'))
+    for name, old, new, ratio, regressed in compare(
+            report['results'], baseline, args.threshold):
+        regressions += regressed
+        print('%-36s %12.3f %12.3f %7.2fx%s' % (
+            name, old * 1e6, new * 1e6, ratio,
+            '  REGRESSION' if regressed else ''))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,424 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Sustained load against the Contrail config API, using the plugin clients
+
+Runs a weighted mix of list/show/create/update/delete operations on the
+given resource types for a fixed duration, either as fast as
+--concurrency workers allow or paced to --rate operations per second.
+Throughput, error rate and latency percentiles are printed for every
+--interval, followed by a per-operation summary::
+
+    tungsten-tempest-loadgen --endpoint http://controller:8082 \\
+        --token $OS_TOKEN --project default-domain:admin \\
+        --mix list=2,show=10,create=1,update=2,delete=1 \\
+        --concurrency 20 --rate 200 --duration 300
+
+Operations only touch objects the run created, all of them named
+``loadgen-*``, and whatever is left is deleted at the end. Use --fake to
+try a mix against the in-process fake API server.
+"""
+
+import argparse
+import collections
+import json
+import logging
+import random
+import sys
+import threading
+import time
+
+from tempest import config
+
+from tungsten_tempest_plugin.services.contrail.json import contrail_client
+from tungsten_tempest_plugin.services.contrail.json import fq_client
+from tungsten_tempest_plugin.services.contrail.json import metrics
+from tungsten_tempest_plugin.services.contrail.json import token_auth
+
+CONF = config.CONF
+
+OPERATIONS = ('list', 'show', 'create', 'update', 'delete')
+
+DEFAULT_MIX = 'list=2,show=10,create=1,update=2,delete=1'
+DEFAULT_TYPES = 'virtual_network,security_group,network_ipam'
+
+
+def parse_mix(text):
+    """Parse ``op=weight,...`` into a list of (operation, weight)."""
+    mix = []
+    for item in text.split(','):
+        op, _, weight = item.partition('=')
+        op = op.strip()
+        if op not in OPERATIONS:
+            raise ValueError('unknown operation %r, expected one of %s'
+                             % (op, ', '.join(OPERATIONS)))
+        mix.append((op, float(weight or 1)))
+    if not any(weight > 0 for _, weight in mix):
+        raise ValueError('the mix needs at least one positive weight')
+    return mix
+
+
+class Window(object):
+    """Samples of one reporting interval."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.latency = metrics.Histogram()
+        self.per_op = collections.defaultdict(metrics.Histogram)
+        self.errors = collections.Counter()
+
+    def summary(self, elapsed):
+        count = self.latency.count
+        return {
+            'start': self.started,
+            'ops': count,
+            'per_second': count / elapsed if elapsed else 0.0,
+            'errors': sum(self.errors.values()),
+            'error_rate': (float(sum(self.errors.values())) / count
+                           if count else 0.0),
+            'p50': self.latency.percentile(50),
+            'p95': self.latency.percentile(95),
+            'p99': self.latency.percentile(99),
+        }
+
+
+class Stats(object):
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.window = Window()
+        self.total = Window()
+
+    def record(self, op, seconds, error=None):
+        with self._lock:
+            for window in (self.window, self.total):
+                window.latency.add(seconds)
+                window.per_op[op].add(seconds)
+                if error is not None:
+                    window.errors[(op, type(error).__name__)] += 1
+
+    def rotate(self):
+        with self._lock:
+            window, self.window = self.window, Window()
+        return window
+
+
+class Pacer(object):
+    """Hands out evenly spaced start times to reach ``rate`` per second."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = time.time()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            # Do not let an idle period build up a burst of catch-up calls.
+            start = self._next = max(self._next + self.interval,
+                                     time.time() - self.interval)
+        delay = start - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class LoadGenerator(object):
+    """Runs the operation mix with a thread per worker.
+
+    :param client: ContrailClient
+    :param project: fq_name of the project owning the created objects
+    :param project_id: uuid of that project, used to scope the lists
+    :param types: underscored resource types to operate on
+    :param mix: list of (operation, weight)
+    """
+
+    def __init__(self, client, project, project_id, types, mix, seed=None):
+        self.client = client
+        self.project = list(project)
+        self.project_id = project_id
+        self.types = list(types)
+        self.ops = [op for op, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        self.stats = Stats()
+        self.created = dict((t, []) for t in self.types)
+        self._busy = collections.Counter()
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._prefix = 'loadgen-%d-' % int(time.time())
+        self._names = iter(range(sys.maxsize))
+        self._stop = threading.Event()
+
+    def _acquire(self, resource, delete=False):
+        """Pick an object created by the run, or None if there is none.
+
+        Objects being shown or updated are never handed out for deletion,
+        so the run does not count its own races as NotFound errors.
+        """
+        with self._lock:
+            uuids = self.created[resource]
+            if delete:
+                idle = [index for index, uuid in enumerate(uuids)
+                        if not self._busy[uuid]]
+                if not idle:
+                    return None
+                index = self._random.choice(idle)
+                uuids[index], uuids[-1] = uuids[-1], uuids[index]
+                return uuids.pop()
+            if not uuids:
+                return None
+            uuid = self._random.choice(uuids)
+            self._busy[uuid] += 1
+            return uuid
+
+    def _release(self, uuid):
+        with self._lock:
+            self._busy[uuid] -= 1
+            if not self._busy[uuid]:
+                del self._busy[uuid]
+
+    def _choose(self):
+        with self._lock:
+            point = self._random.uniform(0, sum(self.weights))
+            for op, weight in zip(self.ops, self.weights):
+                point -= weight
+                if point <= 0:
+                    break
+            return op, self._random.choice(self.types)
+
+    def _create(self, resource):
+        with self._lock:
+            name = self._prefix + str(next(self._names))
+        body = getattr(self.client, 'create_' + resource)(
+            parent_type='project', fq_name=self.project + [name])
+        uuid = body[resource.replace('_', '-')]['uuid']
+        with self._lock:
+            self.created[resource].append(uuid)
+
+    def run_one(self, op, resource):
+        """Run one operation, return the operation actually run.
+
+        Operations that need an existing object fall back to a create
+        while the run has none of that type.
+        """
+        if op == 'list':
+            getattr(self.client, 'list_%ss' % resource)(
+                parent_id=self.project_id)
+            return op
+        uuid = None
+        if op != 'create':
+            uuid = self._acquire(resource, delete=(op == 'delete'))
+        if uuid is None:
+            self._create(resource)
+            return 'create'
+        if op == 'delete':
+            getattr(self.client, 'delete_' + resource)(uuid)
+            return op
+        try:
+            if op == 'show':
+                getattr(self.client, 'show_' + resource)(uuid)
+            else:
+                getattr(self.client, 'update_' + resource)(
+                    uuid, display_name='loadgen-%d' % time.time())
+        finally:
+            self._release(uuid)
+        return op
+
+    def _worker(self, pacer, deadline):
+        while not self._stop.is_set() and time.time() < deadline:
+            pacer.wait()
+            op, resource = self._choose()
+            start = time.time()
+            try:
+                op = self.run_one(op, resource)
+            except Exception as exc:
+                self.stats.record(op, time.time() - start, exc)
+            else:
+                self.stats.record(op, time.time() - start)
+
+    def run(self, duration, concurrency=10, rate=0.0, interval=10.0,
+            report=None):
+        """Generate load for ``duration`` seconds.
+
+        :param concurrency: number of worker threads
+        :param rate: target operations per second, 0 for no pacing
+        :param interval: seconds between two calls of ``report``
+        :param report: callable receiving each interval summary
+        :return: list of interval summaries
+        """
+        pacer = Pacer(rate)
+        deadline = time.time() + duration
+        workers = [threading.Thread(target=self._worker,
+                                    args=(pacer, deadline))
+                   for _ in range(concurrency)]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+        intervals = []
+        try:
+            while any(worker.is_alive() for worker in workers):
+                time.sleep(min(interval, max(deadline - time.time(), 0.1)))
+                window = self.stats.rotate()
+                summary = window.summary(time.time() - window.started)
+                summary['elapsed'] = duration - (deadline - time.time())
+                intervals.append(summary)
+                if report:
+                    report(summary)
+        except KeyboardInterrupt:
+            self._stop.set()
+        for worker in workers:
+            worker.join()
+        return intervals
+
+    def cleanup(self, workers=10):
+        """Delete every object the run created and did not delete."""
+        failed = 0
+        for resource, uuids in self.created.items():
+            if uuids:
+                result = self.client.delete_many(resource, uuids,
+                                                 workers=workers)
+                failed += len(result.errors)
+            self.created[resource] = []
+        return failed
+
+
+def print_interval(summary):
+    print('%7.1fs %8d ops %9.1f/s %6.2f%% errors  p50 %8.1f  p95 %8.1f  '
+          'p99 %8.1f ms' % (summary['elapsed'], summary['ops'],
+                            summary['per_second'],
+                            summary['error_rate'] * 100,
+                            summary['p50'] * 1000, summary['p95'] * 1000,
+                            summary['p99'] * 1000))
+    sys.stdout.flush()
+
+
+def summarize(total, elapsed):
+    per_op = {}
+    for op, histogram in sorted(total.per_op.items()):
+        errors = sum(count for (error_op, _), count in total.errors.items()
+                     if error_op == op)
+        per_op[op] = {'ops': histogram.count, 'errors': errors,
+                      'p50': histogram.percentile(50),
+                      'p95': histogram.percentile(95),
+                      'p99': histogram.percentile(99),
+                      'max': histogram.max}
+    summary = total.summary(elapsed)
+    summary['per_op'] = per_op
+    summary['error_types'] = dict(('%s %s' % key, count)
+                                  for key, count in total.errors.items())
+    return summary
+
+
+def print_summary(summary):
+    print('\n%-8s %8s %7s %9s %9s %9s %9s' % (
+        'op', 'ops', 'errors', 'p50 ms', 'p95 ms', 'p99 ms', 'max ms'))
+    for op, row in sorted(summary['per_op'].items()):
+        print('%-8s %8d %7d %9.1f %9.1f %9.1f %9.1f' % (
+            op, row['ops'], row['errors'], row['p50'] * 1000,
+            row['p95'] * 1000, row['p99'] * 1000, row['max'] * 1000))
+    print('\n%d ops, %.1f/s, %.2f%% errors' % (
+        summary['ops'], summary['per_second'], summary['error_rate'] * 100))
+    for error, count in sorted(summary['error_types'].items()):
+        print('  %6d %s' % (count, error))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--endpoint',
+                        help='base URL of the config API, e.g. '
+                             'http://controller:8082')
+    target.add_argument('--fake', action='store_true',
+                        help='run against the in-process fake API server')
+    parser.add_argument('--token', default='',
+                        help='keystone token sent as X-Auth-Token')
+    parser.add_argument('--project', default='default-domain:admin',
+                        help='fq_name of the project owning the objects')
+    parser.add_argument('--types', default=DEFAULT_TYPES,
+                        help='comma separated underscored resource types')
+    parser.add_argument('--mix', default=DEFAULT_MIX,
+                        help='comma separated operation=weight pairs')
+    parser.add_argument('--concurrency', type=int, default=10,
+                        help='number of worker threads')
+    parser.add_argument('--rate', type=float, default=0.0,
+                        help='target operations per second, 0 for as fast '
+                             'as the workers go')
+    parser.add_argument('--duration', type=float, default=60.0,
+                        help='seconds to run')
+    parser.add_argument('--interval', type=float, default=10.0,
+                        help='seconds between two progress lines')
+    parser.add_argument('--fake-latency', type=float, default=0.0,
+                        help='seconds the fake server adds to each request')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--output', help='write intervals and summary as '
+                                         'JSON to this file')
+    parser.add_argument('--no-cleanup', action='store_true',
+                        help='keep the objects left at the end of the run')
+    args = parser.parse_args(argv)
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as exc:
+        parser.error(str(exc))
+    types = [t.strip() for t in args.types.split(',') if t.strip()]
+    # Keep one connection per worker alive, the pool is off by default.
+    CONF.set_override('http_pool_enabled', True, 'sdn')
+    CONF.set_override('http_pool_maxsize', max(1, args.concurrency), 'sdn')
+    # RestClient logs every request at INFO.
+    logging.getLogger('tempest').setLevel(logging.WARNING)
+    project = args.project.split(':')
+
+    fake = None
+    if args.fake:
+        # Only --fake needs the benchmarks package.
+        from tungsten_tempest_plugin.benchmarks import fake_contrail_api
+        fake = fake_contrail_api.FakeContrailAPI(
+            latency=args.fake_latency, seed=args.seed).start()
+        endpoint = fake.url
+    else:
+        endpoint = args.endpoint.rstrip('/')
+    auth_provider = token_auth.StaticTokenAuthProvider(
+        endpoint, tenant_name=project[-1], token=args.token)
+    client = contrail_client.ContrailClient(auth_provider, 'sdn', 'region')
+    if fake:
+        client.create_project(parent_type='domain', fq_name=project)
+    project_id = fq_client.FqnameIdClient(
+        auth_provider, 'sdn', 'region').fqname_to_id(
+        type='project', fq_name=project)['uuid']
+
+    generator = LoadGenerator(client, project, project_id, types, mix,
+                              seed=args.seed)
+    start = time.time()
+    try:
+        intervals = generator.run(args.duration, args.concurrency,
+                                  args.rate, args.interval, print_interval)
+        summary = summarize(generator.stats.total, time.time() - start)
+        print_summary(summary)
+        if args.output:
+            with open(args.output, 'w') as output:
+                json.dump({'intervals': intervals, 'summary': summary},
+                          output, indent=2, sort_keys=True)
+    finally:
+        if not args.no_cleanup:
+            failed = generator.cleanup(args.concurrency)
+            if failed:
+                print('%d objects could not be deleted' % failed)
+        if fake:
+            fake.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
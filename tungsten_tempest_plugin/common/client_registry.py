@@ -0,0 +1,101 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+On-demand construction of Contrail service clients for test classes
+"""
+
+import importlib
+import threading
+
+import six
+
+
+class ClientRegistry(object):
+    """Builds Contrail service clients the first time they are requested.
+
+    Each test class owns one registry, created in
+    ``BaseContrailTest.setup_clients`` for its own credentials, so a class
+    only builds the clients its tests touch. Clients are keyed by their
+    class and are constructed with the parameters given to the registry.
+
+    :param auth_provider: tempest auth provider of the credential set
+    :param args: positional arguments for every client constructor
+    :param kwargs: keyword arguments for every client constructor
+    """
+
+    def __init__(self, auth_provider, *args, **kwargs):
+        self.auth_provider = auth_provider
+        self._args = args
+        self._kwargs = kwargs
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, client_class):
+        """Return the ``client_class`` instance, building it if needed.
+
+        :param client_class: service client class to instantiate
+        :return: service client object
+        """
+        client = self._clients.get(client_class)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(client_class)
+                if client is None:
+                    client = client_class(self.auth_provider,
+                                          *self._args, **self._kwargs)
+                    self._clients[client_class] = client
+        return client
+
+    @property
+    def built_clients(self):
+        """Names of the client classes built so far by this registry."""
+        return sorted(c.__name__ for c in self._clients)
+
+
+class LazyClient(object):
+    """Class attribute that resolves to a client built by a ClientRegistry.
+
+    The owning test class is expected to store its registry in the
+    ``_client_registry`` attribute during ``setup_clients``. Until then the
+    descriptor itself is returned, which keeps class introspection cheap.
+
+    :param client_class: service client class, or its dotted path
+                         (``package.module.ClassName``); a path is only
+                         imported when a client is first built
+    """
+
+    def __init__(self, client_class):
+        if isinstance(client_class, six.string_types):
+            self._path = client_class
+            self._class = None
+        else:
+            self._path = '%s.%s' % (client_class.__module__,
+                                    client_class.__name__)
+            self._class = client_class
+
+    @property
+    def client_class(self):
+        if self._class is None:
+            module_name, _, class_name = self._path.rpartition('.')
+            module = importlib.import_module(module_name)
+            self._class = getattr(module, class_name)
+        return self._class
+
+    def __get__(self, instance, owner):
+        registry = getattr(owner, '_client_registry', None)
+        if registry is None:
+            return self
+        return registry.get(self.client_class)
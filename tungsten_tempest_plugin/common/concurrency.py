@@ -0,0 +1,89 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Bounded thread pool helpers for fanning out blocking client calls
+"""
+
+import collections
+from concurrent import futures
+import time
+
+ItemResult = collections.namedtuple('ItemResult',
+                                    ['index', 'result', 'error', 'elapsed'])
+
+
+class BulkResult(list):
+    """Per-item outcome of a map_bounded run, in input order.
+
+    Every element is an ItemResult; ``error`` holds the exception raised
+    for that item, or None if the call succeeded.
+    """
+
+    def __init__(self, results, elapsed):
+        super(BulkResult, self).__init__(results)
+        self.elapsed = elapsed
+
+    @property
+    def results(self):
+        return [item.result for item in self]
+
+    @property
+    def errors(self):
+        return [item for item in self if item.error is not None]
+
+    def stats(self):
+        failed = len(self.errors)
+        return {'total': len(self),
+                'succeeded': len(self) - failed,
+                'failed': failed,
+                'elapsed': self.elapsed,
+                'per_second': len(self) / self.elapsed if self.elapsed else 0}
+
+    def raise_first_error(self):
+        """Re-raise the error of the first failed item, if any."""
+        for item in self:
+            if item.error is not None:
+                raise item.error
+
+
+def _call(func, index, item):
+    start = time.time()
+    try:
+        result, error = func(item), None
+    except Exception as exc:
+        result, error = None, exc
+    return ItemResult(index, result, error, time.time() - start)
+
+
+def map_bounded(func, items, workers=10):
+    """Call ``func`` on every element of ``items`` using a thread pool.
+
+    Failures do not stop the run; they are reported in the returned
+    BulkResult next to the results of the other items.
+
+    :param func: callable taking a single item
+    :param items: iterable of items
+    :param workers: maximum number of calls in flight
+    :return: BulkResult in the order of ``items``
+    """
+    items = list(items)
+    start = time.time()
+    if not items:
+        return BulkResult([], 0.0)
+    with futures.ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(lambda args: _call(func, *args),
+                                enumerate(items)))
+    return BulkResult(results, time.time() - start)
@@ -0,0 +1,82 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Per-process pool of parent resources shared by test classes
+"""
+
+import atexit
+import collections
+import threading
+
+from oslo_log import log as logging
+
+LOG = logging.getLogger(__name__)
+
+
+class FixturePool(object):
+    """Creates each parent resource once and deletes it at process exit.
+
+    Fixtures are keyed by (kind, tenant, spec). Test classes asking for an
+    equal key get the very same object, so ``spec`` must describe
+    everything the class relies on, e.g. subnet and network properties.
+    Each test worker is a separate process and owns its own pool.
+    """
+
+    def __init__(self):
+        self._fixtures = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = collections.defaultdict(threading.Lock)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, create, delete):
+        """Return the fixture stored under ``key``, creating it if needed.
+
+        :param key: hashable (kind, tenant, spec) tuple
+        :param create: callable returning the new resource
+        :param delete: callable invoked with the resource at release time
+        :return: the shared resource
+        """
+        with self._lock:
+            key_lock = self._key_locks[key]
+        with key_lock:
+            entry = self._fixtures.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry[0]
+            value = create()
+            self.misses += 1
+            with self._lock:
+                self._fixtures[key] = (value, delete)
+            return value
+
+    def release_all(self):
+        """Delete every fixture, most recently created first."""
+        with self._lock:
+            entries = list(self._fixtures.items())
+            self._fixtures.clear()
+        for key, (value, delete) in reversed(entries):
+            try:
+                delete(value)
+            except Exception:
+                LOG.exception('Failed to release shared fixture %s', key)
+        if entries:
+            LOG.info('Released %d shared fixtures (%d reuses)',
+                     len(entries), self.hits)
+
+
+pool = FixturePool()
+atexit.register(pool.release_all)
@@ -0,0 +1,211 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+JSON Lines RBAC report, written off the test thread in per-worker shards
+
+Each test worker appends to its own ``<report>.<pid>.jsonl`` shard. Once
+the run is over the shards are merged into the report file with::
+
+    python -m tungsten_tempest_plugin.common.rbac_report <report>
+"""
+
+import argparse
+import atexit
+import glob
+import json
+import logging
+from logging import handlers
+import os
+import time
+
+from six.moves import queue
+from tempest import config
+
+CONF = config.CONF
+
+# Field names of the record patrole logs to 'rbac_reporting', in the
+# order of its format arguments.
+PATROLE_FIELDS = ('service', 'test', 'rules', 'expected', 'actual')
+
+_current_test = {'id': None, 'window_started': None, 'latency': None}
+
+
+def start_test(test_id):
+    """Remember the running test, so its records carry its id."""
+    _current_test['id'] = test_id
+    _current_test['window_started'] = None
+    _current_test['latency'] = None
+
+
+def start_window():
+    """Mark the start of the calls made under the overridden roles."""
+    _current_test['window_started'] = time.time()
+
+
+def end_window():
+    """Add the time since start_window() to the latency of the test.
+
+    The latency reported for a test covers only what ran inside
+    ``override_role``, without the role switches around it.
+    """
+    started = _current_test['window_started']
+    if started is None:
+        return
+    _current_test['window_started'] = None
+    _current_test['latency'] = ((_current_test['latency'] or 0) +
+                                time.time() - started)
+
+
+def shard_path(report_path, pid):
+    return '%s.%d.jsonl' % (report_path, pid)
+
+
+class ContextFilter(logging.Filter):
+    """Attaches the structured report fields to a record.
+
+    Runs in the test thread, before the record is queued and its
+    arguments are merged into the message.
+    """
+
+    def filter(self, record):
+        fields = {}
+        if (isinstance(record.args, tuple) and
+                len(record.args) == len(PATROLE_FIELDS)):
+            fields = dict(zip(PATROLE_FIELDS, record.args))
+            fields['rules'] = [rule.strip() for rule in
+                               fields['rules'].split(',') if rule.strip()]
+        try:
+            fields['roles'] = list(CONF.patrole.rbac_test_roles or [])
+        except Exception:
+            fields['roles'] = []
+        fields['test_id'] = _current_test['id']
+        if _current_test['latency'] is not None:
+            fields['latency'] = round(_current_test['latency'], 3)
+        record.rbac = fields
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+
+    def format(self, record):
+        entry = dict(getattr(record, 'rbac', None) or {})
+        entry['timestamp'] = record.created
+        entry['worker'] = record.process
+        entry['message'] = record.getMessage()
+        return json.dumps(entry, sort_keys=True)
+
+
+class _QueueHandler(getattr(handlers, 'QueueHandler', object)):
+    """QueueHandler starting its listener with the first record.
+
+    Every process loading the plugin configures the report, but only the
+    test workers log to it, so the others never start the thread.
+    """
+
+    def __init__(self, records, listener):
+        super(_QueueHandler, self).__init__(records)
+        self.listener = listener
+        self.started = False
+
+    def enqueue(self, record):
+        if not self.started:
+            with self.lock:
+                if not self.started:
+                    self.listener.start()
+                    self.started = True
+        super(_QueueHandler, self).enqueue(record)
+
+
+def configure(logger, report_path, batch_size=100):
+    """Send ``logger`` records to this worker's JSON Lines shard.
+
+    Records are queued by the test thread and written by a listener
+    thread, started with the first record, in batches of ``batch_size``;
+    whatever is left is flushed when the worker exits. Without
+    QueueHandler (Python 2) the batching handler is attached directly.
+
+    :param logger: the 'rbac_reporting' logger
+    :param report_path: path of the merged report
+    :param batch_size: number of records written at once
+    :return: path of the shard
+    """
+    path = shard_path(report_path, os.getpid())
+    file_handler = logging.FileHandler(path, mode='a', delay=True)
+    file_handler.setFormatter(JsonLinesFormatter())
+    batch_handler = handlers.MemoryHandler(batch_size,
+                                           flushLevel=logging.CRITICAL,
+                                           target=file_handler)
+
+    if not hasattr(handlers, 'QueueHandler'):
+        batch_handler.addFilter(ContextFilter())
+        logger.addHandler(batch_handler)
+        queue_handler = None
+    else:
+        records = queue.Queue(-1)
+        queue_handler = _QueueHandler(
+            records, handlers.QueueListener(records, batch_handler))
+        queue_handler.addFilter(ContextFilter())
+        logger.addHandler(queue_handler)
+
+    def close():
+        if queue_handler is not None and queue_handler.started:
+            queue_handler.listener.stop()
+        batch_handler.close()
+        file_handler.close()
+
+    atexit.register(close)
+    return path
+
+
+def merge_shards(report_path):
+    """Merge every worker shard of ``report_path`` into that file.
+
+    Records are ordered by time and the shards removed, so the next run
+    starts from a clean directory.
+
+    :return: number of records written
+    """
+    entries = []
+    shards = sorted(glob.glob('%s.*.jsonl' % report_path))
+    for shard in shards:
+        with open(shard) as shard_file:
+            for line in shard_file:
+                line = line.strip()
+                if line:
+                    entries.append(json.loads(line))
+    entries.sort(key=lambda entry: entry.get('timestamp', 0))
+    with open(report_path, 'w') as report:
+        for entry in entries:
+            report.write(json.dumps(entry, sort_keys=True) + '\n')
+    for shard in shards:
+        os.remove(shard)
+    return len(entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Merge the per-worker shards of a JSON Lines RBAC '
+                    'report')
+    parser.add_argument('report', help='path of the report, as configured '
+                                       'by tungsten_log.report_log_path '
+                                       'and report_log_name')
+    args = parser.parse_args(argv)
+    print('%d records merged into %s' % (merge_shards(args.report),
+                                         args.report))
+
+
+if __name__ == '__main__':
+    main()
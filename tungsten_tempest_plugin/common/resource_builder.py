@@ -0,0 +1,128 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Declarative builder for fixtures made of dependent Contrail resources
+"""
+
+import collections
+from concurrent import futures
+
+_Node = collections.namedtuple('_Node', ['create', 'delete', 'depends_on'])
+
+
+class ResourceBuilder(object):
+    """Creates a graph of resources, independent branches concurrently.
+
+    Every resource is declared with the names of the resources it needs,
+    as parent or as reference. ``build`` starts a resource as soon as all
+    of them exist, so a fixture takes as long as its longest dependency
+    chain rather than the sum of all create calls::
+
+        builder = ResourceBuilder(add_cleanup)
+        builder.add('template', create_template, delete_template)
+        builder.add('instance', create_instance, delete_instance,
+                    depends_on=['template'])
+        builder.add('health_check', create_check, delete_check)
+        resources = builder.build()
+
+    Cleanups are registered through ``add_cleanup`` in creation order, so
+    a LIFO cleanup stack such as ``addCleanup`` deletes every resource
+    before the resources it depends on.
+
+    :param add_cleanup: callable registering ``delete(uuid)``, called as
+                        ``add_cleanup(delete, uuid)``; None skips cleanup
+    :param workers: maximum number of create calls in flight
+    """
+
+    def __init__(self, add_cleanup=None, workers=10):
+        self._add_cleanup = add_cleanup
+        self._workers = workers
+        self._nodes = collections.OrderedDict()
+
+    def add(self, name, create, delete=None, depends_on=()):
+        """Declare a resource.
+
+        :param name: key of the resource in the dict returned by build
+        :param create: callable taking the dict of resources built so far
+                       and returning the new resource dict
+        :param delete: client delete method, called with the resource uuid
+        :param depends_on: names of the resources that must exist first
+        """
+        if name in self._nodes:
+            raise ValueError('Resource %s is declared twice' % name)
+        self._nodes[name] = _Node(create, delete, tuple(depends_on))
+
+    def _check_graph(self):
+        for name, node in self._nodes.items():
+            for dependency in node.depends_on:
+                if dependency not in self._nodes:
+                    raise ValueError('Resource %s depends on undeclared %s'
+                                     % (name, dependency))
+        state = {}
+
+        def visit(name):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError('Dependency cycle through %s' % name)
+            state[name] = 'visiting'
+            for dependency in self._nodes[name].depends_on:
+                visit(dependency)
+            state[name] = 'done'
+
+        for name in self._nodes:
+            visit(name)
+
+    def build(self):
+        """Create every declared resource in dependency order.
+
+        If a create call fails, nothing new is started, the calls in
+        flight are awaited and their resources registered for cleanup,
+        then the first error is raised.
+
+        :return: dict mapping resource names to the created resources
+        """
+        self._check_graph()
+        built = {}
+        pending = dict(self._nodes)
+        error = None
+        with futures.ThreadPoolExecutor(
+                max_workers=max(1, self._workers)) as pool:
+            running = {}
+            while pending or running:
+                if error is None:
+                    for name in [n for n, node in pending.items()
+                                 if all(d in built for d in node.depends_on)]:
+                        node = pending.pop(name)
+                        running[pool.submit(node.create, dict(built))] = name
+                if not running:
+                    break
+                done, _ = futures.wait(list(running),
+                                       return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        resource = future.result()
+                    except Exception as exc:
+                        error = error or exc
+                        continue
+                    built[name] = resource
+                    delete = self._nodes[name].delete
+                    if self._add_cleanup is not None and delete is not None:
+                        self._add_cleanup(delete, resource['uuid'])
+        if error is not None:
+            raise error
+        return built
@@ -0,0 +1,311 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Concurrent, dependency ordered deletion of test resources
+"""
+
+import collections
+import itertools
+import json
+import re
+import threading
+import time
+
+from oslo_log import log as logging
+import six
+from tempest.lib import exceptions
+
+from tungsten_tempest_plugin.common import concurrency
+
+LOG = logging.getLogger(__name__)
+
+_REF_KEY_RE = re.compile(r'^(?P<type>[a-z0-9_]+)_refs$')
+_COLLECTION_RE = re.compile(r'^/?(?P<type>[a-z0-9-]+)s/?$')
+_OBJECT_RE = re.compile(r'^/?(?P<type>[a-z0-9-]+)/'
+                        r'(?P<uuid>[0-9a-fA-F-]{36})/?$')
+
+_Deletion = collections.namedtuple('_Deletion',
+                                   ['order', 'uuid', 'func', 'args',
+                                    'kwargs'])
+
+
+def _loads(data):
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data) if data else {}
+
+
+class ObjectGraph(object):
+    """Parent and reference edges of the objects created by this process.
+
+    The service clients feed it the create and update calls they make, so
+    the objects a test queues for deletion can be ordered by what they
+    actually belong to and refer to. Objects are forgotten once deleted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._depends_on = {}
+        self._referrers = collections.defaultdict(set)
+        self._by_fq_name = {}
+        self._fq_names = {}
+
+    def __len__(self):
+        return len(self._depends_on)
+
+    def _resolve(self, obj_type, ref):
+        if not isinstance(ref, dict):
+            return None
+        if ref.get('uuid'):
+            return ref['uuid']
+        return self._by_fq_name.get((obj_type, tuple(ref.get('to') or ())))
+
+    def _refs(self, attrs):
+        for key, refs in attrs.items():
+            match = _REF_KEY_RE.match(key)
+            if not match or not isinstance(refs, list):
+                continue
+            ref_type = match.group('type').replace('_', '-')
+            for ref in refs:
+                uuid = self._resolve(ref_type, ref)
+                if uuid:
+                    yield uuid
+
+    def _link(self, uuid, targets):
+        edges = self._depends_on.setdefault(uuid, set())
+        for target in targets:
+            if target and target != uuid:
+                edges.add(target)
+                self._referrers[target].add(uuid)
+
+    def add(self, uuid, obj_type, fq_name=None, depends_on=()):
+        """Record an object and the objects it belongs to or refers to."""
+        with self._lock:
+            if fq_name:
+                key = (obj_type, tuple(fq_name))
+                self._by_fq_name[key] = uuid
+                self._fq_names[uuid] = key
+            self._link(uuid, depends_on)
+
+    def observe(self, method, url, request_body, response_body):
+        """Record the object created or updated by a successful call.
+
+        :param method: 'POST' for creates, 'PUT' for updates
+        :param url: request path, e.g. '/virtual-networks'
+        :param request_body: JSON request body
+        :param response_body: JSON response body
+        """
+        path = url.split('?', 1)[0]
+        try:
+            if method == 'POST':
+                match = _COLLECTION_RE.match(path)
+                if match:
+                    self._observe_create(match.group('type'),
+                                         _loads(request_body),
+                                         _loads(response_body))
+            elif method == 'PUT':
+                match = _OBJECT_RE.match(path)
+                if match:
+                    attrs = _loads(request_body).get(match.group('type'))
+                    with self._lock:
+                        self._link(match.group('uuid'),
+                                   list(self._refs(attrs or {})))
+        except (AttributeError, TypeError, ValueError):
+            # Not a regular object body: nothing to learn from it.
+            pass
+
+    def _observe_create(self, obj_type, request, response):
+        created = response.get(obj_type)
+        if not isinstance(created, dict) or not created.get('uuid'):
+            return
+        attrs = request.get(obj_type) or request.get(
+            obj_type.replace('-', '_')) or {}
+        fq_name = created.get('fq_name') or attrs.get('fq_name') or ()
+        with self._lock:
+            parent = created.get('parent_uuid')
+            if not parent and len(fq_name) > 1 and attrs.get('parent_type'):
+                parent = self._by_fq_name.get(
+                    (attrs['parent_type'].replace('_', '-'),
+                     tuple(fq_name[:-1])))
+            depends_on = list(self._refs(attrs))
+            if parent:
+                depends_on.append(parent)
+        self.add(created['uuid'], obj_type, fq_name, depends_on)
+
+    def forget(self, uuid):
+        with self._lock:
+            for target in self._depends_on.pop(uuid, ()):
+                referrers = self._referrers.get(target)
+                if referrers is not None:
+                    referrers.discard(uuid)
+                    if not referrers:
+                        del self._referrers[target]
+            key = self._fq_names.pop(uuid, None)
+            if key is not None and self._by_fq_name.get(key) == uuid:
+                del self._by_fq_name[key]
+
+    def dependents(self, uuid):
+        """Objects that belong to or refer to ``uuid``, transitively."""
+        with self._lock:
+            seen = set()
+            stack = [uuid]
+            while stack:
+                for referrer in self._referrers.get(stack.pop(), ()):
+                    if referrer not in seen:
+                        seen.add(referrer)
+                        stack.append(referrer)
+            return seen
+
+    def waves(self, uuids):
+        """Split ``uuids`` into batches that can be deleted in turn.
+
+        Every object comes after all the objects in ``uuids`` that belong
+        to or refer to it, directly or through objects outside ``uuids``.
+        Objects caught in a reference cycle end up in the last batch.
+
+        :return: list of sets of uuids
+        """
+        uuids = set(uuids)
+        blockers = dict((uuid, self.dependents(uuid) & uuids)
+                        for uuid in uuids)
+        waves = []
+        done = set()
+        while len(done) < len(uuids):
+            wave = set(uuid for uuid in uuids - done
+                       if blockers[uuid] <= done)
+            if not wave:
+                wave = uuids - done
+            waves.append(wave)
+            done |= wave
+        return waves
+
+
+object_graph = ObjectGraph()
+
+
+class TeardownQueue(object):
+    """Collects deletions and runs them children first, in parallel.
+
+    Queued deletions are grouped into waves using ``graph``, the parent and
+    reference edges the service clients recorded when the objects were
+    created: an object is deleted after every queued object that belongs
+    to or refers to it. Deletions of objects the graph does not know have
+    no constraint and run in the first wave. Within a wave deletions run
+    concurrently. NotFound is ignored, as in
+    ``BaseContrailTest._try_delete_resource``. A deletion refused with 409
+    Conflict, typically because its object still has children or back
+    references, moves on to the next wave, and after the last wave is
+    retried for as long as each round makes progress.
+
+    :param workers: maximum number of DELETE calls in flight
+    :param retry_interval: seconds to wait between conflict retry rounds
+    :param graph: ObjectGraph, defaults to the one fed by the clients
+    """
+
+    def __init__(self, workers=10, retry_interval=1.0, graph=None):
+        self.workers = workers
+        self.retry_interval = retry_interval
+        self.graph = graph if graph is not None else object_graph
+        self._queue = []
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def add(self, delete_callable, *args, **kwargs):
+        """Queue ``delete_callable(*args, **kwargs)``.
+
+        The uuid of the deleted object is taken from the first positional
+        argument, as for every client delete method, or from a ``uuid`` or
+        ``*_id`` keyword argument.
+        """
+        uuid = args[0] if args else next(
+            (value for name, value in sorted(kwargs.items())
+             if name == 'uuid' or name.endswith('_id')), None)
+        if not isinstance(uuid, six.string_types):
+            uuid = None
+        self._queue.append(_Deletion(next(self._counter), uuid,
+                                     delete_callable, args, kwargs))
+
+    def _waves(self, queue):
+        by_uuid = collections.defaultdict(list)
+        for deletion in queue:
+            by_uuid[deletion.uuid].append(deletion)
+        waves = []
+        for uuids in self.graph.waves(u for u in by_uuid if u is not None):
+            waves.append([d for u in uuids for d in by_uuid[u]])
+        if None in by_uuid:
+            if waves:
+                waves[0].extend(by_uuid[None])
+            else:
+                waves.append(by_uuid[None])
+        return waves
+
+    @staticmethod
+    def _delete(deletion):
+        try:
+            deletion.func(*deletion.args, **deletion.kwargs)
+        except exceptions.NotFound:
+            pass
+
+    def _run(self, deletions):
+        """Run a batch, return lists of (deletion, error) pairs.
+
+        :return: (conflicts, other errors) tuple
+        """
+        # Later registrations first, as a cleanup stack would do.
+        deletions = sorted(deletions, key=lambda d: -d.order)
+        result = concurrency.map_bounded(self._delete, deletions,
+                                         workers=self.workers)
+        conflicts, errors = [], []
+        for item in result.errors:
+            if isinstance(item.error, exceptions.Conflict):
+                conflicts.append((deletions[item.index], item.error))
+            else:
+                errors.append((deletions[item.index], item.error))
+        return conflicts, errors
+
+    def flush(self):
+        """Run every queued deletion and empty the queue.
+
+        :raises: the first error other than NotFound, once every deletion
+                 has been attempted
+        """
+        queue, self._queue = self._queue, []
+        if not queue:
+            return
+        start = time.time()
+        errors = []
+        carried = []
+        for wave in self._waves(queue):
+            carried, failed = self._run([d for d, _ in carried] + wave)
+            errors.extend(failed)
+        while carried:
+            time.sleep(self.retry_interval)
+            remaining, failed = self._run([d for d, _ in carried])
+            errors.extend(failed)
+            if len(remaining) == len(carried):
+                errors.extend(remaining)
+                break
+            carried = remaining
+        LOG.debug('Deleted %d resources in %.2fs, %d failed', len(queue),
+                  time.time() - start, len(errors))
+        for deletion, error in errors:
+            LOG.warning('Failed to delete resource with %s%s: %s',
+                        getattr(deletion.func, '__name__', deletion.func),
+                        deletion.args, error)
+        if errors:
+            raise errors[0][1]
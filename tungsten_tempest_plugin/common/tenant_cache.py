@@ -0,0 +1,128 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Cache of project uuids, shared by test classes and optionally by runs
+"""
+
+import json
+import os
+import threading
+import time
+
+from oslo_concurrency import lockutils
+from oslo_log import log as logging
+
+LOG = logging.getLogger(__name__)
+
+
+class TenantCache(object):
+    """Maps (endpoint, tenant name) to the uuid of the Contrail project.
+
+    Lookups are served from memory first, then from the optional JSON
+    file, and only then resolved through the API. Entries carry an expiry
+    time. An entry read from the file was written by another run, so it
+    is checked once with the ``validate`` callable before this process
+    starts trusting it; a project deleted or recreated under the same
+    name since is resolved again rather than served with its old uuid.
+    Entries in memory were resolved or checked by this process and cost
+    no request until they expire.
+    """
+
+    def __init__(self):
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(endpoint, tenant_name):
+        return '%s %s' % (endpoint, tenant_name)
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path) as cache_file:
+                return json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write(path, entries):
+        tmp_path = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp_path, 'w') as cache_file:
+            json.dump(entries, cache_file, indent=2, sort_keys=True)
+        os.rename(tmp_path, path)
+
+    @staticmethod
+    def _file_lock(path):
+        return lockutils.lock(os.path.basename(path), external=True,
+                              lock_file_prefix='tungsten-tempest',
+                              lock_path=os.path.dirname(path) or '.')
+
+    def _get_from_file(self, path, key, now):
+        with self._file_lock(path):
+            entry = self._read(path).get(key)
+        if entry and entry.get('expires', 0) > now:
+            return entry
+        return None
+
+    def _store_in_file(self, path, key, entry, now):
+        try:
+            with self._file_lock(path):
+                entries = dict((k, v) for k, v in self._read(path).items()
+                               if v.get('expires', 0) > now)
+                entries[key] = entry
+                self._write(path, entries)
+        except (IOError, OSError) as exc:
+            LOG.warning('Could not update tenant cache %s: %s', path, exc)
+
+    def lookup(self, endpoint, tenant_name, resolve, path=None, ttl=3600,
+               validate=None):
+        """Return the project uuid of ``tenant_name``.
+
+        :param endpoint: base URL of the Contrail API serving the project
+        :param tenant_name: project name
+        :param resolve: callable returning the uuid, called on a miss
+        :param path: JSON file persisting entries across runs, or None
+        :param ttl: seconds an entry may be reused
+        :param validate: callable taking a uuid read from ``path`` and
+            returning False if it no longer names the project, or None to
+            trust the file
+        :return: uuid string
+        """
+        key = self._key(endpoint, tenant_name)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None and entry['expires'] > now:
+            return entry['uuid']
+        entry = self._get_from_file(path, key, now) if path else None
+        if entry is not None and validate and not validate(entry['uuid']):
+            LOG.info('Cached uuid %s of project %s is stale, resolving it '
+                     'again', entry['uuid'], tenant_name)
+            entry = None
+        if entry is None:
+            entry = {'uuid': resolve(), 'expires': now + ttl}
+            if path:
+                self._store_in_file(path, key, entry, now)
+        with self._lock:
+            self._memory[key] = entry
+        return entry['uuid']
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+
+
+tenant_cache = TenantCache()
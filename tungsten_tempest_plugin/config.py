@@ -38,6 +38,131 @@ SDNGroup = [
     cfg.StrOpt('contrail_version',
                default='5.0',
                help="Version of SDN service"),
+    cfg.BoolOpt('http_pool_enabled',
+                default=False,
+                help="Share keep-alive HTTP connections between all "
+                     "Contrail service clients instead of opening a new "
+                     "connection for every request. This replaces the "
+                     "'http_obj' transport of the clients, so code "
+                     "patching or wrapping it sees the pooled one"),
+    cfg.IntOpt('http_pool_maxsize',
+               default=10,
+               min=1,
+               help="Maximum number of idle connections kept per SDN "
+                    "endpoint when 'http_pool_enabled' is set"),
+    cfg.IntOpt('bulk_workers',
+               default=10,
+               min=1,
+               help="Maximum number of Contrail API requests a bulk "
+                    "client call or a fixture built by a test keeps in "
+                    "flight at once"),
+    cfg.IntOpt('fqname_cache_size',
+               default=1024,
+               min=0,
+               help="Maximum number of fq_name <-> uuid mappings cached "
+                    "by the fqname client. 0 disables the cache"),
+    cfg.IntOpt('fqname_cache_ttl',
+               default=300,
+               min=0,
+               help="Seconds a cached fq_name <-> uuid mapping is "
+                    "considered valid. 0 keeps entries until evicted"),
+    cfg.BoolOpt('conditional_get',
+                default=False,
+                help="Keep the last response of GETs on a single object "
+                     "made with exclude_back_refs and exclude_children, "
+                     "and revalidate it on the next such GET, with "
+                     "If-None-Match/If-Modified-Since when the server "
+                     "sends validators and otherwise by fetching only "
+                     "id_perms and comparing last_modified. Other GETs "
+                     "are never cached: back references and children "
+                     "change without updating last_modified. Every GET "
+                     "still costs one request with the caller's token, "
+                     "so this only saves transferring and decoding "
+                     "unchanged bodies. Any POST, PUT or DELETE made by "
+                     "this worker empties the cache"),
+    cfg.IntOpt('conditional_get_cache_size',
+               default=256,
+               min=0,
+               help="Maximum number of responses kept when "
+                    "'conditional_get' is set"),
+    cfg.IntOpt('retry_attempts',
+               default=0,
+               min=0,
+               help="Maximum number of times a Contrail API request "
+                    "answered with one of the 'retry_on' statuses is "
+                    "retried. 0 disables retries. Retries are counted "
+                    "and logged when a test class is cleaned up, whether "
+                    "or not the latency report is enabled"),
+    cfg.DictOpt('retry_on',
+                default={'409': 'PUT', '503': 'GET PUT DELETE'},
+                help="HTTP statuses retried when 'retry_attempts' is set, "
+                     "each mapped to the space separated methods retried "
+                     "on it. Only add POST for statuses returned before "
+                     "the server changed anything. 401, 403 and 404 are "
+                     "never retried"),
+    cfg.FloatOpt('retry_backoff',
+                 default=0.5,
+                 min=0,
+                 help="Base delay in seconds before a retry, doubled after "
+                      "every attempt and randomized with full jitter"),
+    cfg.FloatOpt('retry_backoff_max',
+                 default=8.0,
+                 min=0,
+                 help="Maximum delay in seconds between two attempts"),
+    cfg.FloatOpt('retry_max_time',
+                 default=30.0,
+                 min=0,
+                 help="Seconds after the first attempt past which a "
+                      "request is no longer retried"),
+    cfg.FloatOpt('rate_limit',
+                 default=0.0,
+                 min=0,
+                 help="Maximum number of Contrail API requests per second "
+                      "sent by all the test workers sharing "
+                      "'rate_limit_state_file', retries included. 0 "
+                      "disables rate limiting"),
+    cfg.IntOpt('rate_limit_burst',
+               default=10,
+               min=1,
+               help="Number of requests that may be sent at once after an "
+                    "idle period when 'rate_limit' is set"),
+    cfg.StrOpt('rate_limit_state_file',
+               help="File through which the test workers share the "
+                    "request budget. Defaults to a file in the temporary "
+                    "directory named after a hash of the SDN endpoint and "
+                    "$TEMPEST_RUN_ID, so unrelated runs on the host only "
+                    "share a budget when they target the same endpoint "
+                    "with the same (or no) run id. Set it explicitly to "
+                    "share one budget across endpoints or runs"),
+    cfg.BoolOpt('share_fixtures',
+                default=False,
+                help="Create common parent resources (projects, IPAMs and "
+                     "networks) once per test worker and share them "
+                     "between test classes with the same needs. Only "
+                     "used with static credentials, since dynamic "
+                     "credentials give every class its own project"),
+    cfg.IntOpt('teardown_workers',
+               default=0,
+               min=0,
+               help="Maximum number of resource deletions run in parallel "
+                    "when cleaning up after a test or test class. "
+                    "Deletions are ordered by the parents and references "
+                    "the clients saw when the objects were created, "
+                    "children first, and retried on 409 Conflict. 0 or 1 "
+                    "keeps the serial cleanup order"),
+    cfg.IntOpt('tenant_cache_ttl',
+               default=3600,
+               min=0,
+               help="Seconds the uuid of the test project is reused by "
+                    "later test classes once resolved. A uuid read from "
+                    "'tenant_cache_file' is checked once per test worker "
+                    "with one id-to-fqname call and resolved again if the "
+                    "project is gone. 0 resolves it again for every "
+                    "class"),
+    cfg.StrOpt('tenant_cache_file',
+               help="JSON file persisting resolved project uuids across "
+                    "runs, keyed by SDN endpoint and project name. Unset "
+                    "keeps them in memory only"),
 ]
 
 tungsten_log_group = cfg.OptGroup(
@@ -58,6 +183,27 @@ TungstenLogGroup = [
                help="Path (relative or absolute) where the output from "
                     "'enable_reporting' is logged. This is combined with"
                     "report_log_name to generate the full path."),
+    cfg.StrOpt('report_format',
+               default='text',
+               choices=['text', 'jsonl'],
+               help="Format of the RBAC report. 'text' writes one line per "
+                    "test to a file shared by all workers. 'jsonl' writes "
+                    "structured records from a background thread to one "
+                    "shard per worker, merged afterwards with 'python -m "
+                    "tungsten_tempest_plugin.common.rbac_report <report>'. "
+                    "Their 'latency' is the time spent inside "
+                    "override_role, without the role switches"),
+    cfg.BoolOpt('enable_latency_report',
+                default=False,
+                help="Record the latency, status and size of every "
+                     "Contrail API call and write per-endpoint p50/p95/p99 "
+                     "latencies to 'latency_report_name' in "
+                     "'report_log_path' when each test worker exits"),
+    cfg.StrOpt('latency_report_name',
+               default='tungsten-latency.{pid}.txt',
+               help="Name of the latency report file. '{pid}' is replaced "
+                    "by the process id of the test worker, so that every "
+                    "worker writes its own file"),
 ]
 
 
@@ -21,6 +21,7 @@ from oslo_concurrency import lockutils
 from tempest import config
 from tempest.test_discover import plugins
 
+from tungsten_tempest_plugin.common import rbac_report
 from tungsten_tempest_plugin import config as project_config
 
 RBACLOG = logging.getLogger('rbac_reporting')
@@ -50,6 +51,12 @@ class TungstenTempestPlugin(plugins.TempestPlugin):
         report_path = os.path.join(
             report_abs_path, conf.tungsten_log.report_log_name)
 
+        if conf.tungsten_log.report_format == 'jsonl':
+            # Records are written by a background thread to a shard owned
+            # by this worker, so there is nothing to reset or share.
+            rbac_report.configure(RBACLOG, report_path)
+            return
+
         # Remove the log file if it exists
         self._reset_log_file(report_path)
         # Delay=True so that we don't end up creating an empty file if we
@@ -70,6 +77,14 @@ class TungstenTempestPlugin(plugins.TempestPlugin):
 
         if conf.tungsten_log.enable_reporting:
             self._configure_per_test_logging(conf)
+        if conf.tungsten_log.enable_latency_report:
+            # Imported here so tempest commands that only load the plugin
+            # do not import the service client package.
+            from tungsten_tempest_plugin.services.contrail.json import \
+                metrics
+            metrics.recorder.enable(os.path.join(
+                os.path.abspath(conf.tungsten_log.report_log_path),
+                conf.tungsten_log.latency_report_name))
 
     def get_opt_lists(self):
         return [
@@ -17,8 +17,6 @@
 Tempest service class for access control test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,14 +26,13 @@ class AccessControlClient(base.BaseContrailClient):
     Service class for access control test cases
     """
 
-    def list_access_control_lists(self, params=None):
+    def list_access_control_lists(self, params=None, **projection):
         """
         :param params:
         :return: list object
         """
         url = '/access-control-lists'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_access_control_lists(self, **kwargs):
@@ -44,17 +41,18 @@ class AccessControlClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/access-control-lists'
-        post_body = json.dumps({'access-control-list': kwargs})
+        post_body = base.json_dumps({'access-control-list': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_access_control_list(self, list_id):
+    def show_access_control_list(self, list_id, **projection):
         """
         :param list_id:
         :return: response object
         """
         url = '/access-control-list/%s' % str(list_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_access_control_list(self, list_id):
@@ -73,19 +71,18 @@ class AccessControlClient(base.BaseContrailClient):
         """
         url = '/access-control-list/%s' % str(list_id)
         post_data = {'access-control-list': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def list_api_access_lists(self, params=None):
+    def list_api_access_lists(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/api-access-lists'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_api_access_lists(self, **kwargs):
@@ -94,17 +91,18 @@ class AccessControlClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/api-access-lists'
-        post_body = json.dumps({'api-access-list': kwargs})
+        post_body = base.json_dumps({'api-access-list': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_api_access_list(self, list_id):
+    def show_api_access_list(self, list_id, **projection):
         """
         :param list_id:
         :return: response object
         """
         url = '/api-access-list/%s' % str(list_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_api_access_list(self, list_id):
@@ -123,7 +121,7 @@ class AccessControlClient(base.BaseContrailClient):
         """
         url = '/api-access-list/%s' % str(list_id)
         post_data = {'api-access-list': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
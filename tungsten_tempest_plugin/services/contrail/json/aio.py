@@ -0,0 +1,176 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+asyncio front end for the Contrail service clients
+
+This module uses Python 3.5 syntax and cannot be imported on Python 2,
+where the rest of the plugin still runs; nothing else in the plugin
+imports it.
+
+Any synchronous client, ``ContrailClient`` or one of the typed ones, can be
+wrapped so that its methods become coroutines::
+
+    client = aio.AsyncClient.from_auth_provider(
+        vn_client.VirtualNetworkClient, auth_provider, 'sdn', region,
+        'publicURL')
+    bodies = [{'fq_name': ['default-domain', 'admin', 'vn-%d' % i],
+               'parent_type': 'project'} for i in range(500)]
+    results = await aio.gather_bounded(
+        (client.create_virtual_networks(**body) for body in bodies),
+        limit=20)
+
+The HTTP calls themselves run on a thread pool, so the tempest auth
+provider, the shared keep-alive transport and the response handling of
+the synchronous clients are reused unchanged.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import threading
+
+from tempest import config
+
+CONF = config.CONF
+
+_executor = {'pool': None, 'workers': 0}
+_executor_lock = threading.Lock()
+_END = object()
+
+# asyncio.get_running_loop only exists from Python 3.7 on; inside a
+# coroutine get_event_loop returns the same loop on older versions.
+_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+def get_executor(workers=None):
+    """Return the thread pool shared by every AsyncClient.
+
+    It is sized like the keep-alive connection pool, so requests in flight
+    do not open connections the pool would have to throw away, unless
+    ``workers`` asks for more threads. A larger pool then replaces the
+    shared one; calls already submitted to the old pool complete there.
+
+    :param workers: minimum number of threads the pool must have
+    """
+    workers = max(workers or 0, CONF.sdn.http_pool_maxsize)
+    with _executor_lock:
+        if workers > _executor['workers']:
+            previous = _executor['pool']
+            _executor['pool'] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers)
+            _executor['workers'] = workers
+            if previous is not None:
+                previous.shutdown(wait=False)
+        return _executor['pool']
+
+
+class AsyncIterator(object):
+    """Async iterator over a blocking iterator such as an iter_* method."""
+
+    def __init__(self, iterator, run):
+        self._iterator = iterator
+        self._run = run
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self._run(next, self._iterator, _END)
+        if item is _END:
+            raise StopAsyncIteration
+        return item
+
+
+class AsyncClient(object):
+    """Wraps a synchronous Contrail client, exposing its methods as coroutines.
+
+    Public methods keep their names and arguments. Generators, as returned
+    by ``ContrailClient.iter_*``, come back as ``AsyncIterator`` objects
+    that fetch the next page off the event loop. Other attributes are
+    passed through untouched.
+
+    :param client: synchronous service client object
+    :param executor: concurrent.futures executor, defaults to the shared one
+    """
+
+    def __init__(self, client, executor=None):
+        self.client = client
+        self._executor = executor
+
+    @classmethod
+    def from_auth_provider(cls, client_class, auth_provider, *args,
+                           **kwargs):
+        """Build ``client_class`` for ``auth_provider`` and wrap it.
+
+        :param client_class: synchronous service client class
+        :param auth_provider: tempest auth provider of the credential set
+        :param args: positional arguments for the client constructor
+        :param kwargs: keyword arguments for the client constructor, plus
+                       an optional ``executor``
+        :return: AsyncClient object
+        """
+        executor = kwargs.pop('executor', None)
+        return cls(client_class(auth_provider, *args, **kwargs),
+                   executor=executor)
+
+    @property
+    def auth_provider(self):
+        return self.client.auth_provider
+
+    async def _run(self, func, *args, **kwargs):
+        return await _running_loop().run_in_executor(
+            self._executor or get_executor(),
+            functools.partial(func, *args, **kwargs))
+
+    def __getattr__(self, name):
+        attr = getattr(self.client, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            result = await self._run(attr, *args, **kwargs)
+            if inspect.isgenerator(result):
+                return AsyncIterator(result, self._run)
+            return result
+
+        self.__dict__[name] = method
+        return method
+
+
+async def gather_bounded(aws, limit=10, return_exceptions=False):
+    """Await ``aws`` with at most ``limit`` of them running at a time.
+
+    The shared executor is grown to ``limit`` threads if needed, so
+    AsyncClient calls do run ``limit`` at a time; clients built with their
+    own executor are bounded by it as well.
+
+    :param aws: iterable of coroutines or other awaitables
+    :param limit: maximum number of awaitables in flight
+    :param return_exceptions: return exceptions as results instead of
+                              raising the first one, as asyncio.gather does
+    :return: list of results in the order of ``aws``
+    """
+    get_executor(limit)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*[bounded(aw) for aw in aws],
+                                return_exceptions=return_exceptions)
@@ -17,8 +17,6 @@
 Tempest service class for alarm client test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,16 +26,15 @@ class AlarmClient(base.BaseContrailClient):
     Service class for alarm test cases
     """
 
-    def list_alarms(self, params=None):
+    def list_alarms(self, params=None, **projection):
         """
         :param params:
         :return: map object
         """
         url = '/alarms'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_alarms(self, **kwargs):
@@ -46,21 +43,20 @@ class AlarmClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/alarms'
-        resp, body = self.post(url, json.dumps({'alarm': kwargs}))
-        body = json.loads(body)
+        resp, body = self.post(url, base.json_dumps({'alarm': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_alarm(self, uuid, params=None):
+    def show_alarm(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
         :return: map object
         """
         url = '/alarm/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_alarm(self, uuid, **kwargs):
@@ -70,8 +66,8 @@ class AlarmClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/alarm/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'alarm': kwargs}))
-        body = json.loads(body)
+        resp, body = self.put(url, base.json_dumps({'alarm': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_alarm(self, uuid):
@@ -17,8 +17,6 @@
 Tempest service class for alarm ip client test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,14 +26,13 @@ class AliasIPsClient(base.BaseContrailClient):
     Service class for alias ip test cases
     """
 
-    def list_alias_ip_pools(self, params=None):
+    def list_alias_ip_pools(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/alias-ip-pools'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_alias_ip_pools(self, **kwargs):
@@ -44,17 +41,18 @@ class AliasIPsClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/alias-ip-pools'
-        post_body = json.dumps({'alias-ip-pool': kwargs})
+        post_body = base.json_dumps({'alias-ip-pool': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_alias_ip_pool(self, pool_id):
+    def show_alias_ip_pool(self, pool_id, **projection):
         """
         :param pool_id:
         :return: response object
         """
         url = '/alias-ip-pool/%s' % str(pool_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_alias_ip_pool(self, pool_id):
@@ -73,19 +71,18 @@ class AliasIPsClient(base.BaseContrailClient):
         """
         url = '/alias-ip-pool/%s' % str(pool_id)
         post_data = {'alias-ip-pool': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def list_alias_ips(self, params=None):
+    def list_alias_ips(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/alias-ips'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_alias_ips(self, **kwargs):
@@ -94,17 +91,18 @@ class AliasIPsClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/alias-ips'
-        post_body = json.dumps({'alias-ip': kwargs})
+        post_body = base.json_dumps({'alias-ip': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_alias_ip(self, ip_id):
+    def show_alias_ip(self, ip_id, **projection):
         """
         :param ip_id:
         :return: response object
         """
         url = '/alias-ip/%s' % str(ip_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_alias_ip(self, ip_id):
@@ -123,7 +121,7 @@ class AliasIPsClient(base.BaseContrailClient):
         """
         url = '/alias-ip/%s' % str(ip_id)
         post_data = {'alias-ip': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
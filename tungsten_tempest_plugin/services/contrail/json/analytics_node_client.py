@@ -17,8 +17,6 @@
 Tempest service class for analytics node test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,22 +26,22 @@ class AnalyticsNodeClient(base.BaseContrailClient):
     Service class for analytics node test cases
     """
 
-    def list_analytics_nodes(self, params=None):
+    def list_analytics_nodes(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/analytics-nodes'
-        if params:
-            url += '?{0}'.format(urllib.urlencode(params))
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
-    def show_analytics_node(self, uuid):
+    def show_analytics_node(self, uuid, **projection):
         """
         :param uuid:
         :return: response object
         """
         url = '/analytics-node/{0}'.format(uuid)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def create_analytics_nodes(self, **kwargs):
@@ -52,9 +50,9 @@ class AnalyticsNodeClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/analytics-nodes'
-        post_body = json.dumps({'analytics-node': kwargs})
+        post_body = base.json_dumps({'analytics-node': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_analytics_node(self, uuid, **kwargs):
@@ -64,9 +62,9 @@ class AnalyticsNodeClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/analytics-node/{0}'.format(uuid)
-        put_body = json.dumps({'analytics-node': kwargs})
+        put_body = base.json_dumps({'analytics-node': kwargs})
         resp, body = self.put(url, put_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_analytics_node(self, uuid):
@@ -17,8 +17,6 @@
 Tempest service class for attachment clients test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,14 +26,13 @@ class AttachmentsClient(base.BaseContrailClient):
     Service class for attachment client test cases
     """
 
-    def list_provider_attachments(self, params=None):
+    def list_provider_attachments(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/provider-attachments'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_provider_attachments(self, **kwargs):
@@ -44,17 +41,18 @@ class AttachmentsClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/provider-attachments'
-        post_body = json.dumps({'provider-attachment': kwargs})
+        post_body = base.json_dumps({'provider-attachment': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_provider_attachment(self, appliance_id):
+    def show_provider_attachment(self, appliance_id, **projection):
         """
         :param appliance_id:
         :return: response object
         """
         url = '/provider-attachment/%s' % str(appliance_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_provider_attachment(self, appliance_id):
@@ -73,19 +71,18 @@ class AttachmentsClient(base.BaseContrailClient):
         """
         url = '/provider-attachment/%s' % str(appliance_id)
         post_data = {'provider-attachment': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def list_customer_attachments(self, params=None):
+    def list_customer_attachments(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/customer-attachments'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_customer_attachments(self, **kwargs):
@@ -94,17 +91,18 @@ class AttachmentsClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/customer-attachments'
-        post_body = json.dumps({'customer-attachment': kwargs})
+        post_body = base.json_dumps({'customer-attachment': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_customer_attachment(self, appliance_id):
+    def show_customer_attachment(self, appliance_id, **projection):
         """
         :param appliance_id:
         :return: response object
         """
         url = '/customer-attachment/%s' % str(appliance_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_customer_attachment(self, appliance_id):
@@ -123,7 +121,7 @@ class AttachmentsClient(base.BaseContrailClient):
         """
         url = '/customer-attachment/%s' % str(appliance_id)
         post_data = {'customer-attachment': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
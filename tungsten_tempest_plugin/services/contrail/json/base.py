@@ -17,15 +17,296 @@
 Base service class for all service classes
 """
 
+import json
+import re
+import sys
+import time
+
 from oslo_log import log as logging
+from oslo_serialization import jsonutils
+import six
+from six.moves.urllib import parse as urllib
+from tempest import config
 from tempest.lib.common import rest_client
+from tempest.lib import exceptions
+
+from tungsten_tempest_plugin.common import teardown
+from tungsten_tempest_plugin.services.contrail.json import cache
+from tungsten_tempest_plugin.services.contrail.json import http_pool
+from tungsten_tempest_plugin.services.contrail.json import metrics
+from tungsten_tempest_plugin.services.contrail.json import rate_limit
+from tungsten_tempest_plugin.services.contrail.json import retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CONF = config.CONF
 LOG = logging.getLogger(__name__)
 
+# Query parameters of the config API that trim what a GET returns.
+PROJECTION_PARAMS = ('fields', 'detail', 'exclude_back_refs',
+                     'exclude_children')
+
+# GET requests eligible for revalidation: a single object read without
+# its back references and children, which change without touching the
+# object's last_modified.
+_CACHEABLE_QUERY = {'exclude_back_refs': ['true'],
+                    'exclude_children': ['true']}
+_OBJECT_URL_RE = re.compile(r'^/[a-z0-9-]+/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-'
+                            r'[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+_LAST_MODIFIED_RE = re.compile(br'"last_modified":\s*"([^"]*)"')
+
+# JSON codec used by every Contrail client. orjson is used when installed;
+# otherwise the stdlib decoder is fed the response bytes directly, which
+# skips the str round trip jsonutils.loads goes through (stdlib json only
+# accepts bytes from Python 3.6 on).
+if orjson is not None:
+    JSON_BACKEND = 'orjson'
+    _loads = orjson.loads
+elif six.PY2 or sys.version_info >= (3, 6):
+    JSON_BACKEND = 'json'
+    _loads = json.loads
+else:
+    JSON_BACKEND = 'jsonutils'
+    _loads = jsonutils.loads
+
+
+def json_loads(data):
+    """Decode a JSON document, preferably straight from response bytes."""
+    return _loads(data)
+
+
+def json_dumps(obj):
+    """Encode ``obj`` as a JSON request body.
+
+    orjson returns bytes, which the HTTP layer sends as is. Objects it
+    cannot serialize fall back to jsonutils, which knows about datetimes
+    and other non-JSON types.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return jsonutils.dumps(obj)
+
 
 class BaseContrailClient(rest_client.RestClient):
     """Base Tempest REST client for Designate API"""
 
+    def __init__(self, *args, **kwargs):
+        super(BaseContrailClient, self).__init__(*args, **kwargs)
+        # Replace the per-client closing transport with the keep-alive one
+        # shared by every Contrail client using the same TLS settings.
+        if CONF.sdn.http_pool_enabled and not kwargs.get('proxy_url'):
+            self.http_obj = http_pool.get_http(
+                disable_ssl_certificate_validation=self.dscv,
+                ca_certs=kwargs.get('ca_certs'),
+                timeout=kwargs.get('http_timeout'),
+                follow_redirects=kwargs.get('follow_redirects', True),
+                maxsize=CONF.sdn.http_pool_maxsize)
+        if CONF.sdn.conditional_get:
+            cache.response_cache.configure(
+                CONF.sdn.conditional_get_cache_size)
+        self.retry_policy = retry.RetryPolicy.from_config(CONF.sdn)
+
+    @staticmethod
+    def _query_url(url, params=None, **projection):
+        """Append filter ``params`` and projection options to ``url``.
+
+        :param params: dict of query parameters passed through as is
+        :param projection: ``fields`` (list or comma separated names),
+                           ``detail``, ``exclude_back_refs`` and
+                           ``exclude_children`` (booleans)
+        :return: url with its query string
+        """
+        unknown = set(projection) - set(PROJECTION_PARAMS)
+        if unknown:
+            raise TypeError('unexpected projection option(s): %s'
+                            % ', '.join(sorted(unknown)))
+        query = dict(params or {})
+        query.update(projection)
+        for name in PROJECTION_PARAMS:
+            value = query.get(name)
+            if value is None:
+                query.pop(name, None)
+            elif isinstance(value, bool):
+                query[name] = 'true' if value else 'false'
+            elif name == 'fields' and not isinstance(value,
+                                                     six.string_types):
+                query[name] = ','.join(value)
+        if query:
+            url += '?' + urllib.urlencode(query, doseq=1)
+        return url
+
+    def _principal(self):
+        """Identify who the next request is made as, roles included."""
+        token, auth_data = self.auth_provider.get_auth()
+        try:
+            return (auth_data['user']['id'], auth_data['project']['id'],
+                    tuple(sorted(role['id'] for role in auth_data['roles'])))
+        except (KeyError, TypeError):
+            return token
+
+    @staticmethod
+    def _object_version(body):
+        # Only id_perms carries last_modified in an object body, and
+        # matching the raw bytes spares decoding the whole object.
+        if isinstance(body, six.text_type):
+            body = body.encode('utf-8')
+        match = _LAST_MODIFIED_RE.search(body or b'')
+        return match.group(1) if match else None
+
+    def _revalidate(self, url, entry):
+        """Return the cached response if the object did not change."""
+        if entry.etag or entry.last_modified:
+            conditions = {}
+            if entry.etag:
+                conditions['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                conditions['If-Modified-Since'] = entry.last_modified
+            resp, body = super(BaseContrailClient, self).get(
+                url, headers=conditions, extra_headers=True)
+            if resp.status == 304:
+                return entry.response, entry.body
+            return resp, body
+        if entry.version is None:
+            return None
+        resp, body = super(BaseContrailClient, self).get(
+            self._query_url(url.partition('?')[0], fields=['id_perms']))
+        if self._object_version(body) == entry.version:
+            return entry.response, entry.body
+        return None
+
+    @staticmethod
+    def _cacheable(url):
+        path, _, query = url.partition('?')
+        return (_OBJECT_URL_RE.match(path) is not None and
+                urllib.parse_qs(query) == _CACHEABLE_QUERY)
+
+    def get(self, url, headers=None, extra_headers=False, chunked=False):
+        if (not CONF.sdn.conditional_get or headers or chunked or
+                not self._cacheable(url)):
+            return super(BaseContrailClient, self).get(
+                url, headers=headers, extra_headers=extra_headers,
+                chunked=chunked)
+        principal = self._principal()
+        entry = cache.response_cache.get(principal, url)
+        result = None
+        if entry is not None:
+            result = self._revalidate(url, entry)
+            if result is not None and result[0] is entry.response:
+                cache.response_cache.revalidated += 1
+                return result
+            cache.response_cache.refetched += 1
+        if result is None:
+            result = super(BaseContrailClient, self).get(url)
+        resp, body = result
+        if resp.status == 200:
+            entry = cache.ResponseEntry(
+                resp, body, resp.get('etag'), resp.get('last-modified'),
+                self._object_version(body))
+            cache.response_cache.add(principal, url, entry)
+        return resp, body
+
+    def _send(self, method, url, headers=None, body=None, chunked=False):
+        # base_url goes through the service catalog, so only look it up
+        # when rate limiting is on.
+        if CONF.sdn.rate_limit:
+            rate_limit.get_limiter(self.base_url).acquire()
+        return super(BaseContrailClient, self)._request(
+            method, url, headers=headers, body=body, chunked=chunked)
+
+    def _request(self, method, url, headers=None, body=None, chunked=False):
+        resp, resp_body = self._send(method, url, headers=headers,
+                                     body=body, chunked=chunked)
+        policy = self.retry_policy
+        if not policy.enabled or chunked:
+            return resp, resp_body
+        start = time.time()
+        attempt = 0
+        while policy.should_retry(method, resp.status, attempt):
+            delay = policy.delay(attempt)
+            if time.time() - start + delay > policy.max_time:
+                break
+            LOG.warning('%s %s returned %d, retrying in %.2fs (%d/%d)',
+                        method, url, resp.status, delay, attempt + 1,
+                        policy.attempts)
+            retry.retry_stats.record_retry(resp.status)
+            if metrics.recorder.enabled:
+                metrics.recorder.record_retry(method, url, resp.status)
+            time.sleep(delay)
+            attempt += 1
+            resp, resp_body = self._send(method, url, headers=headers,
+                                         body=body, chunked=chunked)
+        if attempt and policy.retryable(method, resp.status):
+            retry.retry_stats.record_exhausted()
+        return resp, resp_body
+
+    def request(self, method, url, extra_headers=False, headers=None,
+                body=None, chunked=False):
+        if method != 'GET' and CONF.sdn.conditional_get:
+            # A write may change any object, its parent's children or its
+            # targets' back references.
+            cache.response_cache.clear()
+        if not metrics.recorder.enabled:
+            return super(BaseContrailClient, self).request(
+                method, url, extra_headers=extra_headers, headers=headers,
+                body=body, chunked=chunked)
+        start = time.time()
+        status = None
+        resp_body = None
+        try:
+            resp, resp_body = super(BaseContrailClient, self).request(
+                method, url, extra_headers=extra_headers, headers=headers,
+                body=body, chunked=chunked)
+            status = resp.status
+            return resp, resp_body
+        except exceptions.RestClientException as exc:
+            status = getattr(getattr(exc, 'resp', None), 'status', None)
+            raise
+        finally:
+            metrics.recorder.record(
+                method, url, status,
+                len(body) if body and not chunked else 0,
+                len(resp_body) if resp_body else 0,
+                time.time() - start)
+
+    def post(self, url, body, headers=None, extra_headers=False,
+             chunked=False):
+        resp, resp_body = super(BaseContrailClient, self).post(
+            url, body, headers=headers, extra_headers=extra_headers,
+            chunked=chunked)
+        if CONF.sdn.teardown_workers > 1 and not chunked:
+            # Parents and references of created objects order teardown.
+            teardown.object_graph.observe('POST', url, body, resp_body)
+        return resp, resp_body
+
+    def put(self, url, body, headers=None, extra_headers=False,
+            chunked=False):
+        resp, resp_body = super(BaseContrailClient, self).put(
+            url, body, headers=headers, extra_headers=extra_headers,
+            chunked=chunked)
+        if CONF.sdn.teardown_workers > 1 and not chunked:
+            teardown.object_graph.observe('PUT', url, body, resp_body)
+        return resp, resp_body
+
+    def delete(self, url, headers=None, body=None, extra_headers=False):
+        # Whatever the outcome, a cached fq_name for this object can no
+        # longer be trusted.
+        uuid = url.split('?', 1)[0].rstrip('/').rsplit('/', 1)[-1]
+        cache.fqname_cache.invalidate(uuid)
+        try:
+            result = super(BaseContrailClient, self).delete(
+                url, headers=headers, body=body, extra_headers=extra_headers)
+        except exceptions.NotFound:
+            teardown.object_graph.forget(uuid)
+            raise
+        teardown.object_graph.forget(uuid)
+        return result
+
 
 class ResponseBody(dict):
     """Class that wraps an http response and dict body into a single value.
@@ -17,8 +17,6 @@
 Tempest service class for BGP as a service test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,14 +26,13 @@ class BGPAsAServiceClient(base.BaseContrailClient):
     Service class for bgp as a service test cases
     """
 
-    def list_bgp_as_a_services(self, params=None):
+    def list_bgp_as_a_services(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/bgp-as-a-services'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_bgp_as_a_services(self, **kwargs):
@@ -44,17 +41,18 @@ class BGPAsAServiceClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/bgp-as-a-services'
-        post_body = json.dumps({'bgp-as-a-service': kwargs})
+        post_body = base.json_dumps({'bgp-as-a-service': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_bgp_as_a_service(self, bgp_id):
+    def show_bgp_as_a_service(self, bgp_id, **projection):
         """
         :param bgp_id:
         :return: response object
         """
         url = '/bgp-as-a-service/%s' % str(bgp_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_bgp_as_a_service(self, bgp_id):
@@ -73,7 +71,7 @@ class BGPAsAServiceClient(base.BaseContrailClient):
         """
         url = '/bgp-as-a-service/%s' % str(bgp_id)
         post_data = {'bgp-as-a-service': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
@@ -0,0 +1,210 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Client side caches shared by the Contrail service clients
+"""
+
+import collections
+import threading
+import time
+
+
+class LRUCache(object):
+    """Thread-safe mapping with LRU eviction and an optional entry TTL.
+
+    :param maxsize: maximum number of entries, 0 disables the cache
+    :param ttl: seconds an entry stays valid, None keeps it until evicted
+    :param on_evict: callable invoked with (key, value) whenever an entry
+                     is dropped because of size, age or invalidation
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, on_evict=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._on_evict = on_evict
+        self._data = collections.OrderedDict()
+        self.lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def _drop(self, key):
+        value, _ = self._data.pop(key)
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def get(self, key, default=None):
+        with self.lock:
+            try:
+                value, expires = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires is not None and expires < time.time():
+                self._drop(key)
+                self.evictions += 1
+                self.misses += 1
+                return default
+            # Re-insert to mark the entry as most recently used.
+            del self._data[key]
+            self._data[key] = (value, expires)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        if not self.maxsize:
+            return
+        expires = time.time() + self.ttl if self.ttl else None
+        with self.lock:
+            if key in self._data:
+                self._drop(key)
+            self._data[key] = (value, expires)
+            while len(self._data) > self.maxsize:
+                self._drop(next(iter(self._data)))
+                self.evictions += 1
+
+    def pop(self, key):
+        """Remove ``key`` and return its value, or None if it is absent."""
+        with self.lock:
+            if key not in self._data:
+                return None
+            value = self._data[key][0]
+            self._drop(key)
+            return value
+
+    def clear(self):
+        with self.lock:
+            for key in list(self._data):
+                self._drop(key)
+
+    def resize(self, maxsize, ttl=None):
+        with self.lock:
+            self.maxsize = maxsize
+            self.ttl = ttl
+            while len(self._data) > maxsize:
+                self._drop(next(iter(self._data)))
+                self.evictions += 1
+
+    def stats(self):
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data)}
+
+
+FqNameEntry = collections.namedtuple('FqNameEntry',
+                                     ['uuid', 'type', 'fq_name', 'response'])
+
+
+class FqNameCache(object):
+    """Bidirectional fq_name <-> uuid cache.
+
+    Entries are stored once, keyed by uuid, with a secondary index on
+    (type, fq_name) that is kept in sync on eviction and invalidation.
+    """
+
+    def __init__(self, maxsize=1024, ttl=300):
+        self._index = {}
+        self._entries = LRUCache(maxsize, ttl, on_evict=self._unindex)
+        self.invalidations = 0
+
+    def _unindex(self, uuid, entry):
+        key = (entry.type, entry.fq_name)
+        if self._index.get(key) == uuid:
+            del self._index[key]
+
+    def configure(self, maxsize, ttl):
+        self._entries.resize(maxsize, ttl or None)
+
+    def add(self, uuid, obj_type, fq_name, response=None):
+        if not uuid or not obj_type or not fq_name:
+            return
+        if not self._entries.maxsize:
+            return
+        entry = FqNameEntry(uuid, obj_type, tuple(fq_name), response)
+        with self._entries.lock:
+            self._entries.set(uuid, entry)
+            self._index[(entry.type, entry.fq_name)] = uuid
+
+    def get_by_fqname(self, obj_type, fq_name):
+        """Return the FqNameEntry for (obj_type, fq_name) or None."""
+        uuid = self._index.get((obj_type, tuple(fq_name or ())))
+        if uuid is None:
+            self._entries.misses += 1
+            return None
+        return self._entries.get(uuid)
+
+    def get_by_uuid(self, uuid):
+        """Return the FqNameEntry for ``uuid`` or None."""
+        return self._entries.get(uuid)
+
+    def invalidate(self, uuid):
+        if self._entries.pop(uuid) is not None:
+            self.invalidations += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        stats = self._entries.stats()
+        stats['invalidations'] = self.invalidations
+        return stats
+
+
+fqname_cache = FqNameCache()
+
+
+ResponseEntry = collections.namedtuple(
+    'ResponseEntry', ['response', 'body', 'etag', 'last_modified',
+                      'version'])
+
+
+class ResponseCache(object):
+    """Last GET response of single objects, kept per principal.
+
+    Entries are keyed by (principal, url), where the principal identifies
+    the user, project and roles the response was fetched with, so a body
+    read under one role is never handed out under another.
+    """
+
+    def __init__(self, maxsize=256):
+        self._entries = LRUCache(maxsize)
+        self.revalidated = 0
+        self.refetched = 0
+
+    def configure(self, maxsize):
+        self._entries.resize(maxsize)
+
+    def get(self, principal, url):
+        return self._entries.get((principal, url))
+
+    def add(self, principal, url, entry):
+        self._entries.set((principal, url), entry)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        stats = self._entries.stats()
+        stats['revalidated'] = self.revalidated
+        stats['refetched'] = self.refetched
+        return stats
+
+
+response_cache = ResponseCache()
@@ -17,8 +17,6 @@
 Tempest service class for config test cases
 """
 
-from oslo_serialization import jsonutils as json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -29,14 +27,13 @@ class ConfigClient(base.BaseContrailClient):
     """
 
     # Below are client codes for global-system-config APIs
-    def list_global_system_configs(self, params=None):
+    def list_global_system_configs(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/global-system-configs'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_global_system_configs(self, **kwargs):
@@ -45,17 +42,18 @@ class ConfigClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/global-system-configs'
-        post_body = json.dumps({'global-system-config': kwargs})
+        post_body = base.json_dumps({'global-system-config': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_global_system_config(self, template_id):
+    def show_global_system_config(self, template_id, **projection):
         """
         :param template_id:
         :return: response object
         """
         url = '/global-system-config/%s' % str(template_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_global_system_config(self, template_id):
@@ -74,19 +72,20 @@ class ConfigClient(base.BaseContrailClient):
         """
         url = '/global-system-config/%s' % str(template_id)
         put_data = {'global-system-config': kwargs}
-        req_put_data = json.dumps(put_data)
+        req_put_data = base.json_dumps(put_data)
         resp, body = self.put(url, req_put_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     # Below are client codes for config-node APIs
-    def list_config_nodes(self):
+    def list_config_nodes(self, **projection):
         """
         :return: map object
         """
         url = '/config-nodes'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_config_nodes(self, **kwargs):
@@ -95,9 +94,9 @@ class ConfigClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/config-nodes'
-        post_body = json.dumps({'config-node': kwargs})
+        post_body = base.json_dumps({'config-node': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_config_node(self, node_id):
@@ -108,12 +107,13 @@ class ConfigClient(base.BaseContrailClient):
         url = '/config-node/%s' % str(node_id)
         return self.delete(url)
 
-    def show_config_node(self, node_id):
+    def show_config_node(self, node_id, **projection):
         """
         :param node_id:
         :return: response object
         """
         url = '/config-node/%s' % str(node_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def update_config_node(self, node_id, **kwargs):
@@ -124,19 +124,20 @@ class ConfigClient(base.BaseContrailClient):
         """
         url = '/config-node/%s' % str(node_id)
         put_data = {'config-node': kwargs}
-        req_put_data = json.dumps(put_data)
+        req_put_data = base.json_dumps(put_data)
         resp, body = self.put(url, req_put_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     # Below are client codes for config-root APIs
-    def list_config_roots(self):
+    def list_config_roots(self, **projection):
         """
         :return: map object
         """
         url = '/config-roots'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_config_roots(self, **kwargs):
@@ -145,9 +146,9 @@ class ConfigClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/config-roots'
-        post_body = json.dumps({'config-root': kwargs})
+        post_body = base.json_dumps({'config-root': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_config_root(self, root_id):
@@ -158,12 +159,13 @@ class ConfigClient(base.BaseContrailClient):
         url = '/config-root/%s' % str(root_id)
         return self.delete(url)
 
-    def show_config_root(self, root_id):
+    def show_config_root(self, root_id, **projection):
         """
         :param root_id:
         :return: response object
         """
         url = '/config-root/%s' % str(root_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def update_config_root(self, root_id, **kwargs):
@@ -174,7 +176,7 @@ class ConfigClient(base.BaseContrailClient):
         """
         url = '/config-root/%s' % str(root_id)
         put_data = {'config-root': kwargs}
-        req_put_data = json.dumps(put_data)
+        req_put_data = base.json_dumps(put_data)
         resp, body = self.put(url, req_put_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
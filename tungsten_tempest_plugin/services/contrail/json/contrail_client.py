@@ -13,22 +13,110 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from oslo_serialization import jsonutils as json
-
+from oslo_log import log as logging
 from six.moves import urllib
 from tempest.lib.common import rest_client as service_client
 
+from tungsten_tempest_plugin.common import concurrency
 from tungsten_tempest_plugin.services.contrail.json import base
 
+LOG = logging.getLogger(__name__)
+
+DEFAULT_PAGE_LIMIT = 200
+
+# Resource types of the Contrail 5.0 configuration schema served by the
+# generic client. CRUD methods for each of them are generated on the class
+# at import time; any other type is still resolved through __getattr__.
+RESOURCE_TYPES = (
+    'access_control_list',
+    'address_group',
+    'alarm',
+    'alias_ip',
+    'alias_ip_pool',
+    'analytics_node',
+    'api_access_list',
+    'application_policy_set',
+    'bgp_as_a_service',
+    'bgp_router',
+    'bgpvpn',
+    'bridge_domain',
+    'config_node',
+    'config_root',
+    'customer_attachment',
+    'database_node',
+    'discovery_service_assignment',
+    'domain',
+    'dsa_rule',
+    'fabric',
+    'fabric_namespace',
+    'firewall_policy',
+    'firewall_rule',
+    'floating_ip',
+    'floating_ip_pool',
+    'forwarding_class',
+    'global_qos_config',
+    'global_system_config',
+    'global_vrouter_config',
+    'instance_ip',
+    'interface_route_table',
+    'loadbalancer',
+    'loadbalancer_healthmonitor',
+    'loadbalancer_listener',
+    'loadbalancer_member',
+    'loadbalancer_pool',
+    'logical_interface',
+    'logical_router',
+    'namespace',
+    'network_ipam',
+    'network_policy',
+    'physical_interface',
+    'physical_router',
+    'policy_management',
+    'port_tuple',
+    'project',
+    'provider_attachment',
+    'qos_config',
+    'qos_queue',
+    'route_aggregate',
+    'route_table',
+    'route_target',
+    'routing_instance',
+    'routing_policy',
+    'security_group',
+    'service_appliance',
+    'service_appliance_set',
+    'service_group',
+    'service_health_check',
+    'service_instance',
+    'service_object',
+    'service_template',
+    'subnet',
+    'tag',
+    'tag_type',
+    'virtual_ip',
+    'virtual_machine',
+    'virtual_machine_interface',
+    'virtual_network',
+    'virtual_router',
+)
+
 
 class ContrailClient(base.BaseContrailClient):
     """Generic client for Contrail API
 
     Client implements all basic CRUD functions for Contrail API.
     http://www.opencontrail.org/documentation/api/r5.0/contrail_openapi.html
+
+    For every type in ``RESOURCE_TYPES`` the class carries ``list_<plural>``,
+    ``iter_<plural>``, ``show_<name>``, ``create_<name>``, ``update_<name>``
+    and ``delete_<name>`` methods, so they show up in ``dir()`` and are
+    dispatched like any other method.
     """
 
-    def _pluralize(self, resource_name):
+    resource_types = RESOURCE_TYPES
+
+    @staticmethod
+    def _pluralize(resource_name):
         """Contrail API ignores common rules for pluralization. For example:
 
         .. Fetch a specific firewall-policy
@@ -42,7 +130,8 @@ class ContrailClient(base.BaseContrailClient):
         """
         return resource_name + 's'
 
-    def _underscore_to_dash(self, name):
+    @staticmethod
+    def _underscore_to_dash(name):
         return name.replace("_", "-")
 
     def _build_uri(self, name, **kwargs):
@@ -51,78 +140,198 @@ class ContrailClient(base.BaseContrailClient):
             uri += '?' + urllib.parse.urlencode(kwargs, doseq=1)
         return uri
 
-    def _lister(self, plural_name):
-        def _list(**filters):
-            uri = self._build_uri(plural_name, **filters)
-            resp, body = self.get(uri)
-            result = {plural_name: json.loads(body)}
-            self.expected_success(200, resp.status)
-            return service_client.ResponseBody(resp, result)
+    def _list(self, plural_name, uri, **filters):
+        resp, body = self.get(self._query_url(uri, filters))
+        result = {plural_name: base.json_loads(body)}
+        self.expected_success(200, resp.status)
+        return service_client.ResponseBody(resp, result)
 
-        return _list
+    def _iter(self, plural_name, uri, page_limit=DEFAULT_PAGE_LIMIT,
+              count=False, **filters):
+        """Iterate over a collection one page at a time.
 
-    def _deleter(self, resource_name):
-        def _delete(resource_id):
-            uri = '%s/%s' % (resource_name, resource_id)
-            uri = self._build_uri(uri)
-            resp, body = self.delete(uri)
-            self.expected_success(200, resp.status)
-            return service_client.ResponseBody(resp, body)
+        :param page_limit: number of objects fetched per request
+        :param count: return only the size of the collection
+        :param filters: additional query parameters
+        :return: generator of objects, or an int if ``count`` is set
+        """
+        if count:
+            return self._count(uri, **filters)
+        return self._iter_pages(uri, page_limit, **filters)
 
-        return _delete
+    def _count(self, uri, **filters):
+        resp, body = self.get(self._query_url(uri, dict(filters,
+                                                        count='true')))
+        self.expected_success(200, resp.status)
+        body = base.json_loads(body)
+        return body[uri[1:]]['count']
 
-    def _shower(self, resource_name):
-        def _show(resource_id, **fields):
-            uri = '%s/%s' % (resource_name, resource_id)
-            uri = self._build_uri(uri)
+    def _iter_pages(self, uri, page_limit, **filters):
+        """Yield objects of a collection using page_limit/page_marker
 
-            if fields:
-                uri += '?' + urllib.parse.urlencode(fields, doseq=1)
-            resp, body = self.get(uri)
-            body = json.loads(body)
+        Only one page is decoded and held in memory at a time. The API
+        server returns the marker of the next page along with each page and
+        no marker once the collection is exhausted.
+        """
+        key = uri[1:]
+        marker = None
+        while True:
+            params = dict(filters, page_limit=page_limit)
+            if marker:
+                params['page_marker'] = marker
+            resp, body = self.get(self._query_url(uri, params))
             self.expected_success(200, resp.status)
-            return service_client.ResponseBody(resp, body)
+            body = base.json_loads(body)
+            items = body.get(key) or []
+            for item in items:
+                yield item
+            marker = body.get('marker')
+            if not marker or len(items) < page_limit:
+                return
 
-        return _show
+    def _delete(self, path, resource_id):
+        resp, body = self.delete('%s/%s' % (path, resource_id))
+        self.expected_success(200, resp.status)
+        return base.ResponseBody(resp, body)
 
-    def _creater(self, resource_name):
-        def _create(**kwargs):
-            uri = self._build_uri(self._pluralize(resource_name))
-            post_data = json.dumps({
-                self._underscore_to_dash(resource_name): kwargs})
-            resp, body = self.post(uri, post_data)
-            body = json.loads(body)
-            self.expected_success(200, resp.status)
-            return service_client.ResponseBody(resp, body)
-
-        return _create
-
-    def _updater(self, resource_name):
-        def _update(res_id, **kwargs):
-            uri = '%s/%s' % (resource_name, res_id)
-            uri = self._build_uri(uri)
-            put_data = json.dumps({
-                self._underscore_to_dash(resource_name): kwargs})
-            resp, body = self.put(uri, put_data)
-            body = json.loads(body) if body else {}
-            self.expected_success(200, resp.status)
-            return service_client.ResponseBody(resp, body)
+    def _show(self, path, resource_id, **fields):
+        # fields may mix filters with projection options such as
+        # fields=['name', 'fq_name'] or exclude_back_refs=True.
+        uri = self._query_url('%s/%s' % (path, resource_id), fields)
+        resp, body = self.get(uri)
+        self.expected_success(200, resp.status)
+        body = base.json_loads(body)
+        return base.ResponseBody(resp, body)
+
+    def _create(self, uri, key, **kwargs):
+        post_data = base.json_dumps({key: kwargs})
+        resp, body = self.post(uri, post_data)
+        self.expected_success(200, resp.status)
+        body = base.json_loads(body)
+        return base.ResponseBody(resp, body)
+
+    def _update(self, path, key, res_id, **kwargs):
+        put_data = base.json_dumps({key: kwargs})
+        resp, body = self.put('%s/%s' % (path, res_id), put_data)
+        self.expected_success(200, resp.status)
+        body = base.json_loads(body)
+        return base.ResponseBody(resp, body)
+
+    def _run_many(self, operation, resource_name, func, items, workers):
+        if workers is None:
+            workers = base.CONF.sdn.bulk_workers
+        result = concurrency.map_bounded(func, items, workers=workers)
+        stats = result.stats()
+        LOG.info('%s_many %s: %d succeeded, %d failed in %.2fs '
+                 '(%.1f/s, %d workers)', operation, resource_name,
+                 stats['succeeded'], stats['failed'], stats['elapsed'],
+                 stats['per_second'], workers)
+        return result
+
+    def create_many(self, resource_name, bodies, workers=None):
+        """Create one object per element of ``bodies`` concurrently.
+
+        :param resource_name: underscored type name, e.g. virtual_network
+        :param bodies: dicts passed as keyword arguments to create_<type>
+        :param workers: requests in flight, defaults to bulk_workers
+        :return: concurrency.BulkResult in the order of ``bodies``
+        """
+        create = getattr(self, 'create_' + resource_name)
+        return self._run_many('create', resource_name,
+                              lambda body: create(**body), bodies, workers)
 
-        return _update
+    def update_many(self, resource_name, updates, workers=None):
+        """Update objects concurrently.
+
+        :param resource_name: underscored type name, e.g. virtual_network
+        :param updates: (uuid, body) pairs, body is passed to update_<type>
+        :param workers: requests in flight, defaults to bulk_workers
+        :return: concurrency.BulkResult in the order of ``updates``
+        """
+        update = getattr(self, 'update_' + resource_name)
+        return self._run_many('update', resource_name,
+                              lambda item: update(item[0], **item[1]),
+                              updates, workers)
+
+    def delete_many(self, resource_name, resource_ids, workers=None):
+        """Delete objects concurrently.
+
+        :param resource_name: underscored type name, e.g. virtual_network
+        :param resource_ids: uuids of the objects to delete
+        :param workers: requests in flight, defaults to bulk_workers
+        :return: concurrency.BulkResult in the order of ``resource_ids``
+        """
+        delete = getattr(self, 'delete_' + resource_name)
+        return self._run_many('delete', resource_name, delete,
+                              resource_ids, workers)
+
+    @classmethod
+    def supported_operations(cls):
+        """Return the names of all CRUD methods generated on the class."""
+        return sorted(name for name, value in vars(cls).items()
+                      if getattr(value, '_contrail_operation', False))
 
     def __getattr__(self, name):
         """Client entry point
 
-        Once user will call CRUD method it will be managed here.
+        Resource types missing from ``RESOURCE_TYPES`` end up here. The
+        method is built once and cached on the instance, so later calls
+        skip this lookup.
         """
-        method_prefixes = ["list_", "delete_", "show_", "create_", "update_"]
-        method_functors = [self._lister,
-                           self._deleter,
-                           self._shower,
-                           self._creater,
-                           self._updater]
-        for index, prefix in enumerate(method_prefixes):
-            prefix_len = len(prefix)
-            if name[:prefix_len] == prefix:
-                return method_functors[index](name[prefix_len:])
+        for prefix in _OPERATIONS:
+            if name.startswith(prefix) and len(name) > len(prefix):
+                method = _make_method(prefix, name[len(prefix):])
+                bound = method.__get__(self, type(self))
+                self.__dict__[name] = bound
+                return bound
         raise AttributeError(name)
+
+
+_OPERATIONS = {
+    'list_': ContrailClient._list,
+    'iter_': ContrailClient._iter,
+    'delete_': ContrailClient._delete,
+    'show_': ContrailClient._show,
+    'create_': ContrailClient._create,
+    'update_': ContrailClient._update,
+}
+
+
+def _make_method(prefix, name):
+    """Build the CRUD method ``prefix + name`` with its URI precomputed.
+
+    ``name`` is the plural resource name for list_/iter_ and the singular
+    one for every other prefix, as in the method names themselves.
+    """
+    dashed = ContrailClient._underscore_to_dash(name)
+    if prefix in ('list_', 'iter_'):
+        args = (name, '/' + dashed)
+    elif prefix == 'create_':
+        args = ('/' + ContrailClient._pluralize(dashed), dashed)
+    elif prefix == 'update_':
+        args = ('/' + dashed, dashed)
+    else:
+        args = ('/' + dashed,)
+    operation = _OPERATIONS[prefix]
+
+    def method(self, *call_args, **kwargs):
+        return operation(self, *(args + call_args), **kwargs)
+
+    method.__name__ = prefix + name
+    method.__doc__ = operation.__doc__
+    method._contrail_operation = True
+    return method
+
+
+def _add_resource_methods(cls, resource_types):
+    for resource_name in resource_types:
+        plural_name = cls._pluralize(resource_name)
+        for prefix in _OPERATIONS:
+            if prefix in ('list_', 'iter_'):
+                name = plural_name
+            else:
+                name = resource_name
+            setattr(cls, prefix + name, _make_method(prefix, name))
+
+
+_add_resource_methods(ContrailClient, RESOURCE_TYPES)
@@ -17,7 +17,6 @@
 Tempest service class for database test cases
 """
 
-from oslo_serialization import jsonutils as json
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -27,19 +26,21 @@ class ContrailDatabaseClient(base.BaseContrailClient):
     Service class for database test cases
     """
 
-    def list_database_nodes(self):
+    def list_database_nodes(self, **projection):
         """
         :return: response object
         """
         url = '/database-nodes'
+        url = self._query_url(url, **projection)
         return self.get(url)
 
-    def show_database_node(self, db_node_id):
+    def show_database_node(self, db_node_id, **projection):
         """
         :param db_node_id:
         :return: response object
         """
         url = '/database-node/%s' % db_node_id
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def create_databse_nodes(self, **kwargs):
@@ -47,10 +48,10 @@ class ContrailDatabaseClient(base.BaseContrailClient):
         :param kwargs:
         :return: map object
         """
-        post_body = json.dumps({'database-node': kwargs})
+        post_body = base.json_dumps({'database-node': kwargs})
         url = '/database-nodes'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_database_node(self, db_node_id):
@@ -67,8 +68,8 @@ class ContrailDatabaseClient(base.BaseContrailClient):
         :param kwargs:
         :return: map object
         """
-        post_body = json.dumps({'database-node': kwargs})
+        post_body = base.json_dumps({'database-node': kwargs})
         url = '/database-node/%s' % db_node_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
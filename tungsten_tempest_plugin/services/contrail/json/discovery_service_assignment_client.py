@@ -17,8 +17,6 @@
 Tempest service class for database service assignment test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,14 +26,13 @@ class DiscoveryServiceAssignmentClient(base.BaseContrailClient):
     Service class for dsa test cases
     """
 
-    def list_ds_assignments(self, params=None):
+    def list_ds_assignments(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/discovery-service-assignments'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_ds_assignments(self, **kwargs):
@@ -44,17 +41,18 @@ class DiscoveryServiceAssignmentClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/discovery-service-assignments'
-        post_body = json.dumps({'discovery-service-assignment': kwargs})
+        post_body = base.json_dumps({'discovery-service-assignment': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_ds_assignment(self, assignment_id):
+    def show_ds_assignment(self, assignment_id, **projection):
         """
         :param assignment_id:
         :return: response object
         """
         url = '/discovery-service-assignment/%s' % str(assignment_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_ds_assignment(self, assignment_id):
@@ -73,7 +71,7 @@ class DiscoveryServiceAssignmentClient(base.BaseContrailClient):
         """
         url = '/discovery-service-assignment/%s' % str(assignment_id)
         post_data = {'discovery-service-assignment': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
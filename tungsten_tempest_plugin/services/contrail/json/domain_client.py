@@ -17,8 +17,6 @@
 Tempest service class for domain test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -29,16 +27,15 @@ class DomainClient(base.BaseContrailClient):
     """
 
 
-    def list_domains(self, params=None):
+    def list_domains(self, params=None, **projection):
         """
         :param params:
         :return: map object
         """
         url = '/domains'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_domains(self, **kwargs):
@@ -47,21 +44,20 @@ class DomainClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/domains'
-        resp, body = self.post(url, json.dumps({'domain': kwargs}))
-        body = json.loads(body)
+        resp, body = self.post(url, base.json_dumps({'domain': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_domain(self, uuid, params=None):
+    def show_domain(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
         :return: map object
         """
         url = '/domain/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_domain(self, uuid, **kwargs):
@@ -71,8 +67,8 @@ class DomainClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/domain/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'domain': kwargs}))
-        body = json.loads(body)
+        resp, body = self.put(url, base.json_dumps({'domain': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_domain(self, uuid):
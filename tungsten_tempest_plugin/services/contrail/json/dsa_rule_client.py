@@ -17,8 +17,6 @@
 Tempest service class for dsa rule test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,14 +26,13 @@ class DSARuleClient(base.BaseContrailClient):
     Service class for dsa rules test cases
     """
 
-    def list_dsa_rules(self, params=None):
+    def list_dsa_rules(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/dsa-rules'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_dsa_rules(self, **kwargs):
@@ -44,17 +41,18 @@ class DSARuleClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/dsa-rules'
-        post_body = json.dumps({'dsa-rule': kwargs})
+        post_body = base.json_dumps({'dsa-rule': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_dsa_rule(self, dns_id):
+    def show_dsa_rule(self, dns_id, **projection):
         """
         :param dns_id:
         :return: response object
         """
         url = '/dsa-rule/%s' % dns_id
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_dsa_rule(self, dns_id):
@@ -72,7 +70,7 @@ class DSARuleClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/dsa-rule/%s' % dns_id
-        post_body = json.dumps({'dsa-rule': kwargs})
+        post_body = base.json_dumps({'dsa-rule': kwargs})
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
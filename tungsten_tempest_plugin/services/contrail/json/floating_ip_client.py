@@ -17,8 +17,6 @@
 Tempest service class for floating IP test cases
 """
 
-from oslo_serialization import jsonutils as json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -36,10 +34,10 @@ class FloatingIpClient(base.BaseContrailClient):
         uri = '/floating-ip-pools'
 
         post_data = {'floating-ip-pool': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
 
         resp, body = self.post(uri, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def list_floating_ip_pools(self, **kwargs):
@@ -48,12 +46,9 @@ class FloatingIpClient(base.BaseContrailClient):
         :return: map object
         """
         uri = '/floating-ip-pools'
-
-        if kwargs:
-            uri += '?' + urllib.urlencode(kwargs)
-
+        uri = self._query_url(uri, kwargs)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_floating_ip_pool(self, floatingip_pool_id, **kwargs):
@@ -65,10 +60,10 @@ class FloatingIpClient(base.BaseContrailClient):
         uri = '/floating-ip-pool/%s' % floatingip_pool_id
 
         post_data = {'floating-ip-pool': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
 
         resp, body = self.put(uri, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def show_floating_ip_pool(self, floatingip_pool_id, **fields):
@@ -79,14 +74,11 @@ class FloatingIpClient(base.BaseContrailClient):
         """
         uri = '/floating-ip-pool/%s' % floatingip_pool_id
 
-        # fields is a dict which key is 'fields' and value is a
-        # list of field's name. An example:
-        # {'fields': ['id', 'name']}
-        if fields:
-            uri += '?' + urllib.urlencode(fields)
-
+        # fields holds the projection options, for example
+        # {'fields': ['id', 'name'], 'exclude_back_refs': True}
+        uri = self._query_url(uri, **fields)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_floating_ip_pool(self, floatingip_pool_id):
@@ -106,10 +98,10 @@ class FloatingIpClient(base.BaseContrailClient):
         uri = '/floating-ips'
 
         post_data = {'floating-ip': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
 
         resp, body = self.post(uri, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def list_floating_ips(self, **kwargs):
@@ -118,12 +110,9 @@ class FloatingIpClient(base.BaseContrailClient):
         :return: map object
         """
         uri = '/floating-ips'
-
-        if kwargs:
-            uri += '?' + urllib.urlencode(kwargs)
-
+        uri = self._query_url(uri, kwargs)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def show_floating_ip(self, floatingip_id, **fields):
@@ -134,14 +123,11 @@ class FloatingIpClient(base.BaseContrailClient):
         """
         uri = '/floating-ip/%s' % floatingip_id
 
-        # fields is a dict which key is 'fields' and value is a
-        # list of field's name. An example:
-        # {'fields': ['id', 'name']}
-        if fields:
-            uri += '?' + urllib.urlencode(fields)
-
+        # fields holds the projection options, for example
+        # {'fields': ['id', 'name'], 'exclude_back_refs': True}
+        uri = self._query_url(uri, **fields)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_floating_ip(self, floatingip_id, **kwargs):
@@ -153,10 +139,10 @@ class FloatingIpClient(base.BaseContrailClient):
         uri = '/floating-ip/%s' % floatingip_id
 
         post_data = {'floating-ip': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
 
         resp, body = self.put(uri, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_floating_ip(self, floatingip_id):
@@ -13,8 +13,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -24,22 +22,22 @@ class ForwardingClassClient(base.BaseContrailClient):
     Service class for forwarding class test cases
     """
 
-    def list_forwarding_classs(self, params=None):
+    def list_forwarding_classs(self, params=None, **projection):
         """
         :param params:
         :return: response object
         """
         url = '/forwarding-classs'
-        if params:
-            url += '?{0}'.format(urllib.urlencode(params))
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
-    def show_forwarding_class(self, uuid):
+    def show_forwarding_class(self, uuid, **projection):
         """
         :param uuid:
         :return: response object
         """
         url = '/forwarding-class/{0}'.format(uuid)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def create_forwarding_classs(self, **kwargs):
@@ -48,9 +46,9 @@ class ForwardingClassClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/forwarding-classs'
-        post_body = json.dumps({'forwarding-class': kwargs})
+        post_body = base.json_dumps({'forwarding-class': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_forwarding_class(self, uuid, **kwargs):
@@ -60,9 +58,9 @@ class ForwardingClassClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/forwarding-class/{0}'.format(uuid)
-        put_body = json.dumps({'forwarding-class': kwargs})
+        put_body = base.json_dumps({'forwarding-class': kwargs})
         resp, body = self.put(url, put_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_forwarding_class(self, uuid):
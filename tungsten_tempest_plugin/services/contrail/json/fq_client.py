@@ -17,36 +17,126 @@
 Tempest service class for forward class test cases
 """
 
-from oslo_serialization import jsonutils as json
+from tempest.lib import exceptions
+
+from tungsten_tempest_plugin.common import concurrency
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import cache
 
 
 class FqnameIdClient(base.BaseContrailClient):
 
     """
     Service class for fq name test cases
+
+    Successful resolutions are stored in the shared ``cache.fqname_cache``.
+    Callers opt in to reading from it with ``use_cache=True``; RBAC tests
+    must not, since a cache hit never reaches the API server.
     """
 
-    def fqname_to_id(self, **kwargs):
+    def __init__(self, *args, **kwargs):
+        super(FqnameIdClient, self).__init__(*args, **kwargs)
+        cache.fqname_cache.configure(base.CONF.sdn.fqname_cache_size,
+                                     base.CONF.sdn.fqname_cache_ttl)
+
+    def fqname_to_id(self, use_cache=False, **kwargs):
         """
+        :param use_cache: return a cached uuid instead of calling the API
         :param kwargs:
         :return: map object
         """
+        if use_cache:
+            entry = cache.fqname_cache.get_by_fqname(kwargs.get('type'),
+                                                     kwargs.get('fq_name'))
+            if entry is not None:
+                return base.ResponseBody(entry.response, {'uuid': entry.uuid})
+
         uri = '/fqname-to-id'
-        req_post_data = json.dumps(kwargs)
+        req_post_data = base.json_dumps(kwargs)
 
         resp, body = self.post(uri, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
+        cache.fqname_cache.add(body.get('uuid'), kwargs.get('type'),
+                               kwargs.get('fq_name'), resp)
         return base.ResponseBody(resp, body)
 
-    def id_to_fqname(self, **kwargs):
+    def fqnames_to_ids(self, names, use_cache=False, workers=None):
+        """Resolve many fq_names, concurrently and once each.
+
+        :param names: iterable of (type, fq_name) pairs, duplicates allowed
+        :param use_cache: skip the API for names already in the cache
+        :param workers: requests in flight, defaults to bulk_workers
+        :return: (mapping, not_found) tuple, mapping (type, fq_name tuple)
+                 to uuid for every name found, not_found listing the other
+                 (type, fq_name tuple) pairs in input order
+        :raises: the first error other than NotFound, once every name has
+                 been tried
         """
+        keys = []
+        seen = set()
+        for obj_type, fq_name in names:
+            key = (obj_type, tuple(fq_name))
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+
+        mapping = {}
+        pending = []
+        for key in keys:
+            entry = (cache.fqname_cache.get_by_fqname(*key)
+                     if use_cache else None)
+            if entry is not None:
+                mapping[key] = entry.uuid
+            else:
+                pending.append(key)
+
+        def resolve(key):
+            try:
+                return self.fqname_to_id(type=key[0],
+                                         fq_name=list(key[1]))['uuid']
+            except exceptions.NotFound:
+                return None
+
+        if workers is None:
+            workers = base.CONF.sdn.bulk_workers
+        result = concurrency.map_bounded(resolve, pending, workers=workers)
+        result.raise_first_error()
+        not_found = []
+        for key, uuid in zip(pending, result.results):
+            if uuid is None:
+                not_found.append(key)
+            else:
+                mapping[key] = uuid
+        return mapping, not_found
+
+    def id_to_fqname(self, use_cache=False, **kwargs):
+        """
+        :param use_cache: return a cached fq_name instead of calling the API
         :param kwargs:
         :return: map object
         """
+        if use_cache:
+            entry = cache.fqname_cache.get_by_uuid(kwargs.get('uuid'))
+            if entry is not None:
+                return base.ResponseBody(entry.response,
+                                         {'fq_name': list(entry.fq_name),
+                                          'type': entry.type})
+
         uri = '/id-to-fqname'
-        req_post_data = json.dumps(kwargs)
+        req_post_data = base.json_dumps(kwargs)
 
-        resp, body = self.post(uri, req_post_data)
-        body = json.loads(body)
+        try:
+            resp, body = self.post(uri, req_post_data)
+        except exceptions.NotFound:
+            cache.fqname_cache.invalidate(kwargs.get('uuid'))
+            raise
+        body = base.json_loads(body)
+        cache.fqname_cache.add(kwargs.get('uuid'), body.get('type'),
+                               body.get('fq_name'), resp)
         return base.ResponseBody(resp, body)
+
+    def cache_stats(self):
+        """
+        :return: hit/miss/eviction/invalidation counters of the cache
+        """
+        return cache.fqname_cache.stats()
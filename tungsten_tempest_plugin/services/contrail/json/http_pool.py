@@ -0,0 +1,129 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Keep-alive HTTP transport shared by all Contrail service clients
+"""
+
+import threading
+
+import urllib3
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class PooledHttp(urllib3.PoolManager):
+    """Drop-in replacement for tempest's ClosingHttp that keeps connections.
+
+    ``ClosingHttp`` forces ``Connection: close`` and clears its pools after
+    every request, so each call pays a new TCP/TLS handshake. This manager
+    keeps up to ``maxsize`` idle connections per endpoint instead.
+    """
+
+    def __init__(self, disable_ssl_certificate_validation=False,
+                 ca_certs=None, timeout=None, follow_redirects=True,
+                 maxsize=10):
+        self.follow_redirects = follow_redirects
+        kwargs = {'maxsize': maxsize}
+
+        if disable_ssl_certificate_validation:
+            urllib3.disable_warnings()
+            kwargs['cert_reqs'] = 'CERT_NONE'
+        elif ca_certs:
+            kwargs['cert_reqs'] = 'CERT_REQUIRED'
+            kwargs['ca_certs'] = ca_certs
+
+        if timeout:
+            kwargs['timeout'] = timeout
+
+        super(PooledHttp, self).__init__(**kwargs)
+
+    def request(self, url, method, *args, **kwargs):
+
+        class Response(dict):
+            def __init__(self, info):
+                for key, value in info.getheaders().items():
+                    self[str(key).lower()] = value
+                self.status = info.status
+                self['status'] = str(self.status)
+                self.reason = info.reason
+                self.version = info.version
+                self['content-location'] = url
+
+        if self.follow_redirects:
+            retry = urllib3.util.Retry(raise_on_redirect=False, redirect=5)
+        else:
+            retry = urllib3.util.Retry(redirect=False)
+        r = super(PooledHttp, self).request(method, url, retries=retry,
+                                            *args, **kwargs)
+
+        if not kwargs.get('preload_content', True):
+            return r, b''
+        return Response(r), r.data
+
+    def stats(self):
+        """Return connection reuse counters for every endpoint pool.
+
+        :return: dict with ``requests``, ``hits`` (requests served on a
+                 reused connection) and ``misses`` (new connections)
+        """
+        requests = misses = 0
+        for key in list(self.pools.keys()):
+            pool = self.pools.get(key)
+            if pool is None:
+                continue
+            requests += pool.num_requests
+            misses += pool.num_connections
+        return {'requests': requests,
+                'hits': max(requests - misses, 0),
+                'misses': misses}
+
+
+def get_http(disable_ssl_certificate_validation=False, ca_certs=None,
+             timeout=None, follow_redirects=True, maxsize=10):
+    """Return the process-wide PooledHttp matching the given TLS settings.
+
+    Clients that talk to the same endpoint with the same TLS settings get
+    the same manager and therefore share its idle connections.
+    """
+    key = (bool(disable_ssl_certificate_validation), ca_certs, timeout,
+           follow_redirects, maxsize)
+    with _pools_lock:
+        http = _pools.get(key)
+        if http is None:
+            http = PooledHttp(
+                disable_ssl_certificate_validation=(
+                    disable_ssl_certificate_validation),
+                ca_certs=ca_certs,
+                timeout=timeout,
+                follow_redirects=follow_redirects,
+                maxsize=maxsize)
+            _pools[key] = http
+    return http
+
+
+def pool_stats():
+    """Return connection reuse counters summed over all shared transports.
+
+    :return: dict with ``requests``, ``hits`` and ``misses`` counters
+    """
+    totals = {'requests': 0, 'hits': 0, 'misses': 0}
+    with _pools_lock:
+        transports = list(_pools.values())
+    for http in transports:
+        for name, value in http.stats().items():
+            totals[name] += value
+    return totals
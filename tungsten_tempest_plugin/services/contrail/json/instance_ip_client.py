@@ -17,8 +17,6 @@
 Tempest service class for instance IP test cases
 """
 
-from oslo_serialization import jsonutils as json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -34,10 +32,9 @@ class InstanceIPClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/instance-ips'
-        if kwargs:
-            url += '?%s' % urllib.urlencode(kwargs)
+        url = self._query_url(url, kwargs)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_instance_ips(self, **kwargs):
@@ -47,18 +44,19 @@ class InstanceIPClient(base.BaseContrailClient):
         """
         url = '/instance-ips'
         post_body = {'instance-ip': kwargs}
-        resp, body = self.post(url, json.dumps(post_body))
-        body = json.loads(body)
+        resp, body = self.post(url, base.json_dumps(post_body))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_instance_ip(self, uuid):
+    def show_instance_ip(self, uuid, **projection):
         """
         :param uuid:
         :return: map object
         """
         url = '/instance-ip/{0}'.format(uuid)
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_instance_ip(self, uuid, **kwargs):
@@ -69,8 +67,8 @@ class InstanceIPClient(base.BaseContrailClient):
         """
         url = '/instance-ip/{0}'.format(uuid)
         put_body = {'instance-ip': kwargs}
-        resp, body = self.put(url, json.dumps(put_body))
-        body = json.loads(body)
+        resp, body = self.put(url, base.json_dumps(put_body))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_instance_ip(self, uuid):
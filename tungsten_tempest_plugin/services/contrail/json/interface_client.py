@@ -17,7 +17,6 @@
 Tempest service class for interface test cases
 """
 
-from oslo_serialization import jsonutils as json
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -27,11 +26,12 @@ class InterfaceClient(base.BaseContrailClient):
     Service class for interface test cases
     """
 
-    def list_physical_interfaces(self):
+    def list_physical_interfaces(self, **projection):
         """
         :return: response object
         """
         url = '/physical-interfaces'
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def create_physical_interfaces(self, **kwargs):
@@ -40,9 +40,9 @@ class InterfaceClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/physical-interfaces'
-        post_body = json.dumps({'physical-interface': kwargs})
+        post_body = base.json_dumps({'physical-interface': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_physical_interface(self, uuid, **kwargs):
@@ -53,9 +53,9 @@ class InterfaceClient(base.BaseContrailClient):
         """
         url = '/physical-interface/%s' % uuid
         post_data = {'physical-interface': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_physical_interface(self, uuid):
@@ -66,21 +66,23 @@ class InterfaceClient(base.BaseContrailClient):
         url = '/physical-interface/%s' % uuid
         return self.delete(url)
 
-    def show_physical_interface(self, uuid):
+    def show_physical_interface(self, uuid, **projection):
         """
         :param uuid:
         :return: map object
         """
         url = '/physical-interface/%s' % uuid
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def list_logical_interfaces(self):
+    def list_logical_interfaces(self, **projection):
         """
         :return: response object
         """
         url = '/logical-interfaces'
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def create_logical_interfaces(self, **kwargs):
@@ -89,9 +91,9 @@ class InterfaceClient(base.BaseContrailClient):
         :return: map object
         """
         url = '/logical-interfaces'
-        post_body = json.dumps({'logical-interface': kwargs})
+        post_body = base.json_dumps({'logical-interface': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_logical_interface(self, uuid, **kwargs):
@@ -102,9 +104,9 @@ class InterfaceClient(base.BaseContrailClient):
         """
         url = '/logical-interface/%s' % uuid
         post_data = {'logical-interface': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_logical_interface(self, uuid):
@@ -115,12 +117,13 @@ class InterfaceClient(base.BaseContrailClient):
         url = '/logical-interface/%s' % uuid
         return self.delete(url)
 
-    def show_logical_interface(self, uuid):
+    def show_logical_interface(self, uuid, **projection):
         """
         :param uuid:
         :return: map object
         """
         url = '/logical-interface/%s' % uuid
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
@@ -17,8 +17,6 @@
 Tempest service class for load balancer test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,16 +26,16 @@ class LoadBalancerClient(base.BaseContrailClient):
     Service class for load balancer test cases
     """
 
-    def list_load_balancers(self, params=None):
+    def list_load_balancers(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/loadbalancers'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_load_balancers(self, **kwargs):
@@ -46,21 +44,21 @@ class LoadBalancerClient(base.BaseContrailClient):
         :return:
         """
         url = '/loadbalancers'
-        resp, body = self.post(url, json.dumps({'loadbalancer': kwargs}))
-        body = json.loads(body)
+        resp, body = self.post(url, base.json_dumps({'loadbalancer': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_load_balancer(self, uuid, params=None):
+    def show_load_balancer(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/loadbalancer/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_load_balancer(self, uuid, **kwargs):
@@ -70,8 +68,8 @@ class LoadBalancerClient(base.BaseContrailClient):
         :return:
         """
         url = '/loadbalancer/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'loadbalancer': kwargs}))
-        body = json.loads(body)
+        resp, body = self.put(url, base.json_dumps({'loadbalancer': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_load_balancer(self, uuid):
@@ -82,16 +80,16 @@ class LoadBalancerClient(base.BaseContrailClient):
         url = '/loadbalancer/{0}'.format(uuid)
         return self.delete(url)
 
-    def list_lb_healthmonitors(self, params=None):
+    def list_lb_healthmonitors(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/loadbalancer-healthmonitors'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_lb_healthmonitors(self, **kwargs):
@@ -100,22 +98,22 @@ class LoadBalancerClient(base.BaseContrailClient):
         :return:
         """
         url = '/loadbalancer-healthmonitors'
-        resp, body = self.post(url, json.dumps(
+        resp, body = self.post(url, base.json_dumps(
             {'loadbalancer-healthmonitor': kwargs}))
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_lb_healthmonitor(self, uuid, params=None):
+    def show_lb_healthmonitor(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/loadbalancer-healthmonitor/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_lb_healthmonitor(self, uuid, **kwargs):
@@ -125,9 +123,9 @@ class LoadBalancerClient(base.BaseContrailClient):
         :return:
         """
         url = '/loadbalancer-healthmonitor/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps(
+        resp, body = self.put(url, base.json_dumps(
             {'loadbalancer-healthmonitor': kwargs}))
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_lb_healthmonitor(self, uuid):
@@ -138,16 +136,16 @@ class LoadBalancerClient(base.BaseContrailClient):
         url = '/loadbalancer-healthmonitor/{0}'.format(uuid)
         return self.delete(url)
 
-    def list_load_balancer_listeners(self, params=None):
+    def list_load_balancer_listeners(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/loadbalancer-listeners'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_load_balancer_listeners(self, **kwargs):
@@ -156,22 +154,22 @@ class LoadBalancerClient(base.BaseContrailClient):
         :return:
         """
         url = '/loadbalancer-listeners'
-        resp, body = self.post(url, json.dumps(
+        resp, body = self.post(url, base.json_dumps(
             {'loadbalancer-listener': kwargs}))
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_load_balancer_listener(self, uuid, params=None):
+    def show_load_balancer_listener(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/loadbalancer-listener/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_load_balancer_listener(self, uuid, **kwargs):
@@ -181,9 +179,9 @@ class LoadBalancerClient(base.BaseContrailClient):
         :return:
         """
         url = '/loadbalancer-listener/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps(
+        resp, body = self.put(url, base.json_dumps(
             {'loadbalancer-listener': kwargs}))
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_load_balancer_listener(self, uuid):
@@ -194,16 +192,16 @@ class LoadBalancerClient(base.BaseContrailClient):
         url = '/loadbalancer-listener/{0}'.format(uuid)
         return self.delete(url)
 
-    def list_load_balancer_pools(self, params=None):
+    def list_load_balancer_pools(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/loadbalancer-pools'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_load_balancer_pools(self, **kwargs):
@@ -212,22 +210,22 @@ class LoadBalancerClient(base.BaseContrailClient):
         :return:
         """
         url = '/loadbalancer-pools'
-        resp, body = self.post(url, json.dumps(
+        resp, body = self.post(url, base.json_dumps(
             {'loadbalancer-pool': kwargs}))
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_load_balancer_pool(self, uuid, params=None):
+    def show_load_balancer_pool(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/loadbalancer-pool/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_load_balancer_pool(self, uuid, **kwargs):
@@ -237,9 +235,9 @@ class LoadBalancerClient(base.BaseContrailClient):
         :return:
         """
         url = '/loadbalancer-pool/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps(
+        resp, body = self.put(url, base.json_dumps(
             {'loadbalancer-pool': kwargs}))
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_load_balancer_pool(self, uuid):
@@ -250,16 +248,16 @@ class LoadBalancerClient(base.BaseContrailClient):
         url = '/loadbalancer-pool/{0}'.format(uuid)
         return self.delete(url)
 
-    def list_load_balancer_members(self, params=None):
+    def list_load_balancer_members(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/loadbalancer-members'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_load_balancer_members(self, **kwargs):
@@ -268,22 +266,22 @@ class LoadBalancerClient(base.BaseContrailClient):
         :return:
         """
         url = '/loadbalancer-members'
-        resp, body = self.post(url, json.dumps(
+        resp, body = self.post(url, base.json_dumps(
             {'loadbalancer-member': kwargs}))
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_load_balancer_member(self, uuid, params=None):
+    def show_load_balancer_member(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/loadbalancer-member/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_load_balancer_member(self, uuid, **kwargs):
@@ -293,9 +291,9 @@ class LoadBalancerClient(base.BaseContrailClient):
         :return:
         """
         url = '/loadbalancer-member/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps(
+        resp, body = self.put(url, base.json_dumps(
             {'loadbalancer-member': kwargs}))
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_load_balancer_member(self, uuid):
@@ -0,0 +1,188 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Per-endpoint latency histograms of the Contrail API calls
+"""
+
+import atexit
+import collections
+import math
+import os
+import re
+import threading
+
+_UUID_RE = re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+                      r'[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+
+# Buckets grow geometrically, 8 per power of two, from 0.1ms up, which
+# keeps every percentile within ~9% of the exact value whatever the range.
+_BUCKETS_PER_DOUBLING = 8
+_MIN_SECONDS = 0.0001
+
+
+def url_template(url):
+    """Return ``url`` without query string and with uuids as ``{id}``."""
+    return _UUID_RE.sub('{id}', url.split('?', 1)[0])
+
+
+class Histogram(object):
+    """Log-bucketed histogram of durations in seconds."""
+
+    def __init__(self):
+        self.buckets = collections.defaultdict(int)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def _bucket(seconds):
+        if seconds <= _MIN_SECONDS:
+            return 0
+        return int(math.log(seconds / _MIN_SECONDS, 2) *
+                   _BUCKETS_PER_DOUBLING) + 1
+
+    @staticmethod
+    def _upper_bound(bucket):
+        return _MIN_SECONDS * 2 ** (float(bucket) / _BUCKETS_PER_DOUBLING)
+
+    def add(self, seconds):
+        self.buckets[self._bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent):
+        """Return the upper bound of the bucket holding ``percent``."""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100.0)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self._upper_bound(bucket), self.max)
+        return self.max
+
+
+class EndpointStats(object):
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.statuses = collections.defaultdict(int)
+        self.retries = collections.defaultdict(int)
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @property
+    def errors(self):
+        return sum(count for status, count in self.statuses.items()
+                   if status is None or status >= 400)
+
+
+class Recorder(object):
+    """Collects request samples keyed by (method, url template).
+
+    Recording is off until ``enable`` is called, so the clients only pay
+    for an attribute check when nobody asked for the report.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.report_path = None
+        self._endpoints = collections.defaultdict(EndpointStats)
+        self._lock = threading.Lock()
+
+    def enable(self, report_path=None):
+        """Start recording and write the report to ``report_path`` at exit.
+
+        :param report_path: file name, ``{pid}`` is replaced by the id of
+                            the worker process writing it
+        """
+        self.enabled = True
+        if report_path and not self.report_path:
+            atexit.register(self._write_at_exit)
+        self.report_path = report_path
+
+    def record(self, method, url, status, bytes_out, bytes_in, seconds):
+        key = (method, url_template(url))
+        with self._lock:
+            stats = self._endpoints[key]
+            stats.latency.add(seconds)
+            stats.statuses[status] += 1
+            stats.bytes_out += bytes_out
+            stats.bytes_in += bytes_in
+
+    def record_retry(self, method, url, status):
+        """Count a request retried after answering with ``status``."""
+        key = (method, url_template(url))
+        with self._lock:
+            self._endpoints[key].retries[status] += 1
+
+    def snapshot(self):
+        """Return a list of per-endpoint summaries, slowest total first."""
+        rows = []
+        with self._lock:
+            for (method, template), stats in self._endpoints.items():
+                latency = stats.latency
+                rows.append({
+                    'method': method,
+                    'url': template,
+                    'count': latency.count,
+                    'errors': stats.errors,
+                    'total': latency.total,
+                    'p50': latency.percentile(50),
+                    'p95': latency.percentile(95),
+                    'p99': latency.percentile(99),
+                    'max': latency.max,
+                    'bytes_in': stats.bytes_in,
+                    'bytes_out': stats.bytes_out,
+                    'statuses': dict(stats.statuses),
+                    'retries': sum(stats.retries.values()),
+                    'retried_statuses': dict(stats.retries),
+                })
+        rows.sort(key=lambda row: row['total'], reverse=True)
+        return rows
+
+    def format_report(self):
+        lines = ['%-6s %-48s %7s %6s %7s %9s %9s %9s %9s %10s %10s' % (
+            'method', 'endpoint', 'count', 'errors', 'retries', 'p50 ms',
+            'p95 ms', 'p99 ms', 'max ms', 'KiB in', 'KiB out')]
+        for row in self.snapshot():
+            lines.append(
+                '%-6s %-48s %7d %6d %7d %9.1f %9.1f %9.1f %9.1f %10.1f '
+                '%10.1f' % (
+                    row['method'], row['url'], row['count'], row['errors'],
+                    row['retries'], row['p50'] * 1000, row['p95'] * 1000,
+                    row['p99'] * 1000, row['max'] * 1000,
+                    row['bytes_in'] / 1024.0, row['bytes_out'] / 1024.0))
+        return '\n'.join(lines) + '\n'
+
+    def write_report(self, path):
+        with open(path, 'w') as report:
+            report.write(self.format_report())
+
+    def _write_at_exit(self):
+        if not self.report_path or not self._endpoints:
+            return
+        self.write_report(self.report_path.replace('{pid}',
+                                                   str(os.getpid())))
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+recorder = Recorder()
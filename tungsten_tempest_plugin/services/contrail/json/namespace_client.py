@@ -17,8 +17,6 @@
 Tempest service class for namespace test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,16 +26,16 @@ class NamespaceClient(base.BaseContrailClient):
     Service class for namespace test cases
     """
 
-    def list_namespaces(self, params=None):
+    def list_namespaces(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/namespaces'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_namespaces(self, **kwargs):
@@ -46,21 +44,21 @@ class NamespaceClient(base.BaseContrailClient):
         :return:
         """
         url = '/namespaces'
-        resp, body = self.post(url, json.dumps({'namespace': kwargs}))
-        body = json.loads(body)
+        resp, body = self.post(url, base.json_dumps({'namespace': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_namespace(self, uuid, params=None):
+    def show_namespace(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/namespace/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_namespace(self, uuid, **kwargs):
@@ -70,8 +68,8 @@ class NamespaceClient(base.BaseContrailClient):
         :return:
         """
         url = '/namespace/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'namespace': kwargs}))
-        body = json.loads(body)
+        resp, body = self.put(url, base.json_dumps({'namespace': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_namespace(self, uuid):
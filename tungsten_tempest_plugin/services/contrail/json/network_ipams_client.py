@@ -17,8 +17,6 @@
 Tempest service class for n/w ipam test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,14 +26,14 @@ class NetworkIpamsClient(base.BaseContrailClient):
     Service class for network ipam test cases
     """
 
-    def list_network_ipams(self, params=None):
+    def list_network_ipams(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/network-ipams'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_network_ipams(self, **kwargs):
@@ -44,17 +42,19 @@ class NetworkIpamsClient(base.BaseContrailClient):
         :return:
         """
         url = '/network-ipams'
-        post_body = json.dumps({'network-ipam': kwargs})
+        post_body = base.json_dumps({'network-ipam': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_network_ipam(self, instance_id):
+    def show_network_ipam(self, instance_id, **projection):
         """
         :param instance_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/network-ipam/%s' % str(instance_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_network_ipam(self, instance_id):
@@ -73,7 +73,7 @@ class NetworkIpamsClient(base.BaseContrailClient):
         """
         url = '/network-ipam/%s' % str(instance_id)
         post_data = {'network-ipam': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
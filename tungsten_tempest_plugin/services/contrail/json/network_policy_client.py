@@ -17,8 +17,6 @@
 Tempest service class for netwrok policy test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,16 +26,16 @@ class NetworkPolicyClient(base.BaseContrailClient):
     Service class for network policy test cases
     """
 
-    def list_network_policys(self, params=None):
+    def list_network_policys(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/network-policys'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_network_policys(self, **kwargs):
@@ -46,21 +44,22 @@ class NetworkPolicyClient(base.BaseContrailClient):
         :return:
         """
         url = '/network-policys'
-        resp, body = self.post(url, json.dumps({'network-policy': kwargs}))
-        body = json.loads(body)
+        post_body = base.json_dumps({'network-policy': kwargs})
+        resp, body = self.post(url, post_body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_network_policy(self, uuid, params=None):
+    def show_network_policy(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/network-policy/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_network_policy(self, uuid, **kwargs):
@@ -70,8 +69,8 @@ class NetworkPolicyClient(base.BaseContrailClient):
         :return:
         """
         url = '/network-policy/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'network-policy': kwargs}))
-        body = json.loads(body)
+        resp, body = self.put(url, base.json_dumps({'network-policy': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_network_policy(self, uuid):
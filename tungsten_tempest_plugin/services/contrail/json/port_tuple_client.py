@@ -17,30 +17,30 @@
 Tempest service class for tuple test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
 class PortTupleClient(base.BaseContrailClient):
 
 
-    def list_port_tuples(self, params=None):
+    def list_port_tuples(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/port-tuples'
-        if params:
-            url += '?{0}'.format(urllib.urlencode(params))
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
-    def show_port_tuple(self, uuid):
+    def show_port_tuple(self, uuid, **projection):
         """
         :param uuid:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/port-tuple/{0}'.format(uuid)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def create_port_tuples(self, **kwargs):
@@ -49,9 +49,9 @@ class PortTupleClient(base.BaseContrailClient):
         :return:
         """
         url = '/port-tuples'
-        post_body = json.dumps({'port-tuple': kwargs})
+        post_body = base.json_dumps({'port-tuple': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_port_tuple(self, uuid, **kwargs):
@@ -61,9 +61,9 @@ class PortTupleClient(base.BaseContrailClient):
         :return:
         """
         url = '/port-tuple/{0}'.format(uuid)
-        put_body = json.dumps({'port-tuple': kwargs})
+        put_body = base.json_dumps({'port-tuple': kwargs})
         resp, body = self.put(url, put_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_port_tuple(self, uuid):
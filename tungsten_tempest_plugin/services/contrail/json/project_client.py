@@ -17,8 +17,6 @@
 Tempest service class for project test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,16 +26,16 @@ class ProjectClient(base.BaseContrailClient):
     Service class for project test cases
     """
 
-    def list_projects(self, params=None):
+    def list_projects(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/projects'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_projects(self, **kwargs):
@@ -46,21 +44,21 @@ class ProjectClient(base.BaseContrailClient):
         :return:
         """
         url = '/projects'
-        resp, body = self.post(url, json.dumps({'project': kwargs}))
-        body = json.loads(body)
+        resp, body = self.post(url, base.json_dumps({'project': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_project(self, uuid, params=None):
+    def show_project(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/project/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_project(self, uuid, **kwargs):
@@ -70,8 +68,8 @@ class ProjectClient(base.BaseContrailClient):
         :return:
         """
         url = '/project/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'project': kwargs}))
-        body = json.loads(body)
+        resp, body = self.put(url, base.json_dumps({'project': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_project(self, uuid):
@@ -17,7 +17,6 @@
 Tempest service class for QoS test cases
 """
 
-import json
 
 from tungsten_tempest_plugin.services.contrail.json import base
 
@@ -28,14 +27,16 @@ class QosContrailClient(base.BaseContrailClient):
     Service class for QoS test cases
     """
 
-    def show_global_qos_config(self, instance_id):
+    def show_global_qos_config(self, instance_id, **projection):
         """
         :param instance_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/global-qos-config/%s' % instance_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_global_qos_config(self, instance_id):
@@ -52,19 +53,21 @@ class QosContrailClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'global-qos-config': kwargs})
+        post_body = base.json_dumps({'global-qos-config': kwargs})
         url = '/global-qos-config/%s' % instance_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def list_global_qos_configs(self):
+    def list_global_qos_configs(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/global-qos-configs'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_global_qos_configs(self, **kwargs):
@@ -72,20 +75,22 @@ class QosContrailClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'global-qos-config': kwargs})
+        post_body = base.json_dumps({'global-qos-config': kwargs})
         url = '/global-qos-configs'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_qos_config(self, qos_config_id):
+    def show_qos_config(self, qos_config_id, **projection):
         """
         :param qos_config_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/qos-config/%s' % qos_config_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_qos_config(self, qos_config_id):
@@ -102,19 +107,21 @@ class QosContrailClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'qos-config': kwargs})
+        post_body = base.json_dumps({'qos-config': kwargs})
         url = '/qos-config/%s' % qos_config_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def list_qos_configs(self):
+    def list_qos_configs(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/qos-configs'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_qos_configs(self, **kwargs):
@@ -122,20 +129,22 @@ class QosContrailClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'qos-config': kwargs})
+        post_body = base.json_dumps({'qos-config': kwargs})
         url = '/qos-configs'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_qos_queue(self, qos_queue_id):
+    def show_qos_queue(self, qos_queue_id, **projection):
         """
         :param qos_queue_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/qos-queue/%s' % qos_queue_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_qos_queue(self, qos_queue_id):
@@ -152,19 +161,21 @@ class QosContrailClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'qos-queue': kwargs})
+        post_body = base.json_dumps({'qos-queue': kwargs})
         url = '/qos-queue/%s' % qos_queue_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def list_qos_queues(self):
+    def list_qos_queues(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/qos-queues'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_qos_queues(self, **kwargs):
@@ -172,8 +183,8 @@ class QosContrailClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'qos-queue': kwargs})
+        post_body = base.json_dumps({'qos-queue': kwargs})
         url = '/qos-queues'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
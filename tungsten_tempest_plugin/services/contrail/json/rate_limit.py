@@ -0,0 +1,147 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Request rate limiter shared by the test workers of a run
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+
+from oslo_concurrency import lockutils
+from tempest import config
+
+CONF = config.CONF
+
+_STATE = struct.Struct('<d')
+
+
+class RateLimiter(object):
+    """Token bucket whose state lives in a file shared by processes.
+
+    The bucket is kept as the time at which it will be full again (the
+    GCRA form of a token bucket), a single number. Each request reserves
+    its slot by moving that time forward under an inter-process lock and
+    then sleeps, outside the lock, until its slot comes.
+
+    :param rate: requests per second allowed across all processes
+    :param burst: requests that may go out at once after an idle period
+    :param path: state file, shared by every process using the same one
+    """
+
+    def __init__(self, rate, burst=1, path=None):
+        self.rate = float(rate)
+        self.burst = max(int(burst), 1)
+        self.path = path
+        self.waited = 0.0
+        self._lock = threading.Lock()
+        self._full_at = 0.0
+        self._fd = None
+        self._pid = None
+        self._file_lock = None
+        if path is not None:
+            self._file_lock = lockutils.external_lock(
+                os.path.basename(path), lock_file_prefix='tungsten-tempest',
+                lock_path=os.path.dirname(path) or '.')
+
+    def _read(self):
+        # The state is a fixed size double read and written in place
+        # through a descriptor kept open, which costs a fraction of
+        # reopening and rewriting a file on every request.
+        if self._pid != os.getpid():
+            # Not inherited across fork: the offset would be shared.
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        data = os.read(self._fd, _STATE.size)
+        if len(data) != _STATE.size:
+            return 0.0
+        return _STATE.unpack(data)[0]
+
+    def _write(self, full_at):
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, _STATE.pack(full_at))
+
+    def _reserve(self, now):
+        """Move the bucket forward by one request, return the delay."""
+        interval = 1.0 / self.rate
+        full_at = max(self._full_at if self.path is None else self._read(),
+                      now)
+        delay = max(full_at - now - (self.burst - 1) * interval, 0.0)
+        full_at += interval
+        if self.path is None:
+            self._full_at = full_at
+        else:
+            self._write(full_at)
+        return delay
+
+    def acquire(self):
+        """Block until the next request may be sent.
+
+        :return: seconds spent waiting
+        """
+        with self._lock:
+            if self.path is None:
+                delay = self._reserve(time.time())
+            else:
+                with self._file_lock:
+                    delay = self._reserve(time.time())
+            self.waited += delay
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def state_path(base_url):
+    """Default state file of the workers sending requests to ``base_url``.
+
+    Named after the endpoint and ``$TEMPEST_RUN_ID``, so only the workers
+    of one run against one API server share a bucket.
+    """
+    key = '%s\n%s' % (base_url, os.environ.get('TEMPEST_RUN_ID', ''))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(),
+                        'tungsten-tempest-rate-limit-%s' % digest)
+
+
+def get_limiter(base_url):
+    """Return the limiter configured in the ``sdn`` group, or None.
+
+    :param base_url: endpoint the requests are sent to
+    """
+    rate = CONF.sdn.rate_limit
+    if not rate:
+        return None
+    path = CONF.sdn.rate_limit_state_file or state_path(base_url)
+    key = (rate, CONF.sdn.rate_limit_burst, path)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = RateLimiter(rate, key[1], path)
+        return limiter
+
+
+def total_waited():
+    """Return the seconds this process spent waiting on any limiter."""
+    with _limiters_lock:
+        return sum(limiter.waited for limiter in _limiters.values())
@@ -0,0 +1,121 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Retry policy for transient errors of the Contrail API
+"""
+
+import collections
+import random
+import threading
+
+# Statuses that decide the outcome of an RBAC test are never retried,
+# whatever the configuration says.
+NEVER_RETRIED = frozenset((401, 403, 404))
+
+
+class RetryPolicy(object):
+    """Decides which responses are retried and how long to wait.
+
+    :param retry_on: dict mapping an HTTP status to the methods retried
+                     on it. Only list non-idempotent methods such as POST
+                     for statuses the server returns before doing anything
+    :param attempts: maximum number of retries of one request
+    :param backoff: base delay in seconds, doubled after every attempt
+    :param backoff_max: maximum delay between two attempts
+    :param max_time: seconds after which a request is no longer retried
+    """
+
+    def __init__(self, retry_on=None, attempts=0, backoff=0.5,
+                 backoff_max=8.0, max_time=30.0):
+        self.retry_on = dict(
+            (int(status), frozenset(method.upper() for method in methods))
+            for status, methods in (retry_on or {}).items()
+            if int(status) not in NEVER_RETRIED)
+        self.attempts = attempts
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.max_time = max_time
+        self._random = random.Random()
+
+    @classmethod
+    def from_config(cls, sdn_conf):
+        """Build the policy from the ``sdn`` option group."""
+        retry_on = dict((status, methods.split())
+                        for status, methods in sdn_conf.retry_on.items())
+        return cls(retry_on, sdn_conf.retry_attempts, sdn_conf.retry_backoff,
+                   sdn_conf.retry_backoff_max, sdn_conf.retry_max_time)
+
+    @property
+    def enabled(self):
+        return bool(self.attempts and self.retry_on)
+
+    def retryable(self, method, status):
+        """Whether a ``method`` request answered with ``status`` is retried."""
+        return method in self.retry_on.get(status, ())
+
+    def should_retry(self, method, status, attempt):
+        """Whether the ``attempt``-th retry of a request should be made."""
+        return attempt < self.attempts and self.retryable(method, status)
+
+    def delay(self, attempt):
+        """Exponential backoff with full jitter.
+
+        Spreading the delay over [0, backoff * 2^attempt] keeps workers
+        that hit the same contention from retrying in lockstep.
+        """
+        ceiling = min(self.backoff_max, self.backoff * 2 ** attempt)
+        return self._random.uniform(0, ceiling)
+
+
+class RetryStats(object):
+    """Retries made by every Contrail client of this worker.
+
+    Counted whether or not the latency report is enabled, so a run that
+    only passed thanks to retries can be told from a clean one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = collections.defaultdict(int)
+        self.exhausted = 0
+
+    def record_retry(self, status):
+        """Count a request retried after answering with ``status``."""
+        with self._lock:
+            self.retries[status] += 1
+
+    def record_exhausted(self):
+        """Count a request still failing once retries were given up."""
+        with self._lock:
+            self.exhausted += 1
+
+    def clear(self):
+        with self._lock:
+            self.retries.clear()
+            self.exhausted = 0
+
+    def stats(self):
+        """
+        :return: dict with the ``retries`` and ``exhausted`` totals and
+                 the retries per status in ``statuses``
+        """
+        with self._lock:
+            return {'retries': sum(self.retries.values()),
+                    'exhausted': self.exhausted,
+                    'statuses': dict(self.retries)}
+
+
+retry_stats = RetryStats()
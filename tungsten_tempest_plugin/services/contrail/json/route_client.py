@@ -17,7 +17,6 @@
 Tempest service class for route test cases
 """
 
-from oslo_serialization import jsonutils as json
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -27,23 +26,27 @@ class RouteClient(base.BaseContrailClient):
     Service class for route test cases
     """
 
-    def list_route_tables(self):
+    def list_route_tables(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/route-tables'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_route_table(self, route_id):
+    def show_route_table(self, route_id, **projection):
         """
         :param route_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/route-table/%s' % route_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_route_tables(self, **kwargs):
@@ -51,10 +54,10 @@ class RouteClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'route-table': kwargs})
+        post_body = base.json_dumps({'route-table': kwargs})
         url = 'route-tables'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_route_table(self, route_id, **kwargs):
@@ -63,10 +66,10 @@ class RouteClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'route-table': kwargs})
+        post_body = base.json_dumps({'route-table': kwargs})
         url = '/route-table/%s' % route_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_route_table(self, route_id):
@@ -78,23 +81,27 @@ class RouteClient(base.BaseContrailClient):
         resp, body = self.delete(url)
         return base.ResponseBody(resp, body)
 
-    def list_interface_route_tables(self):
+    def list_interface_route_tables(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/interface-route-tables'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_interface_route_table(self, interface_route_id):
+    def show_interface_route_table(self, interface_route_id, **projection):
         """
         :param interface_route_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/interface-route-table/%s' % interface_route_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_interface_route_tables(self, **kwargs):
@@ -102,10 +109,10 @@ class RouteClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'interface-route-table': kwargs})
+        post_body = base.json_dumps({'interface-route-table': kwargs})
         url = 'interface-route-tables'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_interface_route_table(self, interface_route_id, **kwargs):
@@ -114,10 +121,10 @@ class RouteClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'interface-route-table': kwargs})
+        post_body = base.json_dumps({'interface-route-table': kwargs})
         url = '/interface-route-table/%s' % interface_route_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_interface_route_table(self, interface_route_id):
@@ -129,23 +136,27 @@ class RouteClient(base.BaseContrailClient):
         resp, body = self.delete(url)
         return base.ResponseBody(resp, body)
 
-    def list_route_targets(self):
+    def list_route_targets(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/route-targets'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_route_target(self, route_target_id):
+    def show_route_target(self, route_target_id, **projection):
         """
         :param route_target_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/route-target/%s' % route_target_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_route_targets(self, **kwargs):
@@ -153,10 +164,10 @@ class RouteClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'route-target': kwargs})
+        post_body = base.json_dumps({'route-target': kwargs})
         url = 'route-targets'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_route_target(self, route_target_id, **kwargs):
@@ -165,10 +176,10 @@ class RouteClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'route-target': kwargs})
+        post_body = base.json_dumps({'route-target': kwargs})
         url = '/route-target/%s' % route_target_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_route_target(self, route_target_id):
@@ -180,23 +191,27 @@ class RouteClient(base.BaseContrailClient):
         resp, body = self.delete(url)
         return base.ResponseBody(resp, body)
 
-    def list_route_aggregates(self):
+    def list_route_aggregates(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/route-aggregates'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_route_aggregate(self, route_aggr_id):
+    def show_route_aggregate(self, route_aggr_id, **projection):
         """
         :param route_aggr_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/route-aggregate/%s' % route_aggr_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_route_aggregates(self, **kwargs):
@@ -204,10 +219,10 @@ class RouteClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'route-aggregate': kwargs})
+        post_body = base.json_dumps({'route-aggregate': kwargs})
         url = 'route-aggregates'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_route_aggregate(self, route_aggr_id, **kwargs):
@@ -216,10 +231,10 @@ class RouteClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'route-aggregate': kwargs})
+        post_body = base.json_dumps({'route-aggregate': kwargs})
         url = '/route-aggregate/%s' % route_aggr_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_route_aggregate(self, route_aggr_id):
@@ -17,7 +17,6 @@
 Tempest service class for router test cases
 """
 
-from oslo_serialization import jsonutils as json
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -27,23 +26,27 @@ class RouterClient(base.BaseContrailClient):
     Service class for router test cases
     """
 
-    def list_virtual_routers(self):
+    def list_virtual_routers(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-routers'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_virtual_router(self, vrouter_id):
+    def show_virtual_router(self, vrouter_id, **projection):
         """
         :param vrouter_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-router/%s' % vrouter_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_virtual_routers(self, **kwargs):
@@ -51,10 +54,10 @@ class RouterClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'virtual-router': kwargs})
+        post_body = base.json_dumps({'virtual-router': kwargs})
         url = '/virtual-routers'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_virtual_router(self, vrouter_id, **kwargs):
@@ -63,10 +66,10 @@ class RouterClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'virtual-router': kwargs})
+        post_body = base.json_dumps({'virtual-router': kwargs})
         url = '/virtual-router/%s' % vrouter_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_virtual_router(self, vrouter_id):
@@ -78,23 +81,28 @@ class RouterClient(base.BaseContrailClient):
         resp, body = self.delete(url)
         return base.ResponseBody(resp, body)
 
-    def list_global_vrouter_configs(self):
+    def list_global_vrouter_configs(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/global-vrouter-configs'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_global_vrouter_config(self, global_vrouter_config_id):
+    def show_global_vrouter_config(self, global_vrouter_config_id,
+                                   **projection):
         """
         :param global_vrouter_config_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/global-vrouter-config/%s' % global_vrouter_config_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_global_vrouter_configs(self, **kwargs):
@@ -102,10 +110,10 @@ class RouterClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'global-vrouter-config': kwargs})
+        post_body = base.json_dumps({'global-vrouter-config': kwargs})
         url = '/global-vrouter-configs'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_global_vrouter_config(self, global_vrouter_config_id, **kwargs):
@@ -114,10 +122,10 @@ class RouterClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'global-vrouter-config': kwargs})
+        post_body = base.json_dumps({'global-vrouter-config': kwargs})
         url = '/global-vrouter-config/%s' % global_vrouter_config_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_global_vrouter_config(self, global_vrouter_config_id):
@@ -129,23 +137,27 @@ class RouterClient(base.BaseContrailClient):
         resp, body = self.delete(url)
         return base.ResponseBody(resp, body)
 
-    def list_logical_routers(self):
+    def list_logical_routers(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/logical-routers'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_logical_router(self, logical_router_id):
+    def show_logical_router(self, logical_router_id, **projection):
         """
         :param logical_router_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/logical-router/%s' % logical_router_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_logical_routers(self, **kwargs):
@@ -153,10 +165,10 @@ class RouterClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'logical-router': kwargs})
+        post_body = base.json_dumps({'logical-router': kwargs})
         url = '/logical-routers'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_logical_router(self, logical_router_id, **kwargs):
@@ -165,10 +177,10 @@ class RouterClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'logical-router': kwargs})
+        post_body = base.json_dumps({'logical-router': kwargs})
         url = '/logical-router/%s' % logical_router_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_logical_router(self, logical_router_id):
@@ -180,23 +192,27 @@ class RouterClient(base.BaseContrailClient):
         resp, body = self.delete(url)
         return base.ResponseBody(resp, body)
 
-    def list_bgp_routers(self):
+    def list_bgp_routers(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/bgp-routers'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_bgp_router(self, bgp_router_id):
+    def show_bgp_router(self, bgp_router_id, **projection):
         """
         :param bgp_router_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/bgp-router/%s' % bgp_router_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_bgp_routers(self, **kwargs):
@@ -204,10 +220,10 @@ class RouterClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'bgp-router': kwargs})
+        post_body = base.json_dumps({'bgp-router': kwargs})
         url = '/bgp-routers'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_bgp_router(self, bgp_router_id, **kwargs):
@@ -216,10 +232,10 @@ class RouterClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'bgp-router': kwargs})
+        post_body = base.json_dumps({'bgp-router': kwargs})
         url = '/bgp-router/%s' % bgp_router_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_bgp_router(self, bgp_router_id):
@@ -231,23 +247,27 @@ class RouterClient(base.BaseContrailClient):
         resp, body = self.delete(url)
         return base.ResponseBody(resp, body)
 
-    def list_physical_routers(self):
+    def list_physical_routers(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/physical-routers'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_physical_router(self, physical_router_id):
+    def show_physical_router(self, physical_router_id, **projection):
         """
         :param physical_router_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/physical-router/%s' % physical_router_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_physical_routers(self, **kwargs):
@@ -255,10 +275,10 @@ class RouterClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'physical-router': kwargs})
+        post_body = base.json_dumps({'physical-router': kwargs})
         url = '/physical-routers'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_physical_router(self, physical_router_id, **kwargs):
@@ -267,10 +287,10 @@ class RouterClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'physical-router': kwargs})
+        post_body = base.json_dumps({'physical-router': kwargs})
         url = '/physical-router/%s' % physical_router_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_physical_router(self, physical_router_id):
@@ -17,8 +17,6 @@
 Tempest service class for routing test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,14 +26,14 @@ class RoutingClient(base.BaseContrailClient):
     Service class for routing test cases
     """
 
-    def list_routing_instances(self, params=None):
+    def list_routing_instances(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/routing-instances'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_routing_instances(self, **kwargs):
@@ -44,18 +42,20 @@ class RoutingClient(base.BaseContrailClient):
         :return:
         """
         url = '/routing-instances'
-        post_body = json.dumps({'routing-instance': kwargs})
+        post_body = base.json_dumps({'routing-instance': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_routing_instance(self, instance_id):
+    def show_routing_instance(self, instance_id, **projection):
         """
 
         :param instance_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/routing-instance/%s' % str(instance_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_routing_instance(self, instance_id):
@@ -76,7 +76,7 @@ class RoutingClient(base.BaseContrailClient):
         """
         url = '/routing-instance/%s' % str(instance_id)
         post_data = {'routing-instance': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
@@ -17,8 +17,6 @@
 Tempest service class for routing policy test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,16 +26,16 @@ class RoutingPolicyClient(base.BaseContrailClient):
     Service class for routing policy test cases
     """
 
-    def list_routing_policys(self, params=None):
+    def list_routing_policys(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/routing-policys'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_routing_policys(self, **kwargs):
@@ -46,21 +44,22 @@ class RoutingPolicyClient(base.BaseContrailClient):
         :return:
         """
         url = '/routing-policys'
-        resp, body = self.post(url, json.dumps({'routing-policy': kwargs}))
-        body = json.loads(body)
+        post_body = base.json_dumps({'routing-policy': kwargs})
+        resp, body = self.post(url, post_body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_routing_policy(self, uuid, params=None):
+    def show_routing_policy(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/routing-policy/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_routing_policy(self, uuid, **kwargs):
@@ -70,8 +69,8 @@ class RoutingPolicyClient(base.BaseContrailClient):
         :return:
         """
         url = '/routing-policy/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'routing-policy': kwargs}))
-        body = json.loads(body)
+        resp, body = self.put(url, base.json_dumps({'routing-policy': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_routing_policy(self, uuid):
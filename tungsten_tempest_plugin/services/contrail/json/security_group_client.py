@@ -17,7 +17,6 @@
 Tempest service class for security group test cases
 """
 
-from oslo_serialization import jsonutils as json
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -27,19 +26,23 @@ class SecurityGroupClient(base.BaseContrailClient):
     Service class for security group test cases
     """
 
-    def list_security_groups(self):
+    def list_security_groups(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/security-groups'
+        url = self._query_url(url, **projection)
         return self.get(url)
 
-    def show_security_group(self, sec_group_id):
+    def show_security_group(self, sec_group_id, **projection):
         """
         :param sec_group_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/security-group/%s' % sec_group_id
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def create_security_groups(self, **kwargs):
@@ -47,10 +50,10 @@ class SecurityGroupClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'security-group': kwargs})
+        post_body = base.json_dumps({'security-group': kwargs})
         url = '/security-groups'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_security_group(self, sec_group_id, **kwargs):
@@ -59,10 +62,10 @@ class SecurityGroupClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'security-group': kwargs})
+        post_body = base.json_dumps({'security-group': kwargs})
         url = '/security-group/%s' % sec_group_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_security_group(self, sec_group_id):
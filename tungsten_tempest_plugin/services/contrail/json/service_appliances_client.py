@@ -17,8 +17,6 @@
 Tempest service class for service appliance test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,14 +26,14 @@ class ServiceAppliancesClient(base.BaseContrailClient):
     Service class for service appliances test cases
     """
 
-    def list_service_appliances(self, params=None):
+    def list_service_appliances(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/service-appliances'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_service_appliances(self, **kwargs):
@@ -44,17 +42,19 @@ class ServiceAppliancesClient(base.BaseContrailClient):
         :return:
         """
         url = '/service-appliances'
-        post_body = json.dumps({'service-appliance': kwargs})
+        post_body = base.json_dumps({'service-appliance': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_service_appliance(self, appliance_id):
+    def show_service_appliance(self, appliance_id, **projection):
         """
         :param appliance_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/service-appliance/%s' % str(appliance_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_service_appliance(self, appliance_id):
@@ -73,19 +73,19 @@ class ServiceAppliancesClient(base.BaseContrailClient):
         """
         url = '/service-appliance/%s' % str(appliance_id)
         post_data = {'service-appliance': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def list_service_appliance_sets(self, params=None):
+    def list_service_appliance_sets(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/service-appliance-sets'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_service_appliance_sets(self, **kwargs):
@@ -94,17 +94,19 @@ class ServiceAppliancesClient(base.BaseContrailClient):
         :return:
         """
         url = '/service-appliance-sets'
-        post_body = json.dumps({'service-appliance-set': kwargs})
+        post_body = base.json_dumps({'service-appliance-set': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_service_appliance_set(self, appliance_id):
+    def show_service_appliance_set(self, appliance_id, **projection):
         """
         :param appliance_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/service-appliance-set/%s' % str(appliance_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_service_appliance_set(self, appliance_id):
@@ -123,7 +125,7 @@ class ServiceAppliancesClient(base.BaseContrailClient):
         """
         url = '/service-appliance-set/%s' % str(appliance_id)
         post_data = {'service-appliance-set': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
@@ -17,8 +17,6 @@
 Tempest service class for service test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,14 +26,14 @@ class ServiceClient(base.BaseContrailClient):
     Service class for service client test cases
     """
 
-    def list_service_templates(self, params=None):
+    def list_service_templates(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/service-templates'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_service_templates(self, **kwargs):
@@ -44,17 +42,19 @@ class ServiceClient(base.BaseContrailClient):
         :return:
         """
         url = '/service-templates'
-        post_body = json.dumps({'service-template': kwargs})
+        post_body = base.json_dumps({'service-template': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_service_template(self, template_id):
+    def show_service_template(self, template_id, **projection):
         """
         :param template_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/service-template/%s' % str(template_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_service_template(self, template_id):
@@ -73,19 +73,19 @@ class ServiceClient(base.BaseContrailClient):
         """
         url = '/service-template/%s' % str(template_id)
         put_data = {'service-template': kwargs}
-        req_put_data = json.dumps(put_data)
+        req_put_data = base.json_dumps(put_data)
         resp, body = self.put(url, req_put_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def list_service_health_checks(self, params=None):
+    def list_service_health_checks(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/service-health-checks'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_service_health_checks(self, **kwargs):
@@ -94,17 +94,19 @@ class ServiceClient(base.BaseContrailClient):
         :return:
         """
         url = '/service-health-checks'
-        post_body = json.dumps({'service-health-check': kwargs})
+        post_body = base.json_dumps({'service-health-check': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_service_health_check(self, template_id):
+    def show_service_health_check(self, template_id, **projection):
         """
         :param template_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/service-health-check/%s' % str(template_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_service_health_check(self, template_id):
@@ -123,9 +125,9 @@ class ServiceClient(base.BaseContrailClient):
         """
         url = '/service-health-check/%s' % str(template_id)
         put_data = {'service-health-check': kwargs}
-        req_put_data = json.dumps(put_data)
+        req_put_data = base.json_dumps(put_data)
         resp, body = self.put(url, req_put_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_service_instances(self, **kwargs):
@@ -134,17 +136,19 @@ class ServiceClient(base.BaseContrailClient):
         :return:
         """
         url = '/service-instances'
-        post_body = json.dumps({'service-instance': kwargs})
+        post_body = base.json_dumps({'service-instance': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_service_instance(self, template_id):
+    def show_service_instance(self, template_id, **projection):
         """
         :param template_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/service-instance/%s' % str(template_id)
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_service_instance(self, template_id):
@@ -155,14 +159,14 @@ class ServiceClient(base.BaseContrailClient):
         url = '/service-instance/%s' % str(template_id)
         return self.delete(url)
 
-    def list_service_instances(self, params=None):
+    def list_service_instances(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/service-instances'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def update_service_instance(self, template_id, **kwargs):
@@ -173,7 +177,7 @@ class ServiceClient(base.BaseContrailClient):
         """
         url = '/service-instance/%s' % str(template_id)
         put_data = {'service-instance': kwargs}
-        req_put_data = json.dumps(put_data)
+        req_put_data = base.json_dumps(put_data)
         resp, body = self.put(url, req_put_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
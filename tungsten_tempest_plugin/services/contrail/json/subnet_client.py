@@ -17,8 +17,6 @@
 Tempest service class for subnet test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,16 +26,16 @@ class SubnetClient(base.BaseContrailClient):
     Service class for subnet client test cases
     """
 
-    def list_subnets(self, params=None):
+    def list_subnets(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/subnets'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_subnets(self, **kwargs):
@@ -46,21 +44,21 @@ class SubnetClient(base.BaseContrailClient):
         :return:
         """
         url = '/subnets'
-        resp, body = self.post(url, json.dumps({'subnet': kwargs}))
-        body = json.loads(body)
+        resp, body = self.post(url, base.json_dumps({'subnet': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_subnet(self, uuid, params=None):
+    def show_subnet(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/subnet/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_subnet(self, uuid, **kwargs):
@@ -70,8 +68,8 @@ class SubnetClient(base.BaseContrailClient):
         :return:
         """
         url = '/subnet/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'subnet': kwargs}))
-        body = json.loads(body)
+        resp, body = self.put(url, base.json_dumps({'subnet': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_subnet(self, uuid):
@@ -0,0 +1,62 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Auth provider for a known endpoint and a token obtained elsewhere
+"""
+
+from tempest.lib import auth
+
+
+class StaticTokenAuthProvider(auth.AuthProvider):
+    """Auth provider handing out a static token for a fixed base URL.
+
+    It lets the service clients run outside a tempest run, without a
+    keystone catalog, e.g. against a token from ``openstack token issue``.
+
+    :param base_url: URL of the config API, requests are sent below it
+    :param tenant_name: project name reported by the credentials
+    :param token: value of the X-Auth-Token header
+    """
+
+    def __init__(self, base_url, tenant_name='admin', token=''):
+        credentials = auth.KeystoneV3Credentials(
+            username='admin', password='secret', project_name=tenant_name,
+            user_domain_name='Default', project_domain_name='Default')
+        super(StaticTokenAuthProvider, self).__init__(credentials)
+        self._base_url = base_url
+        self._token = token
+
+    @classmethod
+    def check_credentials(cls, credentials):
+        return True
+
+    def _fill_credentials(self, auth_data_body):
+        pass
+
+    def _get_auth(self):
+        return self._token, {}
+
+    def is_expired(self, auth_data):
+        return False
+
+    def base_url(self, filters, auth_data=None):
+        return self._base_url
+
+    def _decorate_request(self, filters, method, url, headers=None,
+                          body=None, auth_data=None):
+        headers = dict(headers or {})
+        headers['X-Auth-Token'] = self.get_auth()[0]
+        return self._base_url + url, headers, body
@@ -17,8 +17,6 @@
 Tempest service class for dns test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -29,14 +27,14 @@ class VirtualDNSClient(base.BaseContrailClient):
     Service class for virtual dns test cases
     """
 
-    def list_virtual_dns(self, params=None):
+    def list_virtual_dns(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-DNSs'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_virtual_dns(self, **kwargs):
@@ -45,17 +43,19 @@ class VirtualDNSClient(base.BaseContrailClient):
         :return:
         """
         url = '/virtual-DNSs'
-        post_body = json.dumps({'virtual-DNS': kwargs})
+        post_body = base.json_dumps({'virtual-DNS': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_virtual_dns(self, dns_id):
+    def show_virtual_dns(self, dns_id, **projection):
         """
         :param dns_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-DNS/%s' % dns_id
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def delete_virtual_dns(self, dns_id):
@@ -73,19 +73,19 @@ class VirtualDNSClient(base.BaseContrailClient):
         :return:
         """
         url = '/virtual-DNS/%s' % dns_id
-        post_body = json.dumps({'virtual-DNS': kwargs})
+        post_body = base.json_dumps({'virtual-DNS': kwargs})
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def list_virtual_dns_records(self, params=None):
+    def list_virtual_dns_records(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-DNS-records'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         return self.get(url)
 
     def create_virtual_dns_records(self, **kwargs):
@@ -94,9 +94,9 @@ class VirtualDNSClient(base.BaseContrailClient):
         :return:
         """
         url = '/virtual-DNS-records'
-        post_body = json.dumps({'virtual-DNS-record': kwargs})
+        post_body = base.json_dumps({'virtual-DNS-record': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_virtual_dns_record(self, dns_record_id):
@@ -107,12 +107,14 @@ class VirtualDNSClient(base.BaseContrailClient):
         url = 'virtual-DNS-record/%s' % dns_record_id
         return self.delete(url)
 
-    def show_virtual_dns_record(self, dns_record_id):
+    def show_virtual_dns_record(self, dns_record_id, **projection):
         """
         :param dns_record_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-DNS-record/%s' % dns_record_id
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def update_virtual_dns_record(self, dns_record_id, **kwargs):
@@ -122,7 +124,7 @@ class VirtualDNSClient(base.BaseContrailClient):
         :return:
         """
         url = '/virtual-DNS-record/%s' % dns_record_id
-        post_body = json.dumps({'virtual-DNS-record': kwargs})
+        post_body = base.json_dumps({'virtual-DNS-record': kwargs})
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
@@ -17,8 +17,6 @@
 Tempest service class for virtual ip test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -28,16 +26,16 @@ class VirtualIPClient(base.BaseContrailClient):
     Service class for virtual ip test cases
     """
 
-    def list_virtual_ips(self, params=None):
+    def list_virtual_ips(self, params=None, **projection):
         """
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-ips'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_virtual_ips(self, **kwargs):
@@ -46,21 +44,21 @@ class VirtualIPClient(base.BaseContrailClient):
         :return:
         """
         url = '/virtual-ips'
-        resp, body = self.post(url, json.dumps({'virtual-ip': kwargs}))
-        body = json.loads(body)
+        resp, body = self.post(url, base.json_dumps({'virtual-ip': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_virtual_ip(self, uuid, params=None):
+    def show_virtual_ip(self, uuid, params=None, **projection):
         """
         :param uuid:
         :param params:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-ip/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
+        url = self._query_url(url, params, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_virtual_ip(self, uuid, **kwargs):
@@ -70,8 +68,8 @@ class VirtualIPClient(base.BaseContrailClient):
         :return:
         """
         url = '/virtual-ip/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'virtual-ip': kwargs}))
-        body = json.loads(body)
+        resp, body = self.put(url, base.json_dumps({'virtual-ip': kwargs}))
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_virtual_ip(self, uuid):
@@ -17,7 +17,6 @@
 Tempest service class for virtual network test cases
 """
 
-from oslo_serialization import jsonutils as json
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -27,11 +26,13 @@ class VirtualNetworkClient(base.BaseContrailClient):
     Service class for virtual n/w test cases
     """
 
-    def list_virtual_networks(self):
+    def list_virtual_networks(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-networks'
+        url = self._query_url(url, **projection)
         return self.get(url)
 
     def create_virtual_networks(self, **kwargs):
@@ -40,9 +41,9 @@ class VirtualNetworkClient(base.BaseContrailClient):
         :return:
         """
         url = '/virtual-networks'
-        post_body = json.dumps({'virtual-network': kwargs})
+        post_body = base.json_dumps({'virtual-network': kwargs})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def update_virtual_network(self, uuid, **kwargs):
@@ -53,9 +54,9 @@ class VirtualNetworkClient(base.BaseContrailClient):
         """
         url = '/virtual-network/%s' % uuid
         post_data = {'virtual-network': kwargs}
-        req_post_data = json.dumps(post_data)
+        req_post_data = base.json_dumps(post_data)
         resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_virtual_network(self, uuid):
@@ -66,10 +67,12 @@ class VirtualNetworkClient(base.BaseContrailClient):
         url = '/virtual-network/%s' % uuid
         return self.delete(url)
 
-    def show_virtual_network(self, uuid):
+    def show_virtual_network(self, uuid, **projection):
         """
         :param uuid:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-network/%s' % uuid
+        url = self._query_url(url, **projection)
         return self.get(url)
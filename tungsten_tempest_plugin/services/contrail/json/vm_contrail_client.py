@@ -17,7 +17,6 @@
 Tempest service class for virtual machine test cases
 """
 
-import json
 from tungsten_tempest_plugin.services.contrail.json import base
 
 
@@ -27,13 +26,15 @@ class VmContrailClient(base.BaseContrailClient):
     Service class for vm test cases
     """
 
-    def list_virtual_machine_interfaces(self):
+    def list_virtual_machine_interfaces(self, **projection):
         """
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-machine-interfaces'
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def create_vm_interfaces(self, **kwargs):
@@ -41,20 +42,22 @@ class VmContrailClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'virtual-machine-interface': kwargs})
+        post_body = base.json_dumps({'virtual-machine-interface': kwargs})
         url = '/virtual-machine-interfaces'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
-    def show_virtual_machine_interface(self, instance_id):
+    def show_virtual_machine_interface(self, instance_id, **projection):
         """
         :param instance_id:
+        :param projection: fields, detail, exclude_back_refs, exclude_children
         :return:
         """
         url = '/virtual-machine-interface/%s' % instance_id
+        url = self._query_url(url, **projection)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
 
     def delete_vm_interface(self, instance_id):
@@ -71,8 +74,8 @@ class VmContrailClient(base.BaseContrailClient):
         :param kwargs:
         :return:
         """
-        post_body = json.dumps({'virtual-machine-interface': kwargs})
+        post_body = base.json_dumps({'virtual-machine-interface': kwargs})
         url = '/virtual-machine-interface/%s' % instance_id
         resp, body = self.put(url, post_body)
-        body = json.loads(body)
+        body = base.json_loads(body)
         return base.ResponseBody(resp, body)
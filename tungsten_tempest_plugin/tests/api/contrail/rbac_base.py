@@ -17,88 +17,29 @@
 Base class for contrail testing against RBAC rules
 """
 
+import functools
+import json
+
 from oslo_log import log as logging
 from patrole_tempest_plugin import rbac_utils
 from tempest import config
+from tempest.lib.common.utils import data_utils
 from tempest.lib import exceptions
 from tempest import test
 
-from tungsten_tempest_plugin.services.contrail.json.access_control_client \
-    import AccessControlClient
-from tungsten_tempest_plugin.services.contrail.json.alarm_client \
-    import AlarmClient
-from tungsten_tempest_plugin.services.contrail.json.alias_ip_client \
-    import AliasIPsClient
-from tungsten_tempest_plugin.services.contrail.json.analytics_node_client \
-    import AnalyticsNodeClient
-from tungsten_tempest_plugin.services.contrail.json.\
-    attachments_client import AttachmentsClient
-from tungsten_tempest_plugin.services.contrail.json.bgp_as_a_service_client \
-    import BGPAsAServiceClient
-from tungsten_tempest_plugin.services.contrail.json.config_client import \
-    ConfigClient
-from tungsten_tempest_plugin.services.contrail.json.contrail_client import \
-    ContrailClient
-from tungsten_tempest_plugin.services.contrail.json.database_client import \
-    ContrailDatabaseClient
-from tungsten_tempest_plugin.services.contrail.json.\
-    discovery_service_assignment_client import DiscoveryServiceAssignmentClient
-from tungsten_tempest_plugin.services.contrail.json.domain_client import \
-    DomainClient
-from tungsten_tempest_plugin.services.contrail.json.dsa_rule_client \
-    import DSARuleClient
-from tungsten_tempest_plugin.services.contrail.json.floating_ip_client import \
-    FloatingIpClient
-from tungsten_tempest_plugin.services.contrail.json.forwarding_class_client \
-    import ForwardingClassClient
-from tungsten_tempest_plugin.services.contrail.json.fq_client import \
-    FqnameIdClient
-from tungsten_tempest_plugin.services.contrail.json.instance_ip_client import \
-    InstanceIPClient
-from tungsten_tempest_plugin.services.contrail.json.interface_client import \
-    InterfaceClient
-from tungsten_tempest_plugin.services.contrail.json.\
-    load_balancer_client import LoadBalancerClient
-from tungsten_tempest_plugin.services.contrail.json.namespace_client import \
-    NamespaceClient
-from tungsten_tempest_plugin.services.contrail.json.network_ipams_client \
-    import NetworkIpamsClient
-from tungsten_tempest_plugin.services.contrail.json.\
-    network_policy_client import NetworkPolicyClient
-from tungsten_tempest_plugin.services.contrail.json.port_tuple_client import \
-    PortTupleClient
-from tungsten_tempest_plugin.services.contrail.json.project_client import \
-    ProjectClient
-from tungsten_tempest_plugin.services.contrail.json.qos_client import \
-    QosContrailClient
-from tungsten_tempest_plugin.services.contrail.json.route_client \
-    import RouteClient
-from tungsten_tempest_plugin.services.contrail.json.router_client \
-    import RouterClient
-from tungsten_tempest_plugin.services.contrail.json.routing_client \
-    import RoutingClient
-from tungsten_tempest_plugin.services.contrail.json.\
-    routing_policy_client import RoutingPolicyClient
-from tungsten_tempest_plugin.services.contrail.json.security_group_client \
-    import SecurityGroupClient
-from tungsten_tempest_plugin.services.contrail.json.service_appliances_client \
-    import ServiceAppliancesClient
-from tungsten_tempest_plugin.services.contrail.json.service_client \
-    import ServiceClient
-from tungsten_tempest_plugin.services.contrail.json.subnet_client \
-    import SubnetClient
-from tungsten_tempest_plugin.services.contrail.json.virtual_dns_client import \
-    VirtualDNSClient
-from tungsten_tempest_plugin.services.contrail.json.\
-    virtual_ip_client import VirtualIPClient
-from tungsten_tempest_plugin.services.contrail.json.\
-    virtual_network_client import VirtualNetworkClient
-from tungsten_tempest_plugin.services.contrail.json.vm_contrail_client import \
-    VmContrailClient
+from tungsten_tempest_plugin.common import client_registry
+from tungsten_tempest_plugin.common import fixture_pool
+from tungsten_tempest_plugin.common import rbac_report
+from tungsten_tempest_plugin.common import resource_builder
+from tungsten_tempest_plugin.common import teardown
+from tungsten_tempest_plugin.common import tenant_cache
 
 CONF = config.CONF
 LOG = logging.getLogger(__name__)
 
+# Client modules are only imported once a test class uses the client.
+_CLIENTS = 'tungsten_tempest_plugin.services.contrail.json.'
+
 
 def get_contail_version():
     return float(CONF.sdn.contrail_version)
@@ -110,6 +51,84 @@ class BaseContrailTest(rbac_utils.RbacUtilsMixin, test.BaseTestCase):
 
     required_contrail_version = None
 
+    # Role ids last assigned to the primary user by _override_role, None
+    # until known.
+    _active_role_ids = None
+
+    access_control_client = client_registry.LazyClient(
+        _CLIENTS + 'access_control_client.AccessControlClient')
+    alarm_client = client_registry.LazyClient(
+        _CLIENTS + 'alarm_client.AlarmClient')
+    vm_client = client_registry.LazyClient(
+        _CLIENTS + 'vm_contrail_client.VmContrailClient')
+    dsa_client = client_registry.LazyClient(
+        _CLIENTS + 'discovery_service_assignment_client.'
+        'DiscoveryServiceAssignmentClient')
+    dsa_rule_client = client_registry.LazyClient(
+        _CLIENTS + 'dsa_rule_client.DSARuleClient')
+    forwarding_class_client = client_registry.LazyClient(
+        _CLIENTS + 'forwarding_class_client.ForwardingClassClient')
+    qos_client = client_registry.LazyClient(
+        _CLIENTS + 'qos_client.QosContrailClient')
+    routing_client = client_registry.LazyClient(
+        _CLIENTS + 'routing_client.RoutingClient')
+    security_group_client = client_registry.LazyClient(
+        _CLIENTS + 'security_group_client.SecurityGroupClient')
+    service_appliances_client = client_registry.LazyClient(
+        _CLIENTS + 'service_appliances_client.ServiceAppliancesClient')
+    analytics_node_client = client_registry.LazyClient(
+        _CLIENTS + 'analytics_node_client.AnalyticsNodeClient')
+    vn_client = client_registry.LazyClient(
+        _CLIENTS + 'virtual_network_client.VirtualNetworkClient')
+    db_client = client_registry.LazyClient(
+        _CLIENTS + 'database_client.ContrailDatabaseClient')
+    fip_client = client_registry.LazyClient(
+        _CLIENTS + 'floating_ip_client.FloatingIpClient')
+    fq_client = client_registry.LazyClient(
+        _CLIENTS + 'fq_client.FqnameIdClient')
+    virtual_ip_client = client_registry.LazyClient(
+        _CLIENTS + 'virtual_ip_client.VirtualIPClient')
+    virtual_dns_client = client_registry.LazyClient(
+        _CLIENTS + 'virtual_dns_client.VirtualDNSClient')
+    domain_client = client_registry.LazyClient(
+        _CLIENTS + 'domain_client.DomainClient')
+    project_client = client_registry.LazyClient(
+        _CLIENTS + 'project_client.ProjectClient')
+    port_tuple_client = client_registry.LazyClient(
+        _CLIENTS + 'port_tuple_client.PortTupleClient')
+    network_policy_client = client_registry.LazyClient(
+        _CLIENTS + 'network_policy_client.NetworkPolicyClient')
+    routing_policy_client = client_registry.LazyClient(
+        _CLIENTS + 'routing_policy_client.RoutingPolicyClient')
+    namespace_client = client_registry.LazyClient(
+        _CLIENTS + 'namespace_client.NamespaceClient')
+    network_ipams_client = client_registry.LazyClient(
+        _CLIENTS + 'network_ipams_client.NetworkIpamsClient')
+    bgp_as_a_service_client = client_registry.LazyClient(
+        _CLIENTS + 'bgp_as_a_service_client.BGPAsAServiceClient')
+    iip_client = client_registry.LazyClient(
+        _CLIENTS + 'instance_ip_client.InstanceIPClient')
+    subnet_client = client_registry.LazyClient(
+        _CLIENTS + 'subnet_client.SubnetClient')
+    load_balancer_client = client_registry.LazyClient(
+        _CLIENTS + 'load_balancer_client.LoadBalancerClient')
+    route_client = client_registry.LazyClient(
+        _CLIENTS + 'route_client.RouteClient')
+    interface_client = client_registry.LazyClient(
+        _CLIENTS + 'interface_client.InterfaceClient')
+    router_client = client_registry.LazyClient(
+        _CLIENTS + 'router_client.RouterClient')
+    service_client = client_registry.LazyClient(
+        _CLIENTS + 'service_client.ServiceClient')
+    attachments_client = client_registry.LazyClient(
+        _CLIENTS + 'attachments_client.AttachmentsClient')
+    config_client = client_registry.LazyClient(
+        _CLIENTS + 'config_client.ConfigClient')
+    alias_ip_client = client_registry.LazyClient(
+        _CLIENTS + 'alias_ip_client.AliasIPsClient')
+    contrail_client = client_registry.LazyClient(
+        _CLIENTS + 'contrail_client.ContrailClient')
+
     @classmethod
     def skip_if_contrail_version_less(cls, version):
         if get_contail_version() < version:
@@ -129,258 +148,18 @@ class BaseContrailTest(rbac_utils.RbacUtilsMixin, test.BaseTestCase):
 
     @classmethod
     def setup_clients(cls):
+        # Each class gets its own primary user, so nothing is known about
+        # its roles yet.
+        cls._active_role_ids = None
         super(BaseContrailTest, cls).setup_clients()
         cls.auth_provider = cls.os_primary.auth_provider
         cls.admin_client = cls.os_admin.networks_client
         dscv = CONF.identity.disable_ssl_certificate_validation
         ca_certs = CONF.identity.ca_certificates_file
 
-        cls.access_control_client = AccessControlClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.alarm_client = AlarmClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.vm_client = VmContrailClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.dsa_client = DiscoveryServiceAssignmentClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.dsa_rule_client = DSARuleClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.forwarding_class_client = ForwardingClassClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.qos_client = QosContrailClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.routing_client = RoutingClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.security_group_client = SecurityGroupClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.service_appliances_client = ServiceAppliancesClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.analytics_node_client = AnalyticsNodeClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.vn_client = VirtualNetworkClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.db_client = ContrailDatabaseClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.fip_client = FloatingIpClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.fq_client = FqnameIdClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.virtual_ip_client = VirtualIPClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.virtual_dns_client = VirtualDNSClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.domain_client = DomainClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.project_client = ProjectClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.port_tuple_client = PortTupleClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.network_policy_client = NetworkPolicyClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.routing_policy_client = RoutingPolicyClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.namespace_client = NamespaceClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.network_ipams_client = NetworkIpamsClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.bgp_as_a_service_client = BGPAsAServiceClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.iip_client = InstanceIPClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.subnet_client = SubnetClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.load_balancer_client = LoadBalancerClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.route_client = RouteClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.interface_client = InterfaceClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.router_client = RouterClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.service_client = ServiceClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.attachments_client = AttachmentsClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.config_client = ConfigClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.alias_ip_client = AliasIPsClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.contrail_client = ContrailClient(
+        # Contrail clients are declared as LazyClient attributes above and
+        # are only built when a test class first touches them.
+        cls._client_registry = client_registry.ClientRegistry(
             cls.auth_provider,
             CONF.sdn.catalog_type,
             CONF.identity.region,
@@ -388,12 +167,225 @@ class BaseContrailTest(rbac_utils.RbacUtilsMixin, test.BaseTestCase):
             disable_ssl_certificate_validation=dscv,
             ca_certs=ca_certs)
 
+    @classmethod
+    def _override_role(cls, toggle_rbac_role=False):
+        # Patrole lists the user's roles on every switch and, even when
+        # they already match, drops and re-issues the tokens. The roles of
+        # the primary user only change through here and restore_roles, so
+        # a switch to the roles already assigned can be skipped entirely.
+        # The RBAC report times what runs between the two switches.
+        if not toggle_rbac_role:
+            rbac_report.end_window()
+        target_role_ids = set(cls._rbac_role_ids if toggle_rbac_role
+                              else [cls._admin_role_id])
+        if target_role_ids == cls._active_role_ids:
+            LOG.debug('Roles %s already assigned, not overriding',
+                      sorted(target_role_ids))
+        else:
+            cls._active_role_ids = None
+            super(BaseContrailTest, cls)._override_role(toggle_rbac_role)
+            cls._active_role_ids = target_role_ids
+        if toggle_rbac_role:
+            rbac_report.start_window()
+
+    @classmethod
+    def restore_roles(cls):
+        cls._active_role_ids = None
+        super(BaseContrailTest, cls).restore_roles()
+
     @classmethod
     def resource_setup(cls):
         cls.tenant_name = cls.os_primary.credentials.tenant_name
-        cls.tenant_id = cls.fq_client.fqname_to_id(fq_name=['default-domain',
-                                                            cls.tenant_name],
-                                                   type='project')['uuid']
+
+        fq_name = ['default-domain', cls.tenant_name]
+
+        def resolve_tenant_id():
+            return cls.fq_client.fqname_to_id(
+                fq_name=fq_name, type='project', use_cache=True)['uuid']
+
+        def is_tenant_id(uuid):
+            try:
+                body = cls.fq_client.id_to_fqname(uuid=uuid)
+            except exceptions.NotFound:
+                return False
+            return body.get('fq_name') == fq_name
+
+        cls.tenant_id = tenant_cache.tenant_cache.lookup(
+            cls.fq_client.base_url, cls.tenant_name, resolve_tenant_id,
+            path=CONF.sdn.tenant_cache_file, ttl=CONF.sdn.tenant_cache_ttl,
+            validate=is_tenant_id)
+
+    @classmethod
+    def resource_cleanup(cls):
+        # Logged once the class cleanups ran, so the stats cover them and
+        # a logging error cannot keep them from running.
+        super(BaseContrailTest, cls).resource_cleanup()
+        registry = getattr(cls, '_client_registry', None)
+        if registry is not None:
+            built = registry.built_clients
+            LOG.info("%s used %d Contrail clients: %s", cls.__name__,
+                     len(built), ', '.join(built))
+            if built:
+                cls._log_client_stats()
+
+    @staticmethod
+    def _log_client_stats():
+        # Imported here rather than with this module: they are loaded with
+        # the first Contrail client, and listing the tests needs none.
+        from tungsten_tempest_plugin.services.contrail.json import cache
+        from tungsten_tempest_plugin.services.contrail.json import http_pool
+        from tungsten_tempest_plugin.services.contrail.json import rate_limit
+        from tungsten_tempest_plugin.services.contrail.json import retry
+
+        LOG.debug("Contrail HTTP pool: %(requests)d requests, %(hits)d on "
+                  "reused connections, %(misses)d new connections",
+                  http_pool.pool_stats())
+        LOG.debug("Contrail fq_name cache: %(hits)d hits, %(misses)d "
+                  "misses, %(evictions)d evictions, %(invalidations)d "
+                  "invalidations", cache.fqname_cache.stats())
+        if CONF.sdn.rate_limit:
+            LOG.debug("Contrail rate limiter: %.1fs spent waiting by this "
+                      "worker", rate_limit.total_waited())
+        retries = retry.retry_stats.stats()
+        if retries['retries']:
+            LOG.info("Contrail retries: %(retries)d requests retried, "
+                     "%(exhausted)d still failing after retrying, by "
+                     "status: %(statuses)s", retries)
+        if CONF.sdn.conditional_get:
+            LOG.debug("Contrail response cache: %(revalidated)d responses "
+                      "reused after revalidation, %(refetched)d refetched",
+                      cache.response_cache.stats())
+
+    @classmethod
+    def _acquire_fixture(cls, kind, spec, create, delete):
+        """Return a parent resource, shared with other classes if enabled.
+
+        With sdn.share_fixtures set and static credentials, classes asking
+        for the same kind and spec in the same tenant get one object per
+        test worker, deleted when the worker exits. Otherwise the object is
+        created for this class and deleted at class teardown.
+
+        :param kind: resource type, e.g. 'virtual-network'
+        :param spec: string describing everything the class relies on
+        :param create: callable creating the resource and returning it
+        :param delete: client delete method, called with the resource uuid
+        :return: resource dict
+        """
+        if (not CONF.sdn.share_fixtures or
+                CONF.auth.use_dynamic_credentials):
+            resource = create()
+            cls.addClassResourceCleanup(cls._try_delete_resource, delete,
+                                        resource['uuid'])
+            return resource
+        return fixture_pool.pool.get(
+            (kind, cls.tenant_name, spec), create,
+            lambda resource: cls._try_delete_resource(delete,
+                                                      resource['uuid']))
+
+    @classmethod
+    def _acquire_network(cls, subnet=None, project_name=None, **properties):
+        """Return a project network, and the IPAM holding its subnet.
+
+        :param subnet: dict with ip_prefix and ip_prefix_len, or None for a
+                       network without IPAM
+        :param project_name: parent project, defaults to the test tenant
+        :param properties: additional virtual network attributes
+        :return: (ipam, network) tuple, ipam is None without a subnet
+        """
+        project_name = project_name or cls.tenant_name
+        spec = json.dumps([project_name, subnet, properties], sort_keys=True)
+        ipam = None
+        if subnet:
+            def create_ipam():
+                fq_name = ['default-domain', project_name,
+                           data_utils.rand_name('rbac-ipam')]
+                return cls.network_ipams_client.create_network_ipams(
+                    parent_type='project', fq_name=fq_name)['network-ipam']
+
+            ipam = cls._acquire_fixture(
+                'network-ipam', spec, create_ipam,
+                cls.network_ipams_client.delete_network_ipam)
+
+        def create_network():
+            post_body = dict(properties, parent_type='project')
+            post_body['fq_name'] = ['default-domain', project_name,
+                                    data_utils.rand_name('rbac-network')]
+            if ipam:
+                post_body['network_ipam_refs'] = [{
+                    'to': ipam['fq_name'],
+                    'href': ipam['href'],
+                    'uuid': ipam['uuid'],
+                    'attr': {'ipam_subnets': [{'subnet': subnet}]}
+                }]
+            return cls.vn_client.create_virtual_networks(
+                **post_body)['virtual-network']
+
+        network = cls._acquire_fixture(
+            'virtual-network', spec, create_network,
+            cls.vn_client.delete_virtual_network)
+        return ipam, network
+
+    def setUp(self):
+        super(BaseContrailTest, self).setUp()
+        rbac_report.start_test(self.id())
+
+    @classmethod
+    def _queues_deletion(cls, function):
+        return (CONF.sdn.teardown_workers > 1 and
+                getattr(function, '__func__', None) is
+                BaseContrailTest._try_delete_resource.__func__)
+
+    def addCleanup(self, function, *args, **kwargs):
+        # Consecutive resource deletions are collected and run together,
+        # children first and in parallel, by one cleanup registered with
+        # the first of them. Any other cleanup closes the batch, so it
+        # still runs between the deletions registered around it.
+        if not self._queues_deletion(function):
+            self._teardown_queue = None
+            super(BaseContrailTest, self).addCleanup(function, *args,
+                                                     **kwargs)
+            return
+        queue = getattr(self, '_teardown_queue', None)
+        if queue is None:
+            queue = teardown.TeardownQueue(CONF.sdn.teardown_workers)
+            self._teardown_queue = queue
+            super(BaseContrailTest, self).addCleanup(self._flush_teardown,
+                                                     queue)
+        queue.add(*args, **kwargs)
+
+    def _flush_teardown(self, queue):
+        if getattr(self, '_teardown_queue', None) is queue:
+            self._teardown_queue = None
+        queue.flush()
+
+    @classmethod
+    def addClassResourceCleanup(cls, cleanup_callable, *args, **kwargs):
+        # Same batching as addCleanup, for the class-level cleanups.
+        if not cls._queues_deletion(cleanup_callable):
+            cls._class_teardown_queue = None
+            super(BaseContrailTest, cls).addClassResourceCleanup(
+                cleanup_callable, *args, **kwargs)
+            return
+        queue = cls.__dict__.get('_class_teardown_queue')
+        if queue is None:
+            queue = teardown.TeardownQueue(CONF.sdn.teardown_workers)
+            cls._class_teardown_queue = queue
+            super(BaseContrailTest, cls).addClassResourceCleanup(
+                cls._flush_class_teardown, queue)
+        queue.add(*args, **kwargs)
+
+    @classmethod
+    def _flush_class_teardown(cls, queue):
+        if cls.__dict__.get('_class_teardown_queue') is queue:
+            cls._class_teardown_queue = None
+        queue.flush()
+
+    def _resource_builder(self):
+        """Return a ResourceBuilder registering test-level cleanups."""
+        return resource_builder.ResourceBuilder(
+            add_cleanup=functools.partial(self.addCleanup,
+                                          self._try_delete_resource),
+            workers=CONF.sdn.bulk_workers)
 
     @classmethod
     def _try_delete_resource(cls, delete_callable, *args, **kwargs):
@@ -33,49 +33,23 @@ class AliasIPsTest(rbac_base.BaseContrailTest):
     @classmethod
     def resource_setup(cls):
         super(AliasIPsTest, cls).resource_setup()
-        # Create project
-        project_name = data_utils.rand_name('test-project')
-        project_fq_name = ['default-domain', project_name]
-        cls.project = cls.project_client.create_projects(
-            parent_type='domain',
-            fq_name=project_fq_name)['project']
-
-        # Create network ipam
-        ipam_name = data_utils.rand_name('test-ipam')
-        ipam_fq_name = ['default-domain', cls.project['name'], ipam_name]
-        subnet_info = [{'subnet': {'ip_prefix': '2.2.3.0',
-                                   'ip_prefix_len': 24}}]
-        cls.ipam = cls.network_ipams_client.create_network_ipams(
-            parent_type='project',
-            fq_name=ipam_fq_name)['network-ipam']
-
-        # Create network
-        net_name = data_utils.rand_name('test-net')
-        net_fq_name = ['default-domain', cls.project['name'], net_name]
-        net_ipam_refs = [
-            {
-                'to': cls.ipam['fq_name'],
-                'href': cls.ipam['href'],
-                'uuid': cls.ipam['uuid'],
-                'attr': {
-                    'ipam_subnets': subnet_info
-                }
-            }
-        ]
-        cls.network = cls.vn_client.create_virtual_networks(
-            parent_type='project',
-            fq_name=net_fq_name,
-            network_ipam_refs=net_ipam_refs)['virtual-network']
 
-    @classmethod
-    def resource_cleanup(cls):
-        cls._try_delete_resource(cls.vn_client.delete_virtual_network,
-                                 cls.network['uuid'])
-        cls._try_delete_resource(cls.network_ipams_client.delete_network_ipam,
-                                 cls.ipam['uuid'])
-        cls._try_delete_resource(cls.project_client.delete_project,
-                                 cls.project['uuid'])
-        super(AliasIPsTest, cls).resource_cleanup()
+        def create_project():
+            project_fq_name = ['default-domain',
+                               data_utils.rand_name('test-project')]
+            return cls.project_client.create_projects(
+                parent_type='domain',
+                fq_name=project_fq_name)['project']
+
+        # Create project
+        cls.project = cls._acquire_fixture(
+            'project', 'alias-ip', create_project,
+            cls.project_client.delete_project)
+
+        # Create network ipam and network
+        subnet_info = {'ip_prefix': '2.2.3.0', 'ip_prefix_len': 24}
+        cls.ipam, cls.network = cls._acquire_network(
+            subnet=subnet_info, project_name=cls.project['name'])
 
     def _create_alias_ip_pools(self):
         alias_ip_pool_name = data_utils.rand_name('test-alias-ip-pool')
@@ -20,7 +20,6 @@ Tempest test-case to test fqname ID objects using RBAC roles
 from oslo_log import log as logging
 from patrole_tempest_plugin import rbac_rule_validation
 from tempest import config
-from tempest.lib.common.utils import data_utils
 from tempest.lib import decorators
 
 from tungsten_tempest_plugin.tests.api.contrail import rbac_base
@@ -36,19 +35,9 @@ class FqnameIdTest(rbac_base.BaseContrailTest):
     def resource_setup(cls):
         super(FqnameIdTest, cls).resource_setup()
         # Create network to test fqname and uuid conversion
-        net_name = data_utils.rand_name('rbac-fq-network')
-        fq_name = ['default-domain', cls.tenant_name, net_name]
-        post_body = {'parent_type': 'project', 'fq_name': fq_name}
-        body = cls.vn_client.create_virtual_networks(**post_body)
-        cls.network = body['virtual-network']
+        _, cls.network = cls._acquire_network()
         cls.type = 'virtual-network'
 
-    @classmethod
-    def resource_cleanup(cls):
-        cls._try_delete_resource(cls.vn_client.delete_virtual_network,
-                                 cls.network['uuid'])
-        super(FqnameIdTest, cls).resource_cleanup()
-
     @rbac_rule_validation.action(service="Contrail",
                                  rules=["fqname_to_id"])
     @decorators.idempotent_id('1fc1350b-3146-49bc-9af5-a61a98b55541')
@@ -35,48 +35,11 @@ class InstanceIPTest(rbac_base.BaseContrailTest):
     @classmethod
     def resource_setup(cls):
         super(InstanceIPTest, cls).resource_setup()
-        # Create network ipam
-        ipam_name = data_utils.rand_name('rbac-iip-ipam')
-        fq_name_ipam = ['default-domain',
-                        cls.tenant_name,
-                        ipam_name]
         subnet_ip_prefix = {'ip_prefix': '1.2.3.0', 'ip_prefix_len': 24}
-        ipam_post_body = {'display_name': ipam_name,
-                          'fq_name': fq_name_ipam,
-                          'parent_type': 'project'}
-        body = cls.network_ipams_client.create_network_ipams(**ipam_post_body)
-        cls.ipam = body['network-ipam']
-
-        # Create network
-        net_name = data_utils.rand_name('rbac-iip-network')
-        fq_name = ['default-domain', cls.tenant_name, net_name]
-        post_body = {'parent_type': 'project',
-                     'router_external': True,
-                     'fq_name': fq_name,
-                     'network_ipam_refs': [
-                         {
-                             'to': cls.ipam['fq_name'],
-                             'href': cls.ipam['href'],
-                             'uuid': cls.ipam['uuid'],
-                             'attr': {
-                                 'ipam_subnets': [{'subnet': subnet_ip_prefix}]
-                             }
-                         }
-                     ],
-                     'virtual_network_properties': {
-                         'forwarding_mode': 'l3'
-                     }
-                     }
-        body = cls.vn_client.create_virtual_networks(**post_body)
-        cls.network = body['virtual-network']
-
-    @classmethod
-    def resource_cleanup(cls):
-        cls._try_delete_resource(cls.vn_client.delete_virtual_network,
-                                 cls.network['uuid'])
-        cls._try_delete_resource(cls.network_ipams_client.delete_network_ipam,
-                                 cls.ipam['uuid'])
-        super(InstanceIPTest, cls).resource_cleanup()
+        cls.ipam, cls.network = cls._acquire_network(
+            subnet=subnet_ip_prefix,
+            router_external=True,
+            virtual_network_properties={'forwarding_mode': 'l3'})
 
     def _create_instance_ip(self):
         iip_name = data_utils.rand_name('rbac-iip')
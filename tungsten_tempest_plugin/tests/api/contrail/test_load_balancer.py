@@ -114,7 +114,7 @@ class BaseLoadBalancerTest(rbac_base.BaseContrailTest):
             lb_listener_uuid,
             **put_body)
 
-    def _create_load_balancer_pool(self, return_object=False):
+    def _create_load_balancer_pool(self):
         fq_name = data_utils.rand_name('load_balancer-pool')
         post_body = {
             'parent_type': 'project',
@@ -126,8 +126,6 @@ class BaseLoadBalancerTest(rbac_base.BaseContrailTest):
         self.addCleanup(self._try_delete_resource,
                         self.load_balancer_client.delete_load_balancer_pool,
                         lb_pool_uuid)
-        if return_object:
-            return resp_body['loadbalancer-pool']
         return lb_pool_uuid
 
     def _update_load_balancer_pool(self, lb_pool_uuid):
@@ -138,21 +136,30 @@ class BaseLoadBalancerTest(rbac_base.BaseContrailTest):
                                                             **put_body)
 
     def _create_load_balancer_member(self):
-        lb_pool = self._create_load_balancer_pool(return_object=True)
-        fq_name = data_utils.rand_name('load_balancer-member')
-        post_body = {
-            'parent_type': 'loadbalancer-pool',
-            'fq_name': ['default-domain', self.tenant_name, lb_pool['name'],
-                        fq_name]
-        }
-        resp_body = self.load_balancer_client.create_load_balancer_members(
-            **post_body)
-        lb_member_uuid = resp_body['loadbalancer-member']['uuid']
-        self.addCleanup(self._try_delete_resource,
-                        self._delete_pool_and_member,
-                        lb_pool['uuid'],
-                        lb_member_uuid)
-        return lb_member_uuid
+        client = self.load_balancer_client
+        pool_name = data_utils.rand_name('load_balancer-pool')
+        member_name = data_utils.rand_name('load_balancer-member')
+
+        def create_pool(built):
+            return client.create_load_balancer_pools(
+                parent_type='project',
+                fq_name=['default-domain', self.tenant_name, pool_name]
+            )['loadbalancer-pool']
+
+        def create_member(built):
+            return client.create_load_balancer_members(
+                parent_type='loadbalancer-pool',
+                fq_name=['default-domain', self.tenant_name,
+                         built['pool']['name'], member_name]
+            )['loadbalancer-member']
+
+        # The member is deleted before its parent pool.
+        builder = self._resource_builder()
+        builder.add('pool', create_pool, client.delete_load_balancer_pool)
+        builder.add('member', create_member,
+                    client.delete_load_balancer_member,
+                    depends_on=['pool'])
+        return builder.build()['member']['uuid']
 
     def _update_load_balancer_member(self, lb_member_uuid):
         put_body = {
@@ -161,13 +168,6 @@ class BaseLoadBalancerTest(rbac_base.BaseContrailTest):
         self.load_balancer_client.update_load_balancer_member(lb_member_uuid,
                                                               **put_body)
 
-    def _delete_pool_and_member(self, lb_pool_uuid, lb_member_uuid):
-        # Used by _try_delete_resource in _create_load_balancer_member.
-        # Guarantees that child (lb member) is deleted before parent
-        # dependency (lb pool).
-        self.load_balancer_client.delete_load_balancer_member(lb_member_uuid)
-        self.load_balancer_client.delete_load_balancer_pool(lb_pool_uuid)
-
 
 class LoadBalancerContrailTest(BaseLoadBalancerTest):
     """Test class to test load balancer objects using RBAC roles"""
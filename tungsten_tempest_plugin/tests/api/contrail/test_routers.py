@@ -35,17 +35,7 @@ class BaseRouterTest(rbac_base.BaseContrailTest):
     @classmethod
     def resource_setup(cls):
         super(BaseRouterTest, cls).resource_setup()
-        net_name = data_utils.rand_name('test-net')
-        net_fq_name = ['default-domain', cls.tenant_name, net_name]
-        cls.network = cls.vn_client.create_virtual_networks(
-            parent_type='project',
-            fq_name=net_fq_name)['virtual-network']
-
-    @classmethod
-    def resource_cleanup(cls):
-        cls._try_delete_resource(cls.vn_client.delete_virtual_network,
-                                 cls.network['uuid'])
-        super(BaseRouterTest, cls).resource_cleanup()
+        _, cls.network = cls._acquire_network()
 
     def _create_physical_router(self):
         fq_name = data_utils.rand_name('physical-router-template')
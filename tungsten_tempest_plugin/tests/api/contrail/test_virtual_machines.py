@@ -35,37 +35,12 @@ class VMContrailTest(rbac_base.BaseContrailTest):
     @classmethod
     def resource_setup(cls):
         super(VMContrailTest, cls).resource_setup()
-        # Create subnet using ipam
-        ipam_name = data_utils.rand_name('rbac-fip-ipam')
-        fq_name_ipam = ['default-domain',
-                        cls.tenant_name,
-                        ipam_name]
         ip_cidr = CONF.network.project_network_cidr
         ip_prefix, ip_prefix_len = ip_cidr.split('/')
         subnet_ip_prefix = {'ip_prefix': ip_prefix,
                             'ip_prefix_len': int(ip_prefix_len)}
-        ipam_post_body = {'parent_type': 'project', 'fq_name': fq_name_ipam}
-        body = cls.network_ipams_client.create_network_ipams(**ipam_post_body)
-        cls.ipam = body['network-ipam']
-        # Create network
-        net_name = data_utils.rand_name('rbac-pool-network')
-        fq_name = ['default-domain', cls.tenant_name, net_name]
-        post_body = {'parent_type': 'project',
-                     'router_external': True,
-                     'fq_name': fq_name,
-                     'network_ipam_refs': [
-                         {
-                             'to': cls.ipam['fq_name'],
-                             'href': cls.ipam['href'],
-                             'uuid': cls.ipam['uuid'],
-                             'attr': {
-                                 'ipam_subnets': [{'subnet': subnet_ip_prefix}]
-                             }
-                         }
-                     ]
-                     }
-        body = cls.vn_client.create_virtual_networks(**post_body)
-        cls.network = body['virtual-network']
+        cls.ipam, cls.network = cls._acquire_network(
+            subnet=subnet_ip_prefix, router_external=True)
 
     def _delete_virtual_machine_interface(self, instance_id):
         return self.vm_client.delete_vm_interface(instance_id)
@@ -90,14 +65,6 @@ class VMContrailTest(rbac_base.BaseContrailTest):
                         interface['uuid'])
         return interface
 
-    @classmethod
-    def resource_cleanup(cls):
-        cls._try_delete_resource(cls.vn_client.delete_virtual_network,
-                                 cls.network['uuid'])
-        cls._try_delete_resource(cls.network_ipams_client.delete_network_ipam,
-                                 cls.ipam['uuid'])
-        super(VMContrailTest, cls).resource_cleanup()
-
     @rbac_rule_validation.action(service="Contrail",
                                  rules=["list_virtual_machine_interfaces"])
     @decorators.idempotent_id('e27d1fae-7324-4ef3-87b1-e7f519b1e2a7')
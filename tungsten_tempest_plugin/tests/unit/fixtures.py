@@ -0,0 +1,65 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Fixtures for tungsten-tempest unit tests."""
+
+import fixtures
+from tempest import config
+
+from tungsten_tempest_plugin.benchmarks import fake_contrail_api
+
+CONF = config.CONF
+
+
+class ConfPatcher(fixtures.Fixture):
+    """Fixture to patch and restore global CONF.
+
+    :param group: if specified all config options apply to that group
+    :param kwargs: option names and the values they are overridden with
+    """
+
+    def __init__(self, **kwargs):
+        super(ConfPatcher, self).__init__()
+        self.group = kwargs.pop('group', None)
+        self.args = kwargs
+
+    def setUp(self):
+        super(ConfPatcher, self).setUp()
+        for k, v in self.args.items():
+            self.addCleanup(CONF.clear_override, k, self.group)
+            CONF.set_override(k, v, self.group)
+
+
+class FakeContrailAPIFixture(fixtures.Fixture):
+    """Runs the in-process fake Contrail API for the duration of a test.
+
+    :param kwargs: passed to FakeContrailAPI
+    """
+
+    def __init__(self, **kwargs):
+        super(FakeContrailAPIFixture, self).__init__()
+        self.kwargs = kwargs
+
+    def setUp(self):
+        super(FakeContrailAPIFixture, self).setUp()
+        self.api = fake_contrail_api.FakeContrailAPI(**self.kwargs)
+        self.api.start()
+        self.addCleanup(self.api.stop)
+        self.auth_provider = self.api.auth_provider()
+
+    def client(self, client_class):
+        """Build a ``client_class`` instance talking to the fake API."""
+        return client_class(self.auth_provider, 'sdn', 'RegionOne',
+                            'publicURL')
@@ -0,0 +1,115 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+
+import six
+import testtools
+
+from tungsten_tempest_plugin.services.contrail.json import contrail_client
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+if not six.PY2:
+    import asyncio
+
+    from tungsten_tempest_plugin.services.contrail.json import aio
+
+
+class SlowClient(object):
+    """Client whose calls block for a while and count calls in flight."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def call(self, value):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return value
+
+    def pages(self):
+        for value in range(3):
+            yield value
+
+
+@testtools.skipIf(six.PY2, 'aio needs Python 3')
+class AsyncClientTest(base.TestCase):
+
+    def setUp(self):
+        super(AsyncClientTest, self).setUp()
+        self.useFixture(fixtures.ConfPatcher(http_pool_maxsize=2,
+                                             group='sdn'))
+        executor = {'pool': None, 'workers': 0}
+        self.patchobject(aio, '_executor', executor)
+        self.addCleanup(lambda: executor['pool'] and
+                        executor['pool'].shutdown())
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def _run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_gather_bounded_not_capped_by_pool_size(self):
+        slow = SlowClient()
+        client = aio.AsyncClient(slow)
+
+        results = self._run(aio.gather_bounded(
+            (client.call(i) for i in range(10)), limit=5))
+
+        self.assertEqual(list(range(10)), results)
+        self.assertEqual(5, slow.peak)
+
+    def test_executor_grows_only(self):
+        pool = aio.get_executor()
+
+        self.assertIs(pool, aio.get_executor(1))
+        self.assertIsNot(pool, aio.get_executor(4))
+        self.assertEqual(4, aio._executor['workers'])
+
+    def test_generator_returned_as_async_iterator(self):
+        client = aio.AsyncClient(SlowClient())
+        # No async syntax here: this module must still load on Python 2.
+        iterator = self._run(client.pages())
+        values = []
+        while True:
+            try:
+                values.append(self._run(iterator.__anext__()))
+            except StopAsyncIteration:
+                break
+
+        self.assertEqual([0, 1, 2], values)
+
+    def test_wraps_contrail_client(self):
+        fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        client = aio.AsyncClient.from_auth_provider(
+            contrail_client.ContrailClient, fake_api.auth_provider, 'sdn',
+            'RegionOne', 'publicURL')
+        bodies = [{'parent_type': 'project',
+                   'fq_name': ['default-domain', 'admin', 'vn-%d' % i]}
+                  for i in range(4)]
+
+        results = self._run(aio.gather_bounded(
+            (client.create_virtual_network(**body) for body in bodies),
+            limit=3))
+
+        self.assertEqual([body['fq_name'] for body in bodies],
+                         [r['virtual-network']['fq_name'] for r in results])
@@ -0,0 +1,114 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+
+from tempest.lib import exceptions
+
+from tungsten_tempest_plugin.common import concurrency
+from tungsten_tempest_plugin.services.contrail.json import contrail_client
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+
+class MapBoundedTest(base.TestCase):
+
+    def test_results_in_input_order(self):
+        def slow_square(value):
+            time.sleep(0.01 * (5 - value))
+            return value * value
+
+        result = concurrency.map_bounded(slow_square, range(5), workers=5)
+
+        self.assertEqual([0, 1, 4, 9, 16], result.results)
+        self.assertEqual([0, 1, 2, 3, 4], [item.index for item in result])
+
+    def test_workers_bound_calls_in_flight(self):
+        lock = threading.Lock()
+        counters = {'running': 0, 'peak': 0}
+
+        def call(value):
+            with lock:
+                counters['running'] += 1
+                counters['peak'] = max(counters['peak'],
+                                       counters['running'])
+            time.sleep(0.02)
+            with lock:
+                counters['running'] -= 1
+
+        concurrency.map_bounded(call, range(12), workers=3)
+
+        self.assertEqual(3, counters['peak'])
+
+    def test_errors_reported_per_item(self):
+        def call(value):
+            if value % 2:
+                raise ValueError(value)
+            return value
+
+        result = concurrency.map_bounded(call, range(4), workers=2)
+
+        self.assertEqual([1, 3], [item.index for item in result.errors])
+        self.assertEqual(2, result.stats()['succeeded'])
+        self.assertRaises(ValueError, result.raise_first_error)
+
+    def test_no_items(self):
+        result = concurrency.map_bounded(lambda item: item, [])
+
+        self.assertEqual([], result)
+        self.assertEqual(0, result.stats()['total'])
+
+
+class ContrailClientBulkTest(base.TestCase):
+
+    def setUp(self):
+        super(ContrailClientBulkTest, self).setUp()
+        self.fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        self.client = self.fake_api.client(contrail_client.ContrailClient)
+
+    def _bodies(self, count):
+        return [{'parent_type': 'project',
+                 'fq_name': ['default-domain', 'admin', 'vn-%d' % i]}
+                for i in range(count)]
+
+    def test_create_update_delete_many(self):
+        created = self.client.create_many('virtual_network',
+                                          self._bodies(5), workers=3)
+        self.assertEqual([], created.errors)
+        uuids = [body['virtual-network']['uuid'] for body in created.results]
+
+        updated = self.client.update_many(
+            'virtual_network',
+            [(uuid, {'display_name': 'bulk'}) for uuid in uuids])
+        self.assertEqual([], updated.errors)
+        self.assertEqual('bulk', self.client.show_virtual_network(
+            uuids[0])['virtual-network']['display_name'])
+
+        deleted = self.client.delete_many('virtual_network', uuids)
+        self.assertEqual([], deleted.errors)
+        self.assertEqual(0, len(self.fake_api.api.store.list(
+            'virtual-network')))
+
+    def test_failures_do_not_stop_the_run(self):
+        created = self.client.create_many('virtual_network',
+                                          self._bodies(2))
+        uuids = [body['virtual-network']['uuid'] for body in created.results]
+
+        deleted = self.client.delete_many('virtual_network',
+                                          [uuids[0], 'missing', uuids[1]])
+
+        self.assertEqual([1], [item.index for item in deleted.errors])
+        self.assertIsInstance(deleted.errors[0].error, exceptions.NotFound)
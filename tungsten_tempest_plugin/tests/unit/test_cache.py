@@ -0,0 +1,149 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from tungsten_tempest_plugin.services.contrail.json import cache
+from tungsten_tempest_plugin.services.contrail.json import fq_client
+from tungsten_tempest_plugin.services.contrail.json import \
+    virtual_network_client
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+_FQ_NAME = ['default-domain', 'admin', 'net']
+
+
+class LRUCacheTest(base.TestCase):
+
+    def test_least_recently_used_evicted(self):
+        evicted = []
+        lru = cache.LRUCache(2, on_evict=lambda *item: evicted.append(item))
+        lru.set('a', 1)
+        lru.set('b', 2)
+        lru.get('a')
+        lru.set('c', 3)
+
+        self.assertEqual([('b', 2)], evicted)
+        self.assertEqual(1, lru.get('a'))
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual({'hits': 2, 'misses': 1, 'evictions': 1,
+                          'size': 2}, lru.stats())
+
+    @mock.patch.object(cache.time, 'time', autospec=True)
+    def test_expired_entry_dropped(self, mock_time):
+        mock_time.return_value = 100
+        lru = cache.LRUCache(2, ttl=10)
+        lru.set('a', 1)
+
+        mock_time.return_value = 105
+        self.assertEqual(1, lru.get('a'))
+        mock_time.return_value = 111
+        self.assertIsNone(lru.get('a'))
+        self.assertEqual(0, len(lru))
+
+    def test_zero_size_disables_cache(self):
+        lru = cache.LRUCache(0)
+        lru.set('a', 1)
+
+        self.assertIsNone(lru.get('a'))
+
+    def test_resize_evicts_oldest(self):
+        lru = cache.LRUCache(3)
+        for key in 'abc':
+            lru.set(key, key)
+        lru.resize(1)
+
+        self.assertIsNone(lru.get('a'))
+        self.assertEqual('c', lru.get('c'))
+
+
+class FqNameCacheTest(base.TestCase):
+
+    def setUp(self):
+        super(FqNameCacheTest, self).setUp()
+        self.cache = cache.FqNameCache(maxsize=2, ttl=None)
+
+    def test_lookup_both_ways(self):
+        self.cache.add('uuid-1', 'virtual-network', _FQ_NAME)
+
+        self.assertEqual('uuid-1', self.cache.get_by_fqname(
+            'virtual-network', _FQ_NAME).uuid)
+        self.assertEqual(tuple(_FQ_NAME),
+                         self.cache.get_by_uuid('uuid-1').fq_name)
+        self.assertIsNone(self.cache.get_by_fqname('project', _FQ_NAME))
+
+    def test_eviction_drops_index(self):
+        self.cache.add('uuid-1', 'virtual-network', _FQ_NAME)
+        self.cache.add('uuid-2', 'virtual-network', ['a'])
+        self.cache.add('uuid-3', 'virtual-network', ['b'])
+
+        self.assertIsNone(self.cache.get_by_fqname('virtual-network',
+                                                   _FQ_NAME))
+        self.assertEqual({('virtual-network', ('a',)),
+                          ('virtual-network', ('b',))},
+                         set(self.cache._index))
+
+    def test_invalidate(self):
+        self.cache.add('uuid-1', 'virtual-network', _FQ_NAME)
+        self.cache.invalidate('uuid-1')
+        self.cache.invalidate('uuid-1')
+
+        self.assertIsNone(self.cache.get_by_fqname('virtual-network',
+                                                   _FQ_NAME))
+        self.assertEqual(1, self.cache.stats()['invalidations'])
+
+
+class FqnameIdClientCacheTest(base.TestCase):
+
+    def setUp(self):
+        super(FqnameIdClientCacheTest, self).setUp()
+        self.patchobject(cache, 'fqname_cache', cache.FqNameCache())
+        self.fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        self.client = self.fake_api.client(fq_client.FqnameIdClient)
+        self.vn_client = self.fake_api.client(
+            virtual_network_client.VirtualNetworkClient)
+        self.network = self.vn_client.create_virtual_networks(
+            parent_type='project', fq_name=_FQ_NAME)['virtual-network']
+
+    def _fqname_to_id(self, use_cache):
+        return self.client.fqname_to_id(type='virtual-network',
+                                        fq_name=_FQ_NAME,
+                                        use_cache=use_cache)['uuid']
+
+    def test_cache_read_only_on_request(self):
+        self.assertEqual(self.network['uuid'], self._fqname_to_id(False))
+        requests = self.fake_api.api.requests
+
+        self.assertEqual(self.network['uuid'], self._fqname_to_id(True))
+        self.assertEqual(requests, self.fake_api.api.requests)
+        self._fqname_to_id(False)
+        self.assertEqual(requests + 1, self.fake_api.api.requests)
+
+    def test_id_to_fqname_filled_by_fqname_to_id(self):
+        self._fqname_to_id(False)
+        requests = self.fake_api.api.requests
+
+        body = self.client.id_to_fqname(uuid=self.network['uuid'],
+                                        use_cache=True)
+
+        self.assertEqual(_FQ_NAME, body['fq_name'])
+        self.assertEqual(requests, self.fake_api.api.requests)
+
+    def test_delete_invalidates(self):
+        self._fqname_to_id(False)
+        self.vn_client.delete_virtual_network(self.network['uuid'])
+
+        self.assertIsNone(cache.fqname_cache.get_by_uuid(
+            self.network['uuid']))
@@ -0,0 +1,103 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from tungsten_tempest_plugin.common import client_registry
+from tungsten_tempest_plugin.tests.unit import base
+
+
+class FakeAuthProvider(object):
+    pass
+
+
+class FakeClient(object):
+
+    def __init__(self, auth_provider, *args, **kwargs):
+        self.auth_provider = auth_provider
+        self.args = args
+        self.kwargs = kwargs
+
+
+def _make_client_class(name):
+    return type(name, (FakeClient,), {})
+
+
+class ClientRegistryTest(base.TestCase):
+
+    def setUp(self):
+        super(ClientRegistryTest, self).setUp()
+        self.auth_provider = FakeAuthProvider()
+        self.registry = client_registry.ClientRegistry(
+            self.auth_provider, 'sdn', region='RegionOne')
+
+    def test_get_builds_client_once(self):
+        client = self.registry.get(FakeClient)
+
+        self.assertIs(client, self.registry.get(FakeClient))
+        self.assertIs(self.auth_provider, client.auth_provider)
+        self.assertEqual(('sdn',), client.args)
+        self.assertEqual({'region': 'RegionOne'}, client.kwargs)
+        self.assertEqual(['FakeClient'], self.registry.built_clients)
+
+    def test_clients_keyed_by_class(self):
+        first = _make_client_class('SameNameClient')
+        second = _make_client_class('SameNameClient')
+
+        self.assertIsNot(self.registry.get(first), self.registry.get(second))
+        self.assertEqual(['SameNameClient', 'SameNameClient'],
+                         self.registry.built_clients)
+
+    def test_registries_independent(self):
+        other = client_registry.ClientRegistry(self.auth_provider, 'sdn',
+                                               region='RegionTwo')
+
+        self.assertIsNot(self.registry.get(FakeClient),
+                         other.get(FakeClient))
+        self.assertEqual({'region': 'RegionTwo'},
+                         other.get(FakeClient).kwargs)
+
+
+class LazyClientTest(base.TestCase):
+
+    def setUp(self):
+        super(LazyClientTest, self).setUp()
+        self.registry = client_registry.ClientRegistry(FakeAuthProvider())
+
+    def _make_test_class(self, client):
+        return type('LazyClientOwner', (object,), {'client': client})
+
+    def test_descriptor_returned_without_registry(self):
+        lazy = client_registry.LazyClient(FakeClient)
+        owner = self._make_test_class(lazy)
+
+        self.assertIs(lazy, owner.client)
+        self.assertEqual([], self.registry.built_clients)
+
+    def test_client_built_through_registry(self):
+        owner = self._make_test_class(
+            client_registry.LazyClient(FakeClient))
+        owner._client_registry = self.registry
+
+        self.assertIs(self.registry.get(FakeClient), owner.client)
+        self.assertEqual(['FakeClient'], self.registry.built_clients)
+
+    def test_dotted_path_imported_on_first_use(self):
+        lazy = client_registry.LazyClient(__name__ + '.FakeClient')
+        owner = self._make_test_class(lazy)
+
+        self.assertIsNone(lazy._class)
+        owner._client_registry = self.registry
+
+        self.assertIsInstance(owner.client, FakeClient)
+        self.assertIs(FakeClient, lazy.client_class)
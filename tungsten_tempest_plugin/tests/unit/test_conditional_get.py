@@ -0,0 +1,77 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from tungsten_tempest_plugin.services.contrail.json import cache
+from tungsten_tempest_plugin.services.contrail.json import project_client
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+_PROJECT = ['default-domain', 'cached']
+_OWN_FIELDS = {'exclude_back_refs': True, 'exclude_children': True}
+
+
+class ConditionalGetTest(base.TestCase):
+
+    def setUp(self):
+        super(ConditionalGetTest, self).setUp()
+        self.useFixture(fixtures.ConfPatcher(conditional_get=True,
+                                             group='sdn'))
+        self.cache = cache.ResponseCache()
+        self.patchobject(cache, 'response_cache', self.cache)
+        self.fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        self.client = self.fake_api.client(project_client.ProjectClient)
+        # Writes below go straight to the store, like another worker's
+        # would, so they do not empty this worker's cache.
+        self.store = self.fake_api.api.store
+        self.uuid = self.store.create('project', {
+            'fq_name': _PROJECT, 'parent_type': 'domain'})['uuid']
+
+    def _show(self, **projection):
+        return self.client.show_project(self.uuid, **projection)['project']
+
+    def test_unchanged_object_reused(self):
+        first = self._show(**_OWN_FIELDS)
+        second = self._show(**_OWN_FIELDS)
+
+        self.assertEqual(first, second)
+        self.assertEqual(1, self.cache.stats()['revalidated'])
+
+    def test_changed_object_refetched(self):
+        self._show(**_OWN_FIELDS)
+        self.store.update('project', self.uuid, {'display_name': 'renamed'})
+
+        self.assertEqual('renamed', self._show(**_OWN_FIELDS)['display_name'])
+        self.assertEqual(1, self.cache.stats()['refetched'])
+
+    def test_children_never_cached(self):
+        self._show()
+        self.store.create('virtual-network', {
+            'fq_name': _PROJECT + ['vn'], 'parent_type': 'project'})
+
+        self.assertEqual(1, len(self._show()['virtual_networks']))
+        self.assertEqual(0, self.cache.stats()['size'])
+
+    def test_partial_projection_never_cached(self):
+        self._show(exclude_children=True)
+        self._show(fields=['display_name'], **_OWN_FIELDS)
+
+        self.assertEqual(0, self.cache.stats()['size'])
+
+    def test_own_write_empties_cache(self):
+        self._show(**_OWN_FIELDS)
+        self.client.update_project(self.uuid, display_name='renamed')
+
+        self.assertEqual(0, self.cache.stats()['size'])
+        self.assertEqual('renamed', self._show(**_OWN_FIELDS)['display_name'])
@@ -0,0 +1,178 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+from unittest import mock
+
+from six.moves.urllib import parse as urlparse
+
+from tungsten_tempest_plugin.services.contrail.json import contrail_client
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+_PROJECT = ['default-domain', 'admin']
+
+
+class IterTest(base.TestCase):
+
+    def setUp(self):
+        super(IterTest, self).setUp()
+        self.fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        self.client = self.fake_api.client(contrail_client.ContrailClient)
+        self.get = self.patchobject(self.client, 'get',
+                                    wraps=self.client.get)
+        store = self.fake_api.api.store
+        self.uuids = [store.create('virtual-network', {
+            'fq_name': _PROJECT + ['vn%d' % index],
+            'parent_type': 'project'})['uuid'] for index in range(5)]
+
+    def _queries(self):
+        return [dict(urlparse.parse_qsl(urlparse.urlparse(call[0][0]).query))
+                for call in self.get.call_args_list]
+
+    def _uuids(self, **kwargs):
+        return [vn['uuid']
+                for vn in self.client.iter_virtual_networks(**kwargs)]
+
+    def test_iterates_every_page(self):
+        self.assertEqual(self.uuids, self._uuids(page_limit=2))
+        self.assertEqual(3, self.get.call_count)
+
+    def test_page_marker_passed_through(self):
+        self._uuids(page_limit=2)
+
+        self.assertEqual([None, self.uuids[1], self.uuids[3]],
+                         [q.get('page_marker') for q in self._queries()])
+        self.assertEqual({'2'}, {q['page_limit'] for q in self._queries()})
+
+    def test_stops_without_marker(self):
+        self.assertEqual(self.uuids, self._uuids(page_limit=5))
+        self.assertEqual(1, self.get.call_count)
+
+    def test_stops_on_short_page(self):
+        list_page = self.fake_api.api._list
+
+        def always_marked(obj_type, plural, query):
+            body = list_page(obj_type, plural, query)
+            body['marker'] = body[plural][-1]['uuid']
+            return body
+        self.patchobject(self.fake_api.api, '_list',
+                         side_effect=always_marked)
+
+        self.assertEqual(self.uuids, self._uuids(page_limit=3))
+        self.assertEqual(2, self.get.call_count)
+
+    def test_filters_kept_on_every_page(self):
+        parent = self.fake_api.api.store.lookup('project', _PROJECT)
+
+        self.assertEqual(self.uuids, self._uuids(page_limit=2,
+                                                 parent_id=parent))
+        self.assertEqual([parent] * 3,
+                         [q.get('parent_id') for q in self._queries()])
+
+    def test_count_matches_iteration(self):
+        count = self.client.iter_virtual_networks(count=True)
+
+        self.assertEqual(len(self._uuids(page_limit=2)), count)
+        self.assertEqual('true', self._queries()[0]['count'])
+        self.assertNotIn('page_limit', self._queries()[0])
+
+    def test_empty_collection(self):
+        self.assertEqual([], list(self.client.iter_route_tables(
+            page_limit=2)))
+        self.assertEqual(0, self.client.iter_route_tables(count=True))
+
+
+class GeneratedMethodsTest(base.TestCase):
+
+    def setUp(self):
+        super(GeneratedMethodsTest, self).setUp()
+        fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        self.client = fake_api.client(contrail_client.ContrailClient)
+        self.calls = []
+        for method in ('get', 'post', 'put', 'delete'):
+            self.patchobject(self.client, method,
+                             side_effect=self._transport(method))
+
+    def _transport(self, method):
+        def call(url, body=None):
+            self.calls.append((method, url,
+                               json.loads(body) if body else None))
+            return mock.Mock(status=200), b'' if method == 'delete' else b'{}'
+        return call
+
+    def _call(self, name, *args, **kwargs):
+        del self.calls[:]
+        getattr(self.client, name)(*args, **kwargs)
+        self.assertEqual(1, len(self.calls), name)
+        return self.calls[0]
+
+    def test_urls_and_bodies(self):
+        for resource in contrail_client.RESOURCE_TYPES:
+            dashed = resource.replace('_', '-')
+            plural = resource + 's'
+            self.assertEqual(
+                ('get', '/%ss?parent_id=p1' % dashed, None),
+                self._call('list_' + plural, parent_id='p1'))
+            del self.calls[:]
+            self.assertEqual([], list(getattr(self.client, 'iter_' + plural)(
+                page_limit=1)))
+            self.assertEqual([('get', '/%ss?page_limit=1' % dashed, None)],
+                             self.calls)
+            self.assertEqual(
+                ('get', '/%s/u1?fields=name' % dashed, None),
+                self._call('show_' + resource, 'u1', fields=['name']))
+            self.assertEqual(
+                ('post', '/%ss' % dashed, {dashed: {'fq_name': ['a']}}),
+                self._call('create_' + resource, fq_name=['a']))
+            self.assertEqual(
+                ('put', '/%s/u1' % dashed, {dashed: {'display_name': 'd'}}),
+                self._call('update_' + resource, 'u1', display_name='d'))
+            self.assertEqual(('delete', '/%s/u1' % dashed, None),
+                             self._call('delete_' + resource, 'u1'))
+
+    def test_list_body_keyed_by_plural(self):
+        body = self.client.list_virtual_networks()
+
+        self.assertEqual({'virtual_networks': {}}, body)
+
+    def test_unlisted_type_resolved_on_demand(self):
+        self.assertNotIn('show_widget', contrail_client.ContrailClient
+                         .supported_operations())
+
+        self.assertEqual(('get', '/widget/u1', None),
+                         self._call('show_widget', 'u1'))
+        self.assertIn('show_widget', vars(self.client))
+        self.assertRaises(AttributeError, getattr, self.client, 'show_')
+
+
+class SupportedOperationsTest(base.TestCase):
+
+    def test_one_method_per_prefix_and_type(self):
+        expected = set()
+        for resource in contrail_client.RESOURCE_TYPES:
+            plural = resource + 's'
+            expected.update(['list_' + plural, 'iter_' + plural,
+                             'show_' + resource, 'create_' + resource,
+                             'update_' + resource, 'delete_' + resource])
+
+        operations = contrail_client.ContrailClient.supported_operations()
+
+        self.assertEqual(sorted(expected), operations)
+
+    def test_operations_callable(self):
+        for name in contrail_client.ContrailClient.supported_operations():
+            method = getattr(contrail_client.ContrailClient, name)
+            self.assertEqual(name, method.__name__)
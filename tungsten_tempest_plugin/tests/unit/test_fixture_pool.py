@@ -0,0 +1,84 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+
+from tungsten_tempest_plugin.common import fixture_pool
+from tungsten_tempest_plugin.tests.unit import base
+
+_KEY = ('virtual-network', 'admin', '{}')
+
+
+class FixturePoolTest(base.TestCase):
+
+    def setUp(self):
+        super(FixturePoolTest, self).setUp()
+        self.pool = fixture_pool.FixturePool()
+        self.created = []
+        self.deleted = []
+
+    def _create(self, name):
+        def create():
+            self.created.append(name)
+            return name
+        return create
+
+    def test_created_once_per_key(self):
+        first = self.pool.get(_KEY, self._create('a'), self.deleted.append)
+        second = self.pool.get(_KEY, self._create('b'), self.deleted.append)
+        other = self.pool.get(('project',) + _KEY[1:], self._create('c'),
+                              self.deleted.append)
+
+        self.assertEqual(('a', 'a', 'c'), (first, second, other))
+        self.assertEqual(['a', 'c'], self.created)
+        self.assertEqual((1, 2), (self.pool.hits, self.pool.misses))
+
+    def test_concurrent_callers_share_one_creation(self):
+        def slow_create():
+            time.sleep(0.05)
+            return self._create('a')()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            self.pool.get(_KEY, slow_create, self.deleted.append)))
+            for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(['a'] * 4, results)
+        self.assertEqual(['a'], self.created)
+
+    def test_release_all_most_recent_first(self):
+        for name in 'abc':
+            self.pool.get((name,), self._create(name), self.deleted.append)
+
+        self.pool.release_all()
+        self.pool.release_all()
+
+        self.assertEqual(['c', 'b', 'a'], self.deleted)
+
+    def test_release_continues_after_failure(self):
+        def failing_delete(value):
+            raise RuntimeError(value)
+
+        self.pool.get(('a',), self._create('a'), self.deleted.append)
+        self.pool.get(('b',), self._create('b'), failing_delete)
+
+        self.pool.release_all()
+
+        self.assertEqual(['a'], self.deleted)
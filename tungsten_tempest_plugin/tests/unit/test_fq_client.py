@@ -0,0 +1,79 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from tempest.lib import exceptions
+
+from tungsten_tempest_plugin.services.contrail.json import cache
+from tungsten_tempest_plugin.services.contrail.json import fq_client
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+_PROJECT = ('default-domain', 'admin')
+_NETS = [('virtual-network', _PROJECT + ('net%d' % index,))
+         for index in range(3)]
+_MISSING = ('virtual-network', _PROJECT + ('missing',))
+
+
+class FqnamesToIdsTest(base.TestCase):
+
+    def setUp(self):
+        super(FqnamesToIdsTest, self).setUp()
+        self.patchobject(cache, 'fqname_cache', cache.FqNameCache())
+        self.fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        self.client = self.fake_api.client(fq_client.FqnameIdClient)
+        self.uuids = dict((key, self.fake_api.api.store.create(key[0], {
+            'fq_name': list(key[1]), 'parent_type': 'project'})['uuid'])
+            for key in _NETS)
+
+    def _requests(self):
+        return self.fake_api.api.requests
+
+    def test_duplicates_resolved_once(self):
+        names = [(t, list(fq_name)) for t, fq_name in _NETS + _NETS]
+
+        mapping, not_found = self.client.fqnames_to_ids(names, workers=2)
+
+        self.assertEqual(self.uuids, mapping)
+        self.assertEqual([], not_found)
+        self.assertEqual(len(_NETS), self._requests())
+
+    def test_not_found_split_in_input_order(self):
+        other = ('network-ipam', _PROJECT + ('missing',))
+
+        mapping, not_found = self.client.fqnames_to_ids(
+            [other, _NETS[0], _MISSING, other])
+
+        self.assertEqual({_NETS[0]: self.uuids[_NETS[0]]}, mapping)
+        self.assertEqual([other, _MISSING], not_found)
+
+    def test_cache_used_on_request(self):
+        self.client.fqnames_to_ids(_NETS[:2])
+        requests = self._requests()
+
+        mapping, _ = self.client.fqnames_to_ids(_NETS, use_cache=True)
+
+        self.assertEqual(self.uuids, mapping)
+        self.assertEqual(requests + 1, self._requests())
+        self.client.fqnames_to_ids(_NETS)
+        self.assertEqual(requests + 1 + len(_NETS), self._requests())
+
+    def test_first_other_error_raised_after_all_tried(self):
+        self.fake_api.api.inject_error('POST', '/fqname-to-id', 503)
+
+        self.assertRaises(exceptions.UnexpectedResponseCode,
+                          self.client.fqnames_to_ids, _NETS + [_MISSING],
+                          workers=1)
+        self.assertEqual(len(_NETS) + 1, self._requests())
+        self.assertEqual(len(_NETS) - 1, cache.fqname_cache.stats()['size'])
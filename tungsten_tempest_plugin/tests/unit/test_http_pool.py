@@ -0,0 +1,78 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from tempest.lib.common import http
+
+from tungsten_tempest_plugin.services.contrail.json import http_pool
+from tungsten_tempest_plugin.services.contrail.json import \
+    virtual_network_client
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+
+class HttpPoolTest(base.TestCase):
+
+    def setUp(self):
+        super(HttpPoolTest, self).setUp()
+        self.patchobject(http_pool, '_pools', {})
+        self.fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+
+    def test_get_http_shared_per_settings(self):
+        http_obj = http_pool.get_http()
+
+        self.assertIs(http_obj, http_pool.get_http())
+        self.assertIsNot(http_obj, http_pool.get_http(maxsize=2))
+        self.assertIsNot(http_obj, http_pool.get_http(
+            disable_ssl_certificate_validation=True))
+
+    def test_connections_reused(self):
+        http_obj = http_pool.get_http()
+        url = self.fake_api.api.url + '/virtual-networks'
+
+        for _ in range(3):
+            resp, body = http_obj.request(url, 'GET')
+            self.assertEqual(200, resp.status)
+
+        self.assertEqual({'requests': 3, 'hits': 2, 'misses': 1},
+                         http_pool.pool_stats())
+
+    def test_response_matches_closing_http(self):
+        url = self.fake_api.api.url + '/virtual-networks'
+
+        resp, body = http_pool.get_http().request(url, 'GET')
+
+        self.assertEqual('200', resp['status'])
+        self.assertEqual(url, resp['content-location'])
+        self.assertEqual('application/json', resp['content-type'])
+        self.assertIn(b'virtual-networks', body)
+
+    def test_client_uses_shared_pool(self):
+        self.useFixture(fixtures.ConfPatcher(http_pool_enabled=True,
+                                             group='sdn'))
+        first = self.fake_api.client(
+            virtual_network_client.VirtualNetworkClient)
+        second = self.fake_api.client(
+            virtual_network_client.VirtualNetworkClient)
+
+        self.assertIsInstance(first.http_obj, http_pool.PooledHttp)
+        self.assertIs(first.http_obj, second.http_obj)
+
+    def test_client_keeps_closing_http_when_disabled(self):
+        self.useFixture(fixtures.ConfPatcher(http_pool_enabled=False,
+                                             group='sdn'))
+        client = self.fake_api.client(
+            virtual_network_client.VirtualNetworkClient)
+
+        self.assertIsInstance(client.http_obj, http.ClosingHttp)
@@ -0,0 +1,77 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from tungsten_tempest_plugin.cmd import loadgen
+from tungsten_tempest_plugin.tests.unit import base
+
+
+class ParseMixTest(base.TestCase):
+
+    def test_weights(self):
+        self.assertEqual([('list', 2.0), ('show', 10.0), ('delete', 0.5)],
+                         loadgen.parse_mix('list=2, show=10,delete=0.5'))
+
+    def test_weight_defaults_to_one(self):
+        self.assertEqual([('show', 1.0), ('create', 1.0)],
+                         loadgen.parse_mix('show,create='))
+
+    def test_unknown_operation(self):
+        self.assertRaisesRegex(ValueError, "unknown operation 'patch'",
+                               loadgen.parse_mix, 'show=1,patch=2')
+
+    def test_no_positive_weight(self):
+        self.assertRaisesRegex(ValueError, 'positive weight',
+                               loadgen.parse_mix, 'show=0,list=0')
+
+    def test_invalid_weight(self):
+        self.assertRaises(ValueError, loadgen.parse_mix, 'show=often')
+
+
+class PacerTest(base.TestCase):
+
+    def setUp(self):
+        super(PacerTest, self).setUp()
+        self.now = 1000.0
+        self.slept = []
+        self.patchobject(loadgen.time, 'time', side_effect=lambda: self.now)
+        self.patchobject(loadgen.time, 'sleep',
+                         side_effect=self.slept.append)
+
+    def test_starts_evenly_spaced(self):
+        pacer = loadgen.Pacer(rate=4)
+
+        for _ in range(3):
+            pacer.wait()
+
+        self.assertEqual([0.25, 0.5, 0.75], self.slept)
+
+    def test_no_burst_after_idle_period(self):
+        pacer = loadgen.Pacer(rate=4)
+        pacer.wait()
+        self.now += 10
+
+        pacer.wait()
+        pacer.wait()
+        pacer.wait()
+
+        self.assertEqual([0.25, 0.25], self.slept)
+
+    def test_unpaced(self):
+        pacer = loadgen.Pacer(rate=0)
+
+        for _ in range(3):
+            pacer.wait()
+
+        self.assertEqual([], self.slept)
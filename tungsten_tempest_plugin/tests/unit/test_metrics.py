@@ -0,0 +1,115 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import math
+import os
+import random
+import shutil
+import tempfile
+
+from tungsten_tempest_plugin.services.contrail.json import metrics
+from tungsten_tempest_plugin.tests.unit import base
+
+# Width of one bucket: 8 buckets per doubling.
+_BUCKET_RATIO = 2 ** (1 / 8.0)
+
+
+class HistogramTest(base.TestCase):
+
+    def _exact(self, samples, percent):
+        ordered = sorted(samples)
+        return ordered[int(math.ceil(len(ordered) * percent / 100.0)) - 1]
+
+    def test_percentile_within_bucket_bounds(self):
+        rng = random.Random(42)
+        samples = [rng.lognormvariate(math.log(0.02), 1.5)
+                   for _ in range(5000)]
+        histogram = metrics.Histogram()
+        for seconds in samples:
+            histogram.add(seconds)
+
+        for percent in (1, 25, 50, 90, 95, 99, 99.9, 100):
+            exact = self._exact(samples, percent)
+            estimate = histogram.percentile(percent)
+            self.assertGreaterEqual(estimate, exact, percent)
+            self.assertLessEqual(estimate, exact * _BUCKET_RATIO, percent)
+
+    def test_percentile_capped_by_max(self):
+        histogram = metrics.Histogram()
+        histogram.add(0.0105)
+
+        self.assertEqual(0.0105, histogram.percentile(50))
+        self.assertEqual(0.0105, histogram.max)
+
+    def test_smallest_bucket(self):
+        histogram = metrics.Histogram()
+        histogram.add(0.00001)
+        histogram.add(0.05)
+
+        self.assertEqual(0.0001, histogram.percentile(50))
+        self.assertEqual(0.05, histogram.percentile(100))
+
+    def test_empty(self):
+        self.assertEqual(0.0, metrics.Histogram().percentile(99))
+
+
+class RecorderReportTest(base.TestCase):
+
+    def setUp(self):
+        super(RecorderReportTest, self).setUp()
+        self.at_exit = []
+        self.patchobject(metrics.atexit, 'register',
+                         side_effect=self.at_exit.append)
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.template = os.path.join(tmp_dir, 'latency-{pid}.txt')
+        self.path = self.template.replace('{pid}', str(os.getpid()))
+        self.recorder = metrics.Recorder()
+
+    def _record(self, url, seconds, status=200):
+        self.recorder.record('GET', url, status, 10, 2048, seconds)
+
+    def test_report_written_per_pid_at_exit(self):
+        self.recorder.enable(self.template)
+        self.recorder.enable(self.template)
+        self._record('/virtual-network/'
+                     '0b6c9f6e-9a6c-4a4b-8e0c-1f2a3b4c5d6e?detail=true', 0.2)
+        self._record('/virtual-networks', 0.01, status=404)
+
+        self.assertEqual(1, len(self.at_exit))
+        self.at_exit[0]()
+
+        with open(self.path) as report:
+            lines = report.read().splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertEqual(['method', 'endpoint', 'count'], lines[0].split()[:3])
+        self.assertEqual(['GET', '/virtual-network/{id}', '1', '0'],
+                         lines[1].split()[:4])
+        self.assertEqual(['GET', '/virtual-networks', '1', '1'],
+                         lines[2].split()[:4])
+
+    def test_no_report_without_samples(self):
+        self.recorder.enable(self.template)
+
+        self.at_exit[0]()
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_no_report_path(self):
+        self.recorder.enable()
+        self._record('/projects', 0.01)
+
+        self.assertEqual([], self.at_exit)
+        self.assertTrue(self.recorder.enabled)
@@ -0,0 +1,79 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from six.moves.urllib import parse as urlparse
+
+from tungsten_tempest_plugin.services.contrail.json import base as json_base
+from tungsten_tempest_plugin.tests.unit import base
+
+_URL = '/virtual-networks'
+
+# (params, projection, expected query) for /virtual-networks
+_CASES = [
+    (None, {}, {}),
+    (None, {'detail': True}, {'detail': 'true'}),
+    (None, {'detail': False}, {'detail': 'false'}),
+    (None, {'exclude_back_refs': True, 'exclude_children': False},
+     {'exclude_back_refs': 'true', 'exclude_children': 'false'}),
+    (None, {'fields': ['name', 'fq_name']}, {'fields': 'name,fq_name'}),
+    (None, {'fields': ('name',)}, {'fields': 'name'}),
+    (None, {'fields': 'name,fq_name'}, {'fields': 'name,fq_name'}),
+    (None, {'fields': None, 'detail': None}, {}),
+    ({'detail': None, 'parent_id': 'p1'}, {}, {'parent_id': 'p1'}),
+    ({'detail': True, 'page_limit': 2}, {},
+     {'detail': 'true', 'page_limit': '2'}),
+    ({'detail': False}, {'detail': True}, {'detail': 'true'}),
+    ({'count': 'true'}, {'fields': []}, {'count': 'true', 'fields': ''}),
+]
+
+
+class QueryUrlTest(base.TestCase):
+
+    def _query(self, url):
+        path, _, query = url.partition('?')
+        self.assertEqual(_URL, path)
+        return dict(urlparse.parse_qsl(query, keep_blank_values=True))
+
+    def test_cases(self):
+        for params, projection, expected in _CASES:
+            url = json_base.BaseContrailClient._query_url(_URL, params,
+                                                          **projection)
+            self.assertEqual(expected, self._query(url),
+                             'params=%r projection=%r' % (params,
+                                                          projection))
+
+    def test_no_query_string_when_empty(self):
+        self.assertEqual(_URL, json_base.BaseContrailClient._query_url(
+            _URL, {'detail': None}, fields=None))
+
+    def test_multiple_values_repeated(self):
+        url = json_base.BaseContrailClient._query_url(
+            _URL, {'obj_uuids': ['u1', 'u2']})
+
+        self.assertEqual(['u1', 'u2'], urlparse.parse_qs(
+            urlparse.urlparse(url).query)['obj_uuids'])
+
+    def test_params_not_modified(self):
+        params = {'detail': True, 'fields': ['name']}
+
+        json_base.BaseContrailClient._query_url(_URL, params)
+
+        self.assertEqual({'detail': True, 'fields': ['name']}, params)
+
+    def test_unknown_option_rejected(self):
+        self.assertRaisesRegex(
+            TypeError, 'unexpected projection option.*: count, page_limit',
+            json_base.BaseContrailClient._query_url, _URL, page_limit=2,
+            count=True)
@@ -0,0 +1,110 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from tungsten_tempest_plugin.services.contrail.json import rate_limit
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+_URL = 'http://contrail:8082'
+
+
+class RateLimiterTest(base.TestCase):
+
+    def setUp(self):
+        super(RateLimiterTest, self).setUp()
+        self.now = 1000.0
+        self.slept = []
+        self.patchobject(rate_limit.time, 'time', side_effect=lambda: self.now)
+        self.patchobject(rate_limit.time, 'sleep',
+                         side_effect=self.slept.append)
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.path = os.path.join(tmp_dir, 'bucket')
+
+    def test_burst_then_rate(self):
+        limiter = rate_limit.RateLimiter(rate=4, burst=3)
+
+        delays = [limiter.acquire() for _ in range(5)]
+
+        self.assertEqual([0.0, 0.0, 0.0, 0.25, 0.5], delays)
+        self.assertEqual([0.25, 0.5], self.slept)
+        self.assertEqual(0.75, limiter.waited)
+
+    def test_bucket_refills_when_idle(self):
+        limiter = rate_limit.RateLimiter(rate=4, burst=2)
+        for _ in range(4):
+            limiter.acquire()
+
+        self.now += 2
+        self.assertEqual(0.0, limiter.acquire())
+
+    def test_state_shared_through_file(self):
+        first = rate_limit.RateLimiter(rate=4, burst=1, path=self.path)
+        second = rate_limit.RateLimiter(rate=4, burst=1, path=self.path)
+
+        self.assertEqual(0.0, first.acquire())
+        self.assertEqual(0.25, second.acquire())
+        self.assertEqual(0.5, first.acquire())
+
+
+class GetLimiterTest(base.TestCase):
+
+    def setUp(self):
+        super(GetLimiterTest, self).setUp()
+        self.useFixture(fixtures.ConfPatcher(rate_limit=5.0, group='sdn'))
+        self.patchobject(rate_limit, '_limiters', {})
+
+    def test_state_path_per_endpoint_and_run(self):
+        with mock.patch.dict(os.environ, {'TEMPEST_RUN_ID': 'run-1'}):
+            path = rate_limit.state_path(_URL)
+            self.assertEqual(path, rate_limit.state_path(_URL))
+            self.assertNotEqual(path,
+                                rate_limit.state_path('http://other:8082'))
+        with mock.patch.dict(os.environ, {'TEMPEST_RUN_ID': 'run-2'}):
+            self.assertNotEqual(path, rate_limit.state_path(_URL))
+        self.assertEqual(tempfile.gettempdir(), os.path.dirname(path))
+
+    def test_one_limiter_per_state_file(self):
+        limiter = rate_limit.get_limiter(_URL)
+
+        self.assertIs(limiter, rate_limit.get_limiter(_URL))
+        self.assertIsNot(limiter, rate_limit.get_limiter('http://other:8082'))
+        self.assertEqual(rate_limit.state_path(_URL), limiter.path)
+
+    def test_explicit_state_file(self):
+        self.useFixture(fixtures.ConfPatcher(
+            rate_limit_state_file='/tmp/shared-bucket', group='sdn'))
+
+        self.assertIs(rate_limit.get_limiter(_URL),
+                      rate_limit.get_limiter('http://other:8082'))
+        self.assertEqual('/tmp/shared-bucket',
+                         rate_limit.get_limiter(_URL).path)
+
+    def test_disabled(self):
+        self.useFixture(fixtures.ConfPatcher(rate_limit=0.0, group='sdn'))
+
+        self.assertIsNone(rate_limit.get_limiter(_URL))
+        self.assertEqual(0.0, rate_limit.total_waited())
+
+    def test_total_waited(self):
+        rate_limit.get_limiter(_URL).waited = 1.5
+        rate_limit.get_limiter('http://other:8082').waited = 0.5
+
+        self.assertEqual(2.0, rate_limit.total_waited())
@@ -0,0 +1,204 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from patrole_tempest_plugin import rbac_utils
+
+from tungsten_tempest_plugin.common import client_registry
+from tungsten_tempest_plugin.common import rbac_report
+from tungsten_tempest_plugin.common import teardown
+from tungsten_tempest_plugin.tests.api.contrail import rbac_base
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+
+class _RoleTest(rbac_base.BaseContrailTest):
+    _admin_role_id = 'admin-id'
+    _rbac_role_ids = ['member-id', 'reader-id']
+
+
+class _Client(object):
+
+    def __init__(self, auth_provider):
+        self.auth_provider = auth_provider
+
+
+class OverrideRoleTest(base.TestCase):
+
+    def setUp(self):
+        super(OverrideRoleTest, self).setUp()
+        self.switch = self.patchobject(rbac_utils.RbacUtilsMixin,
+                                       '_override_role')
+        self.restore = self.patchobject(rbac_utils.RbacUtilsMixin,
+                                        'restore_roles')
+        self.patchobject(rbac_report, 'start_window')
+        self.patchobject(rbac_report, 'end_window')
+        self.patchobject(_RoleTest, '_active_role_ids', None)
+        self.test = _RoleTest()
+        self.patchobject(self.test, '_set_override_role_called')
+
+    def _override(self):
+        with self.test.override_role():
+            pass
+
+    def test_first_switch_made(self):
+        _RoleTest._override_role(False)
+
+        self.switch.assert_called_once_with(False)
+        self.assertEqual({'admin-id'}, _RoleTest._active_role_ids)
+
+    def test_switch_skipped_when_roles_assigned(self):
+        _RoleTest._override_role(False)
+        self._override()
+        self._override()
+
+        self.assertEqual([mock.call(False), mock.call(True),
+                          mock.call(False), mock.call(True),
+                          mock.call(False)], self.switch.call_args_list)
+        _RoleTest._override_role(False)
+        self.assertEqual(5, self.switch.call_count)
+        self.assertEqual({'admin-id'}, _RoleTest._active_role_ids)
+
+    def test_repeated_switch_skipped(self):
+        _RoleTest._override_role(True)
+        _RoleTest._override_role(True)
+
+        self.switch.assert_called_once_with(True)
+        self.assertEqual({'member-id', 'reader-id'},
+                         _RoleTest._active_role_ids)
+
+    def test_skip_undone_by_restore_roles(self):
+        _RoleTest._override_role(False)
+        _RoleTest.restore_roles()
+
+        self.assertIsNone(_RoleTest._active_role_ids)
+        self.restore.assert_called_once_with()
+        _RoleTest._override_role(False)
+        self.assertEqual(2, self.switch.call_count)
+
+    def test_failed_switch_not_remembered(self):
+        self.switch.side_effect = RuntimeError('keystone down')
+
+        self.assertRaises(RuntimeError, _RoleTest._override_role, False)
+        self.assertIsNone(_RoleTest._active_role_ids)
+
+    def test_report_window_around_test_role(self):
+        self._override()
+
+        rbac_report.start_window.assert_called_once_with()
+        rbac_report.end_window.assert_called_once_with()
+
+
+class CleanupBatchTest(base.TestCase):
+
+    def setUp(self):
+        super(CleanupBatchTest, self).setUp()
+        self.useFixture(fixtures.ConfPatcher(teardown_workers=2,
+                                             group='sdn'))
+        self.patchobject(teardown, 'object_graph', teardown.ObjectGraph())
+        self.patchobject(_RoleTest, '_class_cleanups', [], create=True)
+        self.patchobject(_RoleTest, '_class_teardown_queue', None,
+                         create=True)
+        self.test = _RoleTest()
+        self.events = []
+
+    def _delete(self, uuid):
+        self.events.append(uuid)
+
+    def _other(self):
+        self.events.append('other')
+
+    def _add_deletion(self, add, uuid):
+        add(_RoleTest._try_delete_resource, self._delete, uuid)
+
+    @staticmethod
+    def _run(cleanups):
+        while cleanups:
+            function, args, kwargs = cleanups.pop()
+            function(*args, **kwargs)
+
+    def _check_order(self):
+        self.assertEqual('d3', self.events[0])
+        self.assertEqual('other', self.events[1])
+        self.assertEqual({'d1', 'd2'}, set(self.events[2:]))
+        self.assertEqual(4, len(self.events))
+
+    def test_other_cleanup_closes_batch(self):
+        self._add_deletion(self.test.addCleanup, 'd1')
+        self._add_deletion(self.test.addCleanup, 'd2')
+        self.test.addCleanup(self._other)
+        self._add_deletion(self.test.addCleanup, 'd3')
+
+        self.assertEqual(3, len(self.test._cleanups))
+        self._run(self.test._cleanups)
+        self._check_order()
+
+    def test_class_cleanup_closes_batch(self):
+        self._add_deletion(_RoleTest.addClassResourceCleanup, 'd1')
+        self._add_deletion(_RoleTest.addClassResourceCleanup, 'd2')
+        _RoleTest.addClassResourceCleanup(self._other)
+        self._add_deletion(_RoleTest.addClassResourceCleanup, 'd3')
+
+        self.assertEqual(3, len(_RoleTest._class_cleanups))
+        self._run(_RoleTest._class_cleanups)
+        self._check_order()
+
+    def test_deletion_added_after_flush_queued_again(self):
+        self._add_deletion(self.test.addCleanup, 'd1')
+        self._run(self.test._cleanups)
+        self._add_deletion(self.test.addCleanup, 'd2')
+
+        self._run(self.test._cleanups)
+        self.assertEqual(['d1', 'd2'], self.events)
+
+    def test_not_batched_with_one_worker(self):
+        self.useFixture(fixtures.ConfPatcher(teardown_workers=1,
+                                             group='sdn'))
+        self._add_deletion(self.test.addCleanup, 'd1')
+        self._add_deletion(self.test.addCleanup, 'd2')
+
+        self._run(self.test._cleanups)
+        self.assertEqual(['d2', 'd1'], self.events)
+
+
+class ResourceCleanupTest(base.TestCase):
+
+    def setUp(self):
+        super(ResourceCleanupTest, self).setUp()
+        self.events = []
+        self.patchobject(_RoleTest, '_class_cleanups', [], create=True)
+        registry = client_registry.ClientRegistry(None)
+        registry.get(_Client)
+        self.patchobject(_RoleTest, '_client_registry', registry,
+                         create=True)
+        self.log_stats = self.patchobject(
+            _RoleTest, '_log_client_stats',
+            side_effect=lambda: self.events.append('stats'))
+
+    def test_cleanups_run_before_stats(self):
+        _RoleTest.addClassResourceCleanup(self.events.append, 'cleanup')
+
+        _RoleTest.resource_cleanup()
+
+        self.assertEqual(['cleanup', 'stats'], self.events)
+
+    def test_logging_error_leaves_cleanups_done(self):
+        _RoleTest.addClassResourceCleanup(self.events.append, 'cleanup')
+        self.log_stats.side_effect = RuntimeError('stats')
+
+        self.assertRaises(RuntimeError, _RoleTest.resource_cleanup)
+        self.assertEqual(['cleanup'], self.events)
+        self.assertEqual([], _RoleTest._class_cleanups)
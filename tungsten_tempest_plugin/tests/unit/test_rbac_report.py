@@ -0,0 +1,138 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from tungsten_tempest_plugin.common import rbac_report
+from tungsten_tempest_plugin.tests.unit import base
+
+_ARGS = ('Contrail', 'test_create_network', 'create_network, show_network',
+         'Allowed', 'Allowed')
+
+
+class ReportRecordTest(base.TestCase):
+
+    def setUp(self):
+        super(ReportRecordTest, self).setUp()
+        self.patchobject(rbac_report, '_current_test',
+                         {'id': None, 'window_started': None,
+                          'latency': None})
+        self.time = self.patchobject(rbac_report.time, 'time',
+                                     return_value=100.0)
+
+    def _record(self, args=_ARGS):
+        record = logging.LogRecord('rbac_reporting', logging.INFO, __file__,
+                                   1, '%s %s %s %s %s', args, None)
+        rbac_report.ContextFilter().filter(record)
+        return record
+
+    def test_patrole_fields(self):
+        rbac_report.start_test('test.id')
+        fields = self._record().rbac
+
+        self.assertEqual('test.id', fields['test_id'])
+        self.assertEqual(['create_network', 'show_network'], fields['rules'])
+        self.assertEqual('Allowed', fields['actual'])
+        self.assertNotIn('latency', fields)
+
+    def test_latency_covers_override_windows(self):
+        rbac_report.start_test('test.id')
+        self.time.return_value = 110.0
+        rbac_report.start_window()
+        self.time.return_value = 110.25
+        rbac_report.end_window()
+        self.time.return_value = 120.0
+        rbac_report.start_window()
+        self.time.return_value = 120.5
+        rbac_report.end_window()
+        self.time.return_value = 130.0
+        rbac_report.end_window()
+
+        self.assertEqual(0.75, self._record().rbac['latency'])
+
+        rbac_report.start_test('next.id')
+        self.assertNotIn('latency', self._record().rbac)
+
+    def test_formatted_as_json(self):
+        rbac_report.start_test('test.id')
+        record = self._record()
+
+        entry = json.loads(rbac_report.JsonLinesFormatter().format(record))
+
+        self.assertEqual('test.id', entry['test_id'])
+        self.assertEqual(record.created, entry['timestamp'])
+        self.assertEqual(record.getMessage(), entry['message'])
+
+
+class ReportShardTest(base.TestCase):
+
+    def setUp(self):
+        super(ReportShardTest, self).setUp()
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.report = os.path.join(tmp_dir, 'tungsten.log')
+
+    def _write_shard(self, pid, timestamps):
+        with open(rbac_report.shard_path(self.report, pid), 'w') as shard:
+            for timestamp in timestamps:
+                shard.write(json.dumps({'timestamp': timestamp}) + '\n')
+
+    def _configure(self):
+        logger = logging.getLogger('rbac_reporting.test')
+        logger.propagate = False
+        self.addCleanup(setattr, logger, 'handlers', [])
+        with mock.patch.object(rbac_report.atexit, 'register',
+                               autospec=True) as register:
+            path = rbac_report.configure(logger, self.report, batch_size=10)
+        return logger, path, register.call_args[0][0]
+
+    def test_listener_started_by_first_record(self):
+        logger, path, close = self._configure()
+        handler, = [h for h in logger.handlers
+                    if isinstance(h, rbac_report._QueueHandler)]
+
+        self.assertFalse(handler.started)
+        close()
+        self.assertFalse(os.path.exists(path))
+
+    def test_configure_writes_worker_shard(self):
+        logger, path, close = self._configure()
+
+        logger.warning(*(('%s %s %s %s %s',) + _ARGS))
+        close()
+
+        self.assertEqual(rbac_report.shard_path(self.report, os.getpid()),
+                         path)
+        with open(path) as shard:
+            entries = [json.loads(line) for line in shard]
+        self.assertEqual(['test_create_network'],
+                         [entry['test'] for entry in entries])
+
+    def test_merge_orders_records_and_removes_shards(self):
+        self._write_shard(1, [1.0, 3.0])
+        self._write_shard(2, [2.0])
+
+        self.assertEqual(3, rbac_report.merge_shards(self.report))
+
+        with open(self.report) as report:
+            timestamps = [json.loads(line)['timestamp'] for line in report]
+        self.assertEqual([1.0, 2.0, 3.0], timestamps)
+        self.assertEqual([os.path.basename(self.report)],
+                         os.listdir(os.path.dirname(self.report)))
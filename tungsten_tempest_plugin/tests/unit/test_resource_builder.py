@@ -0,0 +1,141 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+
+from tungsten_tempest_plugin.common import resource_builder
+from tungsten_tempest_plugin.tests.unit import base
+
+
+class ResourceBuilderTest(base.TestCase):
+
+    def setUp(self):
+        super(ResourceBuilderTest, self).setUp()
+        self.cleanups = []
+        self.created = []
+        self.seen = {}
+        self.lock = threading.Lock()
+        self.builder = resource_builder.ResourceBuilder(
+            lambda delete, uuid: self.cleanups.append((delete, uuid)))
+
+    def _create(self, name, error=None, wait_for=None):
+        def create(built):
+            if wait_for is not None:
+                wait_for.wait(5)
+            with self.lock:
+                self.seen[name] = sorted(built)
+                self.created.append(name)
+            if error is not None:
+                raise error
+            return {'uuid': name + '-uuid'}
+        return create
+
+    def _delete(self, uuid):
+        pass
+
+    def _add(self, name, depends_on=(), **kwargs):
+        self.builder.add(name, self._create(name, **kwargs), self._delete,
+                         depends_on=depends_on)
+
+    def test_dependencies_created_first(self):
+        self._add('instance', depends_on=['template', 'network'])
+        self._add('template')
+        self._add('network', depends_on=['project'])
+        self._add('project')
+
+        built = self.builder.build()
+
+        self.assertEqual({'instance', 'template', 'network', 'project'},
+                         set(built))
+        self.assertEqual('instance-uuid', built['instance']['uuid'])
+        order = self.created
+        self.assertLess(order.index('project'), order.index('network'))
+        self.assertLess(order.index('network'), order.index('instance'))
+        self.assertLess(order.index('template'), order.index('instance'))
+        self.assertEqual(['network', 'project', 'template'],
+                         self.seen['instance'])
+
+    def test_cleanups_registered_in_creation_order(self):
+        self._add('child', depends_on=['parent'])
+        self._add('parent')
+
+        self.builder.build()
+
+        self.assertEqual([(self._delete, 'parent-uuid'),
+                          (self._delete, 'child-uuid')], self.cleanups)
+
+    def test_no_cleanup_without_delete(self):
+        self.builder.add('kept', self._create('kept'))
+
+        self.assertIn('kept', self.builder.build())
+        self.assertEqual([], self.cleanups)
+
+    def test_cycle_rejected(self):
+        self._add('a', depends_on=['c'])
+        self._add('b', depends_on=['a'])
+        self._add('c', depends_on=['b'])
+
+        self.assertRaisesRegex(ValueError, 'cycle', self.builder.build)
+        self.assertEqual([], self.created)
+
+    def test_undeclared_dependency_rejected(self):
+        self._add('a', depends_on=['missing'])
+
+        self.assertRaisesRegex(ValueError, 'undeclared missing',
+                               self.builder.build)
+        self.assertEqual([], self.created)
+
+    def test_duplicate_name_rejected(self):
+        self._add('a')
+
+        self.assertRaises(ValueError, self._add, 'a')
+
+    def test_failure_cleans_up_resources_in_flight(self):
+        release = threading.Event()
+        failure = RuntimeError('create failed')
+        self._add('slow', wait_for=release)
+        self._add('broken', error=failure)
+        self._add('dependent', depends_on=['broken'])
+        self._add('after_slow', depends_on=['slow'])
+        # 'slow' is still running when 'broken' fails.
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        raised = self.assertRaises(RuntimeError, self.builder.build)
+
+        self.assertIs(failure, raised)
+        self.assertEqual({'slow', 'broken'}, set(self.created))
+        self.assertEqual([(self._delete, 'slow-uuid')], self.cleanups)
+
+    def test_workers_bound_creates_in_flight(self):
+        in_flight = []
+        peak = []
+
+        def create(built):
+            with self.lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            threading.Event().wait(0.01)
+            with self.lock:
+                in_flight.pop()
+            return {'uuid': 'uuid'}
+
+        builder = resource_builder.ResourceBuilder(workers=2)
+        for index in range(6):
+            builder.add('r%d' % index, create)
+
+        self.assertEqual(6, len(builder.build()))
+        self.assertEqual(2, max(peak))
@@ -0,0 +1,51 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+from tungsten_tempest_plugin.services.contrail.json import base as json_base
+from tungsten_tempest_plugin.services.contrail.json import contrail_client
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+
+class ClientResponseBodyTest(base.TestCase):
+
+    def setUp(self):
+        super(ClientResponseBodyTest, self).setUp()
+        self.fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        self.client = self.fake_api.client(contrail_client.ContrailClient)
+
+    def _create(self):
+        created = self.client.create_virtual_network(
+            parent_type='project', fq_name=['default-domain', 'admin', 'n'])
+        return created['virtual-network']['uuid']
+
+    def test_client_body_serialized(self):
+        uuid = self._create()
+        shown = self.client.show_virtual_network(uuid)
+
+        self.assertIsInstance(shown, json_base.ResponseBody)
+        self.assertEqual(200, shown.response.status)
+        self.assertEqual(uuid,
+                         json.loads(json.dumps(shown))['virtual-network']
+                         ['uuid'])
+        self.assertEqual(shown, self.client.show_virtual_network(uuid))
+
+    def test_empty_delete_body(self):
+        deleted = self.client.delete_virtual_network(self._create())
+
+        self.assertEqual({}, deleted)
+        self.assertEqual(200, deleted.response.status)
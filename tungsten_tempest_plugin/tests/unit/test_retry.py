@@ -0,0 +1,85 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from tempest.lib import exceptions
+
+from tungsten_tempest_plugin.services.contrail.json import metrics
+from tungsten_tempest_plugin.services.contrail.json import project_client
+from tungsten_tempest_plugin.services.contrail.json import retry
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+
+class RetryPolicyTest(base.TestCase):
+
+    def test_rbac_statuses_never_retried(self):
+        policy = retry.RetryPolicy({'403': ['GET'], '503': ['get', 'PUT']},
+                                   attempts=2)
+
+        self.assertFalse(policy.retryable('GET', 403))
+        self.assertTrue(policy.retryable('GET', 503))
+        self.assertFalse(policy.retryable('POST', 503))
+
+    def test_attempts_bound_retries(self):
+        policy = retry.RetryPolicy({503: ['GET']}, attempts=2)
+
+        self.assertTrue(policy.should_retry('GET', 503, 1))
+        self.assertFalse(policy.should_retry('GET', 503, 2))
+        self.assertFalse(retry.RetryPolicy({503: ['GET']}).enabled)
+
+    def test_delay_within_backoff(self):
+        policy = retry.RetryPolicy(backoff=0.5, backoff_max=2.0)
+
+        for attempt in range(6):
+            self.assertLessEqual(policy.delay(attempt),
+                                 min(2.0, 0.5 * 2 ** attempt))
+
+
+class ClientRetryTest(base.TestCase):
+
+    def setUp(self):
+        super(ClientRetryTest, self).setUp()
+        self.useFixture(fixtures.ConfPatcher(
+            retry_attempts=2, retry_backoff=0, retry_on={'503': 'GET'},
+            group='sdn'))
+        self.stats = retry.RetryStats()
+        self.patchobject(retry, 'retry_stats', self.stats)
+        self.patchobject(metrics.recorder, 'enabled', False)
+        self.fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        self.client = self.fake_api.client(project_client.ProjectClient)
+
+    def test_retries_counted_without_metrics(self):
+        self.fake_api.api.inject_error('GET', '/projects', 503)
+
+        self.client.list_projects()
+
+        self.assertEqual({'retries': 1, 'exhausted': 0,
+                          'statuses': {503: 1}}, self.stats.stats())
+
+    def test_exhausted_retries_counted(self):
+        self.fake_api.api.inject_error('GET', '/projects', 503, count=None)
+
+        self.assertRaises(exceptions.UnexpectedResponseCode,
+                          self.client.list_projects)
+        self.assertEqual({'retries': 2, 'exhausted': 1,
+                          'statuses': {503: 2}}, self.stats.stats())
+
+    def test_other_methods_not_retried(self):
+        self.fake_api.api.inject_error('POST', '/projects', 503)
+
+        self.assertRaises(exceptions.UnexpectedResponseCode,
+                          self.client.create_projects, parent_type='domain',
+                          fq_name=['default-domain', 'retried'])
+        self.assertEqual(0, self.stats.stats()['retries'])
@@ -0,0 +1,220 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+from tempest.lib import exceptions
+
+from tungsten_tempest_plugin.common import teardown
+from tungsten_tempest_plugin.services.contrail.json import contrail_client
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+_PROJECT = ['default-domain', 'admin']
+_UUIDS = ['00000000-0000-0000-0000-00000000000%d' % i for i in range(6)]
+
+
+def _created(obj_type, uuid, fq_name, **attrs):
+    body = dict(attrs, uuid=uuid, fq_name=fq_name)
+    return json.dumps({obj_type: body})
+
+
+class ObjectGraphTest(base.TestCase):
+
+    def setUp(self):
+        super(ObjectGraphTest, self).setUp()
+        self.graph = teardown.ObjectGraph()
+
+    def _create(self, obj_type, uuid, name, request=None, **response):
+        fq_name = _PROJECT + [name]
+        self.graph.observe(
+            'POST', '/%ss' % obj_type,
+            json.dumps({obj_type: dict(request or {}, fq_name=fq_name,
+                                       parent_type='project')}),
+            _created(obj_type, uuid, fq_name, **response))
+
+    def test_parent_from_response(self):
+        self._create('virtual-network', _UUIDS[1], 'vn',
+                     parent_uuid=_UUIDS[0])
+
+        self.assertEqual({_UUIDS[1]}, self.graph.dependents(_UUIDS[0]))
+
+    def test_parent_from_fq_name(self):
+        self.graph.add(_UUIDS[0], 'project', _PROJECT)
+        self._create('virtual-network', _UUIDS[1], 'vn')
+
+        self.assertEqual({_UUIDS[1]}, self.graph.dependents(_UUIDS[0]))
+
+    def test_refs_by_uuid_and_fq_name(self):
+        self._create('network-ipam', _UUIDS[0], 'ipam')
+        self._create('network-policy', _UUIDS[1], 'policy')
+        self._create('virtual-network', _UUIDS[2], 'vn', request={
+            'network_ipam_refs': [{'to': _PROJECT + ['ipam']}],
+            'network_policy_refs': [{'uuid': _UUIDS[1]}]})
+
+        self.assertEqual({_UUIDS[2]}, self.graph.dependents(_UUIDS[0]))
+        self.assertEqual({_UUIDS[2]}, self.graph.dependents(_UUIDS[1]))
+
+    def test_refs_added_by_update(self):
+        self._create('network-ipam', _UUIDS[0], 'ipam')
+        self._create('virtual-network', _UUIDS[1], 'vn')
+        self.graph.observe(
+            'PUT', '/virtual-network/%s' % _UUIDS[1],
+            json.dumps({'virtual-network': {
+                'network_ipam_refs': [{'uuid': _UUIDS[0]}]}}),
+            '{}')
+
+        self.assertEqual({_UUIDS[1]}, self.graph.dependents(_UUIDS[0]))
+
+    def test_other_calls_ignored(self):
+        self.graph.observe('POST', '/fqname-to-id', '{"type": "project"}',
+                           '{"uuid": "%s"}' % _UUIDS[0])
+        self.graph.observe('POST', '/virtual-networks', 'not json', '')
+
+        self.assertEqual(0, len(self.graph))
+
+    def test_forget(self):
+        self._create('virtual-network', _UUIDS[1], 'vn',
+                     parent_uuid=_UUIDS[0])
+        self.graph.forget(_UUIDS[1])
+
+        self.assertEqual(set(), self.graph.dependents(_UUIDS[0]))
+        self.assertEqual(0, len(self.graph))
+
+    def test_waves_children_first(self):
+        # member -> pool -> listener -> loadbalancer, and a member of an
+        # object outside the batch.
+        for child, parent in zip(_UUIDS[1:4], _UUIDS[:3]):
+            self.graph.add(child, 'test', depends_on=[parent])
+        self.graph.add(_UUIDS[4], 'test', depends_on=[_UUIDS[5]])
+
+        waves = self.graph.waves(_UUIDS[:5])
+
+        self.assertEqual([{_UUIDS[3], _UUIDS[4]}, {_UUIDS[2]}, {_UUIDS[1]},
+                          {_UUIDS[0]}], waves)
+
+    def test_waves_through_objects_outside_batch(self):
+        self.graph.add(_UUIDS[1], 'test', depends_on=[_UUIDS[0]])
+        self.graph.add(_UUIDS[2], 'test', depends_on=[_UUIDS[1]])
+
+        self.assertEqual([{_UUIDS[2]}, {_UUIDS[0]}],
+                         self.graph.waves([_UUIDS[0], _UUIDS[2]]))
+
+    def test_cycle_ends_in_last_wave(self):
+        self.graph.add(_UUIDS[0], 'test', depends_on=[_UUIDS[1]])
+        self.graph.add(_UUIDS[1], 'test', depends_on=[_UUIDS[0]])
+        self.graph.add(_UUIDS[2], 'test')
+
+        self.assertEqual([{_UUIDS[2]}, {_UUIDS[0], _UUIDS[1]}],
+                         self.graph.waves(_UUIDS[:3]))
+
+
+class TeardownQueueTest(base.TestCase):
+
+    def setUp(self):
+        super(TeardownQueueTest, self).setUp()
+        self.useFixture(fixtures.ConfPatcher(teardown_workers=4,
+                                             group='sdn'))
+        self.graph = teardown.ObjectGraph()
+        self.patchobject(teardown, 'object_graph', self.graph)
+        self.fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        self.client = self.fake_api.client(contrail_client.ContrailClient)
+        self.attempts = []
+
+    def _tracked(self, delete):
+        def tracked_delete(uuid):
+            try:
+                delete(uuid)
+            except exceptions.Conflict:
+                self.attempts.append((uuid, 409))
+                raise
+            self.attempts.append((uuid, 200))
+        tracked_delete.__name__ = delete.__name__
+        return tracked_delete
+
+    def _create_chain(self):
+        ipam = self.client.create_network_ipam(
+            parent_type='project', fq_name=_PROJECT + ['ipam'])
+        ipam = ipam['network-ipam']
+        vn = self.client.create_virtual_network(
+            parent_type='project', fq_name=_PROJECT + ['vn'],
+            network_ipam_refs=[{'to': ipam['fq_name']}])['virtual-network']
+        vmi = self.client.create_virtual_machine_interface(
+            parent_type='project', fq_name=_PROJECT + ['vmi'],
+            virtual_network_refs=[{'uuid': vn['uuid']}])
+        return ipam, vn, vmi['virtual-machine-interface']
+
+    def test_children_deleted_first(self):
+        ipam, vn, vmi = self._create_chain()
+        queue = teardown.TeardownQueue(workers=4, retry_interval=0)
+        # Registered so that a cleanup stack would delete parents first.
+        queue.add(self._tracked(self.client.delete_virtual_machine_interface),
+                  vmi['uuid'])
+        queue.add(self._tracked(self.client.delete_virtual_network),
+                  vn['uuid'])
+        queue.add(self._tracked(self.client.delete_network_ipam),
+                  ipam['uuid'])
+
+        queue.flush()
+
+        self.assertEqual([(vmi['uuid'], 200), (vn['uuid'], 200),
+                          (ipam['uuid'], 200)], self.attempts)
+        self.assertEqual(0, len(self.graph))
+
+    def test_conflict_carried_forward(self):
+        ipam, vn, vmi = self._create_chain()
+        # Nothing recorded: all deletions land in one wave, the later
+        # registrations first.
+        queue = teardown.TeardownQueue(workers=1, retry_interval=0,
+                                       graph=teardown.ObjectGraph())
+        for delete, obj in ((self.client.delete_virtual_machine_interface,
+                             vmi),
+                            (self.client.delete_virtual_network, vn),
+                            (self.client.delete_network_ipam, ipam)):
+            queue.add(self._tracked(delete), obj['uuid'])
+
+        queue.flush()
+
+        self.assertEqual([(ipam['uuid'], 409), (vn['uuid'], 409),
+                          (vmi['uuid'], 200), (ipam['uuid'], 409),
+                          (vn['uuid'], 200), (ipam['uuid'], 200)],
+                         self.attempts)
+
+    def test_unresolved_conflict_raised(self):
+        ipam, vn, vmi = self._create_chain()
+        queue = teardown.TeardownQueue(workers=1, retry_interval=0)
+        queue.add(self._tracked(self.client.delete_network_ipam),
+                  ipam['uuid'])
+
+        self.assertRaises(exceptions.Conflict, queue.flush)
+        self.assertEqual([(ipam['uuid'], 409), (ipam['uuid'], 409)],
+                         self.attempts)
+
+    def test_not_found_ignored_and_errors_raised_last(self):
+        ipam, vn, vmi = self._create_chain()
+        queue = teardown.TeardownQueue(workers=1, retry_interval=0)
+
+        def forbidden(uuid):
+            raise exceptions.Forbidden(uuid)
+
+        queue.add(forbidden, vn['uuid'])
+        # The later registration runs first; the earlier one gets a 404.
+        queue.add(self.client.delete_virtual_machine_interface, vmi['uuid'])
+        queue.add(self._tracked(self.client.delete_virtual_machine_interface),
+                  vmi['uuid'])
+
+        self.assertRaises(exceptions.Forbidden, queue.flush)
+        self.assertEqual([(vmi['uuid'], 200)], self.attempts)
+        self.assertEqual(0, len(queue))
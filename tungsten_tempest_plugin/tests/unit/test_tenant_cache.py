@@ -0,0 +1,155 @@
+# Copyright 2018 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from tempest.lib import exceptions
+
+from tungsten_tempest_plugin.common import tenant_cache
+from tungsten_tempest_plugin.services.contrail.json import cache
+from tungsten_tempest_plugin.services.contrail.json import fq_client
+from tungsten_tempest_plugin.tests.unit import base
+from tungsten_tempest_plugin.tests.unit import fixtures
+
+_ENDPOINT = 'http://contrail:8082'
+_FQ_NAME = ['default-domain', 'admin']
+
+
+class TenantCacheTest(base.TestCase):
+
+    def setUp(self):
+        super(TenantCacheTest, self).setUp()
+        self.cache = tenant_cache.TenantCache()
+        self.resolved = []
+        self.checked = []
+        self.valid = set()
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.path = os.path.join(tmp_dir, 'tenants.json')
+
+    def _resolve(self, uuid):
+        def resolve():
+            self.resolved.append(uuid)
+            self.valid.add(uuid)
+            return uuid
+        return resolve
+
+    def _validate(self, uuid):
+        self.checked.append(uuid)
+        return uuid in self.valid
+
+    def _lookup(self, uuid, cache=None, **kwargs):
+        kwargs.setdefault('validate', self._validate)
+        return (cache or self.cache).lookup(_ENDPOINT, 'admin',
+                                            self._resolve(uuid), **kwargs)
+
+    def test_memory_hit_trusted(self):
+        self.assertEqual('uuid-1', self._lookup('uuid-1'))
+        self.valid.clear()
+
+        self.assertEqual('uuid-1', self._lookup('uuid-2'))
+        self.assertEqual(['uuid-1'], self.resolved)
+        self.assertEqual([], self.checked)
+
+    def test_no_validation(self):
+        self._lookup('uuid-1', validate=None)
+        self.valid.clear()
+
+        self.assertEqual('uuid-1', self._lookup('uuid-2', validate=None))
+        self.assertEqual([], self.checked)
+
+    @mock.patch.object(tenant_cache.time, 'time', autospec=True)
+    def test_expired_entry_resolved_again(self, mock_time):
+        mock_time.return_value = 100
+        self._lookup('uuid-1', ttl=10)
+        mock_time.return_value = 111
+
+        self.assertEqual('uuid-2', self._lookup('uuid-2', ttl=10))
+        self.assertEqual([], self.checked)
+
+    def test_shared_through_file(self):
+        self._lookup('uuid-1', path=self.path)
+        other_run = tenant_cache.TenantCache()
+
+        self.assertEqual('uuid-1',
+                         self._lookup('uuid-2', other_run, path=self.path))
+        self.assertEqual('uuid-1',
+                         self._lookup('uuid-3', other_run, path=self.path))
+        self.assertEqual(['uuid-1'], self.resolved)
+        self.assertEqual(['uuid-1'], self.checked)
+
+    def test_stale_file_entry_replaced(self):
+        self._lookup('uuid-1', path=self.path)
+        self.valid.clear()
+
+        self._lookup('uuid-2', tenant_cache.TenantCache(), path=self.path)
+
+        self.assertEqual('uuid-2',
+                         self._lookup('uuid-3', tenant_cache.TenantCache(),
+                                      path=self.path))
+
+
+class TenantLookupRequestsTest(base.TestCase):
+    """The lookups made by the test base class, against the fake API."""
+
+    def setUp(self):
+        super(TenantLookupRequestsTest, self).setUp()
+        self.patchobject(cache, 'fqname_cache', cache.FqNameCache())
+        self.fake_api = self.useFixture(fixtures.FakeContrailAPIFixture())
+        self.client = self.fake_api.client(fq_client.FqnameIdClient)
+        self.uuid = self.fake_api.api.store.create('project', {
+            'fq_name': _FQ_NAME, 'parent_type': 'domain'})['uuid']
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.path = os.path.join(tmp_dir, 'tenants.json')
+
+    def _resolve(self):
+        return self.client.fqname_to_id(fq_name=_FQ_NAME, type='project',
+                                        use_cache=True)['uuid']
+
+    def _validate(self, uuid):
+        try:
+            body = self.client.id_to_fqname(uuid=uuid)
+        except exceptions.NotFound:
+            return False
+        return body.get('fq_name') == _FQ_NAME
+
+    def _lookup(self, tenants):
+        return tenants.lookup(self.client.base_url, 'admin', self._resolve,
+                              path=self.path, validate=self._validate)
+
+    def _requests(self):
+        return self.fake_api.api.requests
+
+    def test_second_lookup_makes_no_request(self):
+        tenants = tenant_cache.TenantCache()
+        self.assertEqual(self.uuid, self._lookup(tenants))
+        requests = self._requests()
+
+        self.assertEqual(self.uuid, self._lookup(tenants))
+        self.assertEqual(requests, self._requests())
+
+    def test_file_entry_checked_once(self):
+        self._lookup(tenant_cache.TenantCache())
+        tenants = tenant_cache.TenantCache()
+        requests = self._requests()
+
+        self.assertEqual(self.uuid, self._lookup(tenants))
+        self.assertEqual(requests + 1, self._requests())
+        self.assertEqual(self.uuid, self._lookup(tenants))
+        self.assertEqual(requests + 1, self._requests())